@@ -2,6 +2,9 @@
 ASGI config for KCLTicketingSystem project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Serve it with an ASGI server (e.g. ``uvicorn KCLTicketingSystem.asgi:application``)
+so the async ``notifications/stream/`` view holds open connections without a
+worker thread each.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
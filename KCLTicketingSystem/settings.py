@@ -168,6 +168,48 @@ else:
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# Cache (per-process by default; point at a shared backend in production so
+# invalidation reaches every worker).
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", "kcl-ticketing"),
+    }
+}
+
+# Admin dashboard payload is cached briefly and invalidated on Ticket/User writes.
+ADMIN_DASHBOARD_CACHE_TTL = int(os.getenv("ADMIN_DASHBOARD_CACHE_TTL", "30"))
+
+# Admin list totals: cached per filter set; ?count=estimate switches to the
+# planner estimate once the exact count would exceed the threshold.
+ADMIN_LIST_COUNT_CACHE_TTL = int(os.getenv("ADMIN_LIST_COUNT_CACHE_TTL", "60"))
+ADMIN_LIST_EXACT_COUNT_THRESHOLD = int(os.getenv("ADMIN_LIST_EXACT_COUNT_THRESHOLD", "10000"))
+
+# Admin notification recipients: cached id list, dropped on User role changes.
+ADMIN_RECIPIENTS_CACHE_TTL = int(os.getenv("ADMIN_RECIPIENTS_CACHE_TTL", "300"))
+
+# Notification outbox worker (manage.py dispatch_notifications): events per
+# batch, and dispatch attempts before an event is marked failed.
+NOTIFICATION_OUTBOX_BATCH_SIZE = int(os.getenv("NOTIFICATION_OUTBOX_BATCH_SIZE", "500"))
+NOTIFICATION_OUTBOX_MAX_ATTEMPTS = int(os.getenv("NOTIFICATION_OUTBOX_MAX_ATTEMPTS", "5"))
+
+# Live notification stream (SSE / long-poll, served under ASGI): seconds between
+# reads, between keepalives, before an SSE connection is recycled, and the
+# longest a long-poll waits. Each read opens a database connection and closes it
+# before the next wait, so N open clients need about N * read time / POLL_INTERVAL
+# connections at once (plus one connect per client per poll; put a pooler such as
+# PgBouncer in front of Postgres if that connect rate matters).
+NOTIFICATION_STREAM_POLL_INTERVAL = float(os.getenv("NOTIFICATION_STREAM_POLL_INTERVAL", "2"))
+NOTIFICATION_STREAM_HEARTBEAT = float(os.getenv("NOTIFICATION_STREAM_HEARTBEAT", "15"))
+NOTIFICATION_STREAM_MAX_SECONDS = float(os.getenv("NOTIFICATION_STREAM_MAX_SECONDS", "300"))
+NOTIFICATION_LONG_POLL_TIMEOUT = float(os.getenv("NOTIFICATION_LONG_POLL_TIMEOUT", "25"))
+
+# Stale awaiting_response sweep (see ``manage.py sweep_stale_tickets``).
+# Set STALE_TICKET_SWEEPER_BACKGROUND=1 to also run it in a daemon thread per process.
+STALE_TICKET_SWEEPER_BACKGROUND = os.getenv("STALE_TICKET_SWEEPER_BACKGROUND", "") == "1"
+STALE_TICKET_SWEEP_INTERVAL = int(os.getenv("STALE_TICKET_SWEEP_INTERVAL", "300"))
+STALE_TICKET_SWEEP_LOCK_TIMEOUT = 600
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -250,6 +292,11 @@ if "test" in sys.argv:
                 "level": "CRITICAL",
                 "propagate": False,
             },
+            "KCLTicketingSystems.services": {
+                "handlers": ["console"],
+                "level": "WARNING",
+                "propagate": False,
+            },
             "AIChatbot.views": {
                 "handlers": ["console"],
                 "level": "CRITICAL",
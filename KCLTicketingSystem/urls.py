@@ -27,7 +27,9 @@ from AIChatbot.views import chat_page
 
 from KCLTicketingSystems.views import admin_views, staff_dashboard_view, ticket_info_view, reply_view, staff_meeting_requests_views, notification_view
 
-from KCLTicketingSystems.views import notifications_list, mark_notification_read
+from KCLTicketingSystems.views import (
+    notifications_list, mark_notification_read, notification_stream, unread_notification_count,
+)
 
 
 urlpatterns = [
@@ -60,8 +62,13 @@ urlpatterns = [
     
     # Admin Statistics and Analytics
     path('api/admin/statistics/', admin_views.get_ticket_statistics, name='admin_statistics'),
+    path('api/admin/statistics/series/', admin_views.ticket_inflow_series, name='admin_ticket_series'),
     path('api/admin/export/statistics-csv/', admin_views.export_statistics_csv, name='export_statistics_csv'),
     path('api/admin/export/tickets-csv/', admin_views.export_tickets_csv, name='export_tickets_csv'),
+    path('api/admin/export/tickets-ndjson/', admin_views.export_tickets_ndjson, name='export_tickets_ndjson'),
+    path('api/admin/exports/', admin_views.export_job_submit, name='export_job_submit'),
+    path('api/admin/exports/<int:job_id>/', admin_views.export_job_detail, name='export_job_detail'),
+    path('api/admin/exports/<int:job_id>/download/', admin_views.export_job_download, name='export_job_download'),
 
     # Staff Dashboard
     path('api/staff/dashboard/', staff_dashboard_view.staff_dashboard, name='staff_dashboard'),
@@ -91,6 +98,8 @@ urlpatterns = [
 
     path("notifications/", notifications_list, name="notifications_list"),
     path("notifications/<int:pk>/read/", mark_notification_read, name="mark_notification_read"),
+    path("notifications/unread-count/", unread_notification_count, name="unread_notification_count"),
+    path("notifications/stream/", notification_stream, name="notification_stream"),
 
     # SPA: serve React app for all non-API/static/media routes (login, dashboard, etc.)
     re_path(r'^(?!(static/|api/|media/))(?P<path>.*)$', views.spa_catchall, name='spa_catchall')
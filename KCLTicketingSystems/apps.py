@@ -1,5 +1,6 @@
 """Django app config for the KCL ticketing domain package."""
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class KclticketingsystemsConfig(AppConfig):
@@ -7,3 +8,10 @@ class KclticketingsystemsConfig(AppConfig):
 
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'KCLTicketingSystems'
+
+    def ready(self):
+        from .signals import connect_signals
+        connect_signals()
+        if getattr(settings, "STALE_TICKET_SWEEPER_BACKGROUND", False):
+            from .services.stale_ticket_sweeper import start_background_sweeper
+            start_background_sweeper()
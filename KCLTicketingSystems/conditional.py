@@ -0,0 +1,79 @@
+"""
+Conditional GET (``ETag`` / ``Last-Modified``) for read endpoints.
+
+A view declares a *watermark*: a few cheap aggregates over the rows its body
+is built from (counts, ``Max(id)``, ``Max(updated_at)``). The validator is a
+hash of that watermark plus what else the body depends on (URL, caller,
+``Accept``), so a matching ``If-None-Match`` / ``If-Modified-Since`` is
+answered with 304 before anything is serialised.
+"""
+import hashlib
+import json
+from calendar import timegm
+from functools import wraps
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+
+def _etag(request, parts):
+    key = [request.build_absolute_uri(), request.META.get("HTTP_ACCEPT", ""), request.user.pk, *parts]
+    return quote_etag(hashlib.md5(json.dumps(key, default=str).encode()).hexdigest())
+
+
+def _evaluate(request, mark):
+    """
+    Validators for ``mark`` and the 304 (or 412) they already decide, if any.
+
+    Returns ``(etag, timestamp, response)``; ``response`` is None when the
+    view has to run.
+    """
+    parts, last_modified = mark
+    etag = _etag(request, parts)
+    timestamp = timegm(last_modified.utctimetuple()) if last_modified else None
+    return etag, timestamp, get_conditional_response(request, etag=etag, last_modified=timestamp)
+
+
+def _add_validators(response, etag, timestamp):
+    response.headers["ETag"] = etag
+    if timestamp is not None:
+        response.headers["Last-Modified"] = http_date(timestamp)
+    # Clients may keep the body but must revalidate before reusing it.
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def conditional_get(watermark):
+    """
+    Decorate a view so GET/HEAD carry validators and honour conditional requests.
+
+    ``watermark(request, *args, **kwargs)`` receives the view's arguments and
+    returns ``(parts, last_modified)``: ``parts`` is a JSON-serialisable list
+    that changes whenever the response body would, and ``last_modified`` is a
+    datetime, or None when some change (e.g. a deletion) would not advance it.
+    Returning None skips conditional handling, so the view runs as usual; use
+    that when the caller would be refused or the object does not exist.
+
+    Apply below ``@api_view`` (or via ``method_decorator`` on a DRF view's
+    ``get``) so authentication and permission checks run first.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapped(request, *args, **kwargs):
+            if request.method not in ("GET", "HEAD"):
+                return view(request, *args, **kwargs)
+            mark = watermark(request, *args, **kwargs)
+            if mark is None:
+                return view(request, *args, **kwargs)
+
+            etag, timestamp, response = _evaluate(request, mark)
+            if response is None:
+                response = view(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+            return _add_validators(response, etag, timestamp)
+
+        return wrapped
+
+    return decorator
@@ -0,0 +1,44 @@
+"""Populate Ticket.last_reply_at / last_reply_by_staff from existing replies."""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import BooleanField, Case, Max, Min, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce
+
+from ...models import Reply, Ticket
+
+
+def _latest_reply_subquery():
+    return Reply.objects.filter(ticket=OuterRef("pk")).order_by("-created_at", "-id")
+
+
+def _staff_author_expression():
+    staff_author = Q(user__is_superuser=True) | Q(user__role__iexact="staff") | Q(user__role__iexact="admin")
+    return Case(When(staff_author, then=Value(True)), default=Value(False), output_field=BooleanField())
+
+
+class Command(BaseCommand):
+    """Recompute the denormalised last-reply columns in primary-key batches."""
+
+    help = 'Backfill Ticket.last_reply_at and Ticket.last_reply_by_staff from the Reply table.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        bounds = Ticket.objects.aggregate(low=Min('pk'), high=Max('pk'))
+        updated = 0
+        if bounds['low'] is not None:
+            for start in range(bounds['low'], bounds['high'] + 1, batch_size):
+                updated += self._backfill_batch(start, start + batch_size)
+        self.stdout.write(self.style.SUCCESS(f'Backfilled last-reply metadata for {updated} tickets.'))
+
+    def _backfill_batch(self, start, stop):
+        latest = _latest_reply_subquery()
+        by_staff = latest.annotate(by_staff=_staff_author_expression()).values("by_staff")[:1]
+        with transaction.atomic():
+            return Ticket.objects.filter(pk__gte=start, pk__lt=stop).update(
+                last_reply_at=Subquery(latest.values("created_at")[:1]),
+                last_reply_by_staff=Coalesce(Subquery(by_staff), Value(False)),
+            )
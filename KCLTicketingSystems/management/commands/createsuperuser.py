@@ -35,9 +35,11 @@ class Command(createsuperuser.Command):
     def _update_all_superusers(self):
         """Update all superusers without admin role."""
         from KCLTicketingSystems.models.user import User
+        from KCLTicketingSystems.services.admin_recipients import invalidate_admin_ids
         superusers = User.objects.filter(is_superuser=True).exclude(role=User.Role.ADMIN)
         if superusers.exists():
             count = superusers.update(role=User.Role.ADMIN)
+            invalidate_admin_ids()
             self.stdout.write(
                 self.style.SUCCESS(f'Updated {count} superuser(s) to have admin role')
             )
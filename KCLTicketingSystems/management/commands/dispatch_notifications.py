@@ -0,0 +1,46 @@
+"""Worker that drains the notification outbox into Notification rows."""
+
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from ...services import notification_outbox
+
+
+class Command(BaseCommand):
+    """Dispatch due outbox events once, or keep polling with ``--loop``."""
+
+    help = 'Expand queued notification events into Notification rows, in batches, and report outbox lag.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help='Keep polling the outbox every --interval seconds.')
+        parser.add_argument('--interval', type=int, default=2)
+        parser.add_argument('--batch-size', type=int, default=None, help='Events per batch (default: settings).')
+        parser.add_argument('--keep-days', type=int, default=7, help='Delete dispatched events older than this.')
+
+    def handle(self, *args, **options):
+        while True:
+            for result in notification_outbox.dispatch_pending(options['batch_size']):
+                self._report(result)
+            notification_outbox.purge_dispatched(timedelta(days=options['keep_days']))
+            if not options['loop']:
+                self._report_backlog()
+                return
+            time.sleep(options['interval'])
+
+    def _report(self, result):
+        self.stdout.write(self.style.SUCCESS(
+            f'Dispatched {result.events} events ({result.notifications} notifications), '
+            f'lag {result.lag_seconds:.1f}s.'
+        ))
+        if result.retried or result.failed:
+            self.stdout.write(self.style.ERROR(
+                f'{result.retried} events will be retried, {result.failed} failed permanently.'
+            ))
+
+    def _report_backlog(self):
+        stats = notification_outbox.outbox_stats()
+        self.stdout.write(
+            f'Outbox: {stats.pending} pending (oldest {stats.oldest_pending_seconds:.1f}s), {stats.failed} failed.'
+        )
@@ -0,0 +1,21 @@
+"""Rebuild the ticket and conversation full-text search indexes from source tables."""
+
+from django.core.management.base import BaseCommand
+
+from ...services.conversation_search import rebuild_conversation_index
+from ...services.ticket_search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    """Re-index ticket search documents and conversation (reply/details) documents in id-ordered batches."""
+
+    help = 'Rebuild the full-text search indexes used by admin ticket search and conversation search.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Rows indexed per batch (default 500).')
+
+    def handle(self, *args, **options):
+        indexed = rebuild_search_index(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Indexed {indexed} ticket(s) for search.'))
+        documents = rebuild_conversation_index(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Indexed {documents} conversation document(s).'))
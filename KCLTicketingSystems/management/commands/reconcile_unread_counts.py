@@ -0,0 +1,17 @@
+"""Rebuild the UnreadNotificationCount table from notifications and report any drift."""
+
+from django.core.management.base import BaseCommand
+
+from ...services.unread_counts import rebuild_unread_counts
+
+
+class Command(BaseCommand):
+    """Recount unread notifications per user and overwrite stored counters."""
+
+    help = 'Rebuild per-user unread notification counters and report drift.'
+
+    def handle(self, *args, **options):
+        drift = rebuild_unread_counts()
+        for user_id, (stored, actual) in sorted(drift.items()):
+            self.stdout.write(self.style.WARNING(f'Drift user {user_id}: stored {stored}, actual {actual}'))
+        self.stdout.write(self.style.SUCCESS(f'Reconciled unread counts ({len(drift)} users drifted).'))
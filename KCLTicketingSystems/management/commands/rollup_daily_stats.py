@@ -0,0 +1,40 @@
+"""Roll tickets up into the per-day, per-department statistics table."""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from ...services.statistics_rollup import run_rollup
+
+
+class Command(BaseCommand):
+    """Recompute DailyDepartmentStats for days changed since the previous run, once or with ``--loop``."""
+
+    help = 'Roll up daily department statistics for days changed since the last run (or all days with --full).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true', help='Recompute every day, not just changed ones.')
+        parser.add_argument('--loop', action='store_true', help='Keep rolling up every --interval seconds.')
+        parser.add_argument('--interval', type=int, default=300)
+        parser.add_argument(
+            '--full-every', type=int, default=86400,
+            help='With --loop, also make a full run this often, starting with the first pass (picks up deletions).',
+        )
+
+    def handle(self, *args, **options):
+        last_full = None
+        while True:
+            full = options['full'] or (
+                options['loop'] and (last_full is None or time.monotonic() - last_full >= options['full_every'])
+            )
+            self._rollup_once(full)
+            if full:
+                last_full = time.monotonic()
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
+
+    def _rollup_once(self, full):
+        run = run_rollup(full=full)
+        kind = 'full' if full else 'incremental'
+        self.stdout.write(self.style.SUCCESS(f'Rolled up {run.days_rolled} day(s) of department statistics ({kind}).'))
@@ -0,0 +1,31 @@
+"""Worker that runs queued CSV export jobs and stores their artifacts."""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from ...services import export_jobs
+
+
+class Command(BaseCommand):
+    """Drain pending export jobs once, or keep polling with ``--loop``."""
+
+    help = 'Run pending export jobs, writing each artifact to MEDIA_ROOT/exports/.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--loop', action='store_true', help='Keep polling for jobs every --interval seconds.')
+        parser.add_argument('--interval', type=int, default=5)
+
+    def handle(self, *args, **options):
+        while True:
+            for job in export_jobs.process_pending_jobs():
+                self._report(job)
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
+
+    def _report(self, job):
+        if job.status == job.Status.DONE:
+            self.stdout.write(self.style.SUCCESS(f'Export job {job.id} done ({job.size_bytes} bytes).'))
+        else:
+            self.stdout.write(self.style.ERROR(f'Export job {job.id} failed: {job.error}'))
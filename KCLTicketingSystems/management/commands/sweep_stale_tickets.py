@@ -0,0 +1,34 @@
+"""Auto-close tickets left awaiting a student response past the cutoff."""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from ...services import stale_ticket_sweeper
+
+
+class Command(BaseCommand):
+    """Run the stale ticket sweep once, or repeatedly with ``--loop``."""
+
+    help = 'Close awaiting_response tickets whose latest staff reply is older than --days.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=stale_ticket_sweeper.DEFAULT_STALE_DAYS)
+        parser.add_argument('--loop', action='store_true', help='Keep sweeping every --interval seconds.')
+        parser.add_argument('--interval', type=int, default=stale_ticket_sweeper.DEFAULT_INTERVAL_SECONDS)
+
+    def handle(self, *args, **options):
+        while True:
+            self._sweep_once(options['days'])
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
+
+    def _sweep_once(self, days):
+        result = stale_ticket_sweeper.run_sweep(days=days)
+        if result is None:
+            self.stdout.write(self.style.WARNING('Sweep skipped: another worker holds the lock.'))
+            return
+        self.stdout.write(self.style.SUCCESS(
+            f"Closed {result['closed']} stale tickets in {result['duration_ms']}ms."
+        ))
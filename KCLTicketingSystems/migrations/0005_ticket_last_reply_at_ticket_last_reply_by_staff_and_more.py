@@ -0,0 +1,27 @@
+# Generated by Django 5.2.10 on 2026-10-17 18:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('KCLTicketingSystems', '0004_alter_ticket_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='last_reply_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='last_reply_by_staff',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['status', 'last_reply_by_staff', 'last_reply_at'], name='KCLTicketin_status_7f2180_idx'),
+        ),
+    ]
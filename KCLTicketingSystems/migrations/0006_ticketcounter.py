@@ -0,0 +1,39 @@
+# Generated by Django 5.2.10 on 2026-10-17 18:35
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_ticket_counters(apps, schema_editor):
+    Ticket = apps.get_model('KCLTicketingSystems', 'Ticket')
+    TicketCounter = apps.get_model('KCLTicketingSystems', 'TicketCounter')
+    rows = Ticket.objects.values('department', 'status', 'priority').annotate(n=Count('id')).order_by()
+    TicketCounter.objects.bulk_create(
+        TicketCounter(department=r['department'] or '', status=r['status'], priority=r['priority'], count=r['n'])
+        for r in rows
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('KCLTicketingSystems', '0005_ticket_last_reply_at_ticket_last_reply_by_staff_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('department', models.CharField(max_length=255)),
+                ('status', models.CharField(max_length=20)),
+                ('priority', models.CharField(max_length=20)),
+                ('count', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'KCLTicketingSystems_ticket_counter',
+                'constraints': [models.UniqueConstraint(fields=('department', 'status', 'priority'), name='unique_ticket_counter_key')],
+            },
+        ),
+        migrations.RunPython(populate_ticket_counters, migrations.RunPython.noop),
+    ]
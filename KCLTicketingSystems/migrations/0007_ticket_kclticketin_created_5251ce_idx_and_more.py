@@ -0,0 +1,22 @@
+# Generated by Django 5.2.10 on 2026-10-17 18:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('KCLTicketingSystems', '0006_ticketcounter'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['created_at', 'id'], name='KCLTicketin_created_5251ce_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['date_joined', 'id'], name='KCLTicketin_date_jo_3721db_idx'),
+        ),
+    ]
@@ -0,0 +1,100 @@
+import html
+import re
+
+import bleach
+from django.db import migrations
+
+# Frozen copies of the names and document layout in services/ticket_search.py
+# as of this migration; later changes to that module must not alter history.
+FTS_TABLE = 'KCLTicketingSystems_ticket_search'
+TICKET_TABLE = 'KCLTicketingSystems_ticket'
+SEARCH_VECTOR_COLUMN = 'search_vector'
+SEARCH_GIN_INDEX = 'kcl_ticket_search_vector_gin'
+COLUMNS = (('ticket_ref', 'D'), ('submitter', 'A'), ('department', 'B'), ('type_of_issue', 'B'), ('details', 'C'))
+
+TOKEN = re.compile(r'[^\W_]+')
+BLOCK_BOUNDARY = re.compile(r'<\s*/?\s*(?:br|p|div|li|ol|ul)\b[^>]*>', re.IGNORECASE)
+
+
+def _normalised(text):
+    return ' '.join(TOKEN.findall((text or '').lower()))
+
+
+def _plain_text(details):
+    if not details:
+        return ''
+    return html.unescape(bleach.clean(BLOCK_BOUNDARY.sub(' ', details), tags=[], attributes={}, strip=True))
+
+
+def _document(ticket):
+    user = ticket.user
+    if user is not None:
+        submitter = (user.first_name, user.last_name, user.k_number, user.email)
+    else:
+        submitter = (ticket.name, ticket.surname, ticket.k_number, ticket.k_email)
+    return (
+        str(ticket.pk),
+        _normalised(' '.join(part or '' for part in submitter)),
+        _normalised(ticket.department),
+        _normalised(ticket.type_of_issue),
+        _normalised(_plain_text(ticket.additional_details)),
+    )
+
+
+def _insert_sql(vendor):
+    if vendor == 'sqlite':
+        columns = ', '.join(name for name, _ in COLUMNS)
+        return f'INSERT INTO "{FTS_TABLE}" (rowid, {columns}) VALUES (%s, {", ".join(["%s"] * len(COLUMNS))})'
+    vector = ' || '.join(f"setweight(to_tsvector('simple', %s), '{weight}')" for _, weight in COLUMNS)
+    return f'UPDATE "{TICKET_TABLE}" SET {SEARCH_VECTOR_COLUMN} = {vector} WHERE id = %s'
+
+
+def _create_structures(schema_editor, vendor):
+    if vendor == 'sqlite':
+        columns = ', '.join(name for name, _ in COLUMNS)
+        schema_editor.execute(
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS "{FTS_TABLE}" USING fts5({columns}, tokenize=\'unicode61\')'
+        )
+    else:
+        schema_editor.execute(f'ALTER TABLE "{TICKET_TABLE}" ADD COLUMN IF NOT EXISTS {SEARCH_VECTOR_COLUMN} tsvector')
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {SEARCH_GIN_INDEX} ON "{TICKET_TABLE}" USING GIN ({SEARCH_VECTOR_COLUMN})'
+        )
+
+
+def _params(vendor, doc):
+    return (int(doc[0]), *doc) if vendor == 'sqlite' else (*doc, int(doc[0]))
+
+
+def create_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor not in ('sqlite', 'postgresql'):
+        return
+    _create_structures(schema_editor, vendor)
+    Ticket = apps.get_model('KCLTicketingSystems', 'Ticket')
+    tickets = Ticket.objects.select_related('user').order_by('id')
+    last_id = 0
+    with schema_editor.connection.cursor() as cursor:
+        while batch := list(tickets.filter(id__gt=last_id)[:500]):
+            cursor.executemany(_insert_sql(vendor), [_params(vendor, _document(ticket)) for ticket in batch])
+            last_id = batch[-1].id
+
+
+def drop_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute(f'DROP TABLE IF EXISTS "{FTS_TABLE}"')
+    elif vendor == 'postgresql':
+        schema_editor.execute(f'DROP INDEX IF EXISTS {SEARCH_GIN_INDEX}')
+        schema_editor.execute(f'ALTER TABLE "{TICKET_TABLE}" DROP COLUMN IF EXISTS {SEARCH_VECTOR_COLUMN}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('KCLTicketingSystems', '0007_ticket_kclticketin_created_5251ce_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
@@ -0,0 +1,78 @@
+import html
+import re
+
+import bleach
+from django.db import migrations
+
+# Frozen copies of the names and document layout in services/conversation_search.py
+# as of this migration; later changes to that module must not alter history.
+FTS_TABLE = 'KCLTicketingSystems_conversation_search'
+TICKET_TABLE = 'KCLTicketingSystems_ticket'
+REPLY_TABLE = 'KCLTicketingSystems_reply'
+REPLY_GIN_INDEX = 'kcl_reply_body_fts_gin'
+DETAILS_GIN_INDEX = 'kcl_ticket_details_fts_gin'
+
+BLOCK_BOUNDARY = re.compile(r'<\s*/?\s*(?:br|p|div|li|ol|ul)\b[^>]*>', re.IGNORECASE)
+INSERT_SQL = f'INSERT INTO "{FTS_TABLE}" (rowid, body, ticket_id, reply_id) VALUES (%s, %s, %s, %s)'
+
+
+def _plain_text(details):
+    if not details:
+        return ''
+    return html.unescape(bleach.clean(BLOCK_BOUNDARY.sub(' ', details), tags=[], attributes={}, strip=True))
+
+
+def _index_in_batches(cursor, queryset, document):
+    """Write ``document(row)`` for every row of ``queryset``, 500 rows at a time."""
+    last_id = 0
+    while batch := list(queryset.filter(id__gt=last_id).order_by('id')[:500]):
+        cursor.executemany(INSERT_SQL, [document(row) for row in batch])
+        last_id = batch[-1].id
+
+
+def create_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        # Expression indexes over the source columns: nothing to backfill.
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {REPLY_GIN_INDEX} ON "{REPLY_TABLE}" '
+            "USING GIN (to_tsvector('simple', body))"
+        )
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {DETAILS_GIN_INDEX} ON "{TICKET_TABLE}" '
+            "USING GIN (to_tsvector('simple', additional_details))"
+        )
+    if vendor != 'sqlite':
+        return
+    schema_editor.execute(
+        f'CREATE VIRTUAL TABLE IF NOT EXISTS "{FTS_TABLE}" '
+        "USING fts5(body, ticket_id UNINDEXED, reply_id UNINDEXED, tokenize='unicode61')"
+    )
+    Ticket = apps.get_model('KCLTicketingSystems', 'Ticket')
+    Reply = apps.get_model('KCLTicketingSystems', 'Reply')
+    with schema_editor.connection.cursor() as cursor:
+        _index_in_batches(
+            cursor, Ticket.objects.all(),
+            lambda ticket: (-ticket.pk, _plain_text(ticket.additional_details), ticket.pk, None),
+        )
+        _index_in_batches(cursor, Reply.objects.all(), lambda reply: (reply.pk, reply.body or '', reply.ticket_id, reply.pk))
+
+
+def drop_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute(f'DROP TABLE IF EXISTS "{FTS_TABLE}"')
+    elif vendor == 'postgresql':
+        schema_editor.execute(f'DROP INDEX IF EXISTS {REPLY_GIN_INDEX}')
+        schema_editor.execute(f'DROP INDEX IF EXISTS {DETAILS_GIN_INDEX}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('KCLTicketingSystems', '0008_ticket_search_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
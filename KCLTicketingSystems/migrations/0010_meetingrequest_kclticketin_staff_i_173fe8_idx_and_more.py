@@ -0,0 +1,37 @@
+# Generated by Django 5.2.10 on 2026-10-17 18:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('KCLTicketingSystems', '0009_conversation_search_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='meetingrequest',
+            index=models.Index(fields=['staff', 'status', 'meeting_datetime'], name='KCLTicketin_staff_i_173fe8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', 'is_read', 'created_at'], name='KCLTicketin_user_id_0f0055_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='officehours',
+            index=models.Index(fields=['staff', 'day_of_week'], name='KCLTicketin_staff_i_e98adc_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['assigned_to', 'status', 'created_at'], name='KCLTicketin_assigne_f5909a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['status', 'created_at'], name='KCLTicketin_status_ee3a9b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['department', 'created_at'], name='KCLTicketin_departm_92467a_idx'),
+        ),
+    ]
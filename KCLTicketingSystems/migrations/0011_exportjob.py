@@ -0,0 +1,38 @@
+# Generated by Django 5.2.10 on 2026-10-17 18:48
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('KCLTicketingSystems', '0010_meetingrequest_kclticketin_staff_i_173fe8_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExportJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('export_type', models.CharField(choices=[('tickets_csv', 'Tickets CSV'), ('statistics_csv', 'Statistics CSV')], max_length=20)),
+                ('start_date', models.DateTimeField()),
+                ('end_date', models.DateTimeField()),
+                ('watermark', models.CharField(max_length=64)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('file', models.FileField(blank=True, upload_to='exports/')),
+                ('size_bytes', models.PositiveBigIntegerField(blank=True, null=True)),
+                ('error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('requested_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='export_jobs', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'KCLTicketingSystems_export_job',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['export_type', 'start_date', 'end_date', 'watermark'], name='KCLTicketin_export__af2fc8_idx'), models.Index(fields=['status', 'created_at'], name='KCLTicketin_status_fdc2e6_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.10 on 2026-10-17 18:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('KCLTicketingSystems', '0011_exportjob'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reply',
+            index=models.Index(fields=['created_at', 'id'], name='KCLTicketin_created_d0b622_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['updated_at', 'id'], name='KCLTicketin_updated_ff8e02_idx'),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.10 on 2026-10-17 18:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('KCLTicketingSystems', '0012_incremental_export_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyStatsRollupRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('started_at', models.DateTimeField()),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('days_rolled', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'KCLTicketingSystems_daily_stats_rollup_run',
+                'ordering': ('-started_at',),
+            },
+        ),
+        migrations.CreateModel(
+            name='DailyDepartmentStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('department', models.CharField(max_length=255)),
+                ('total_tickets', models.IntegerField(default=0)),
+                ('pending', models.IntegerField(default=0)),
+                ('in_progress', models.IntegerField(default=0)),
+                ('resolved', models.IntegerField(default=0)),
+                ('closed', models.IntegerField(default=0)),
+                ('low', models.IntegerField(default=0)),
+                ('medium', models.IntegerField(default=0)),
+                ('high', models.IntegerField(default=0)),
+                ('urgent', models.IntegerField(default=0)),
+                ('resolution_seconds', models.FloatField(default=0)),
+                ('first_response_seconds', models.FloatField(default=0)),
+                ('first_response_count', models.IntegerField(default=0)),
+                ('rolled_up_at', models.DateTimeField()),
+            ],
+            options={
+                'db_table': 'KCLTicketingSystems_daily_department_stats',
+                'constraints': [models.UniqueConstraint(fields=('day', 'department'), name='unique_daily_department_stats')],
+            },
+        ),
+    ]
@@ -0,0 +1,72 @@
+# Generated by Django 5.2.10 on 2026-10-17 18:56
+
+import math
+from collections import defaultdict
+
+from django.db import migrations, models
+from django.db.models import Min
+from django.utils import timezone
+
+# Frozen copy of services/latency_sketch.py bucketing as of this migration.
+GAMMA = 1.05
+
+
+def _add(sketch, seconds):
+    key = str(int(math.log1p(max(seconds, 0.0)) / math.log(GAMMA)))
+    sketch[key] = sketch.get(key, 0) + 1
+
+
+def _durations(Ticket, Reply):
+    """Yield ``(sketch field, (day, department), seconds)`` for every ticket with a resolution or first response."""
+    closed = Ticket.objects.filter(status='closed', updated_at__isnull=False)
+    for department, created_at, updated_at in closed.values_list('department', 'created_at', 'updated_at').iterator():
+        yield 'resolution_sketch', (timezone.localdate(created_at), department), (updated_at - created_at).total_seconds()
+    first_replies = (
+        Reply.objects.filter(user__role__in=['staff', 'admin']).exclude(ticket__department='')
+        .values('ticket_id', 'ticket__department', 'ticket__created_at').annotate(first=Min('created_at')).order_by()
+    )
+    for row in first_replies.iterator():
+        created_at = row['ticket__created_at']
+        if row['first'] >= created_at:
+            key = (timezone.localdate(created_at), row['ticket__department'])
+            yield 'first_response_sketch', key, (row['first'] - created_at).total_seconds()
+
+
+def backfill_sketches(apps, schema_editor):
+    """Fill the new sketches of existing rollup rows from their days' tickets."""
+    DailyDepartmentStats = apps.get_model('KCLTicketingSystems', 'DailyDepartmentStats')
+    rows = {(row.day, row.department): row for row in DailyDepartmentStats.objects.all()}
+    if not rows:
+        return
+    sketches = defaultdict(lambda: {'resolution_sketch': {}, 'first_response_sketch': {}})
+    for field, key, seconds in _durations(apps.get_model('KCLTicketingSystems', 'Ticket'),
+                                          apps.get_model('KCLTicketingSystems', 'Reply')):
+        if key in rows:
+            _add(sketches[key][field], seconds)
+    for key, fields in sketches.items():
+        for field, sketch in fields.items():
+            setattr(rows[key], field, sketch)
+    DailyDepartmentStats.objects.bulk_update(
+        [rows[key] for key in sketches], ['resolution_sketch', 'first_response_sketch'], batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('KCLTicketingSystems', '0013_daily_department_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dailydepartmentstats',
+            name='first_response_sketch',
+            field=models.JSONField(default=dict),
+        ),
+        migrations.AddField(
+            model_name='dailydepartmentstats',
+            name='resolution_sketch',
+            field=models.JSONField(default=dict),
+        ),
+        migrations.RunPython(backfill_sketches, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.10 on 2026-10-17 19:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('KCLTicketingSystems', '0014_daily_stats_latency_sketches'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reply',
+            index=models.Index(fields=['ticket', 'created_at', 'id'], name='KCLTicketin_ticket__586b48_idx'),
+        ),
+    ]
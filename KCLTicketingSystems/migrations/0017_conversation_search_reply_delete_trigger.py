@@ -0,0 +1,31 @@
+from django.db import migrations
+
+# Frozen names from services/conversation_search.py as of this migration.
+FTS_TABLE = 'KCLTicketingSystems_conversation_search'
+REPLY_TABLE = 'KCLTicketingSystems_reply'
+REPLY_DELETE_TRIGGER = 'kcl_conversation_search_reply_delete'
+
+
+def create_trigger(apps, schema_editor):
+    # The FTS table only exists on SQLite; Postgres indexes the reply column directly.
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute(
+            f'CREATE TRIGGER IF NOT EXISTS {REPLY_DELETE_TRIGGER} AFTER DELETE ON "{REPLY_TABLE}" '
+            f'BEGIN DELETE FROM "{FTS_TABLE}" WHERE rowid = old.id; END'
+        )
+
+
+def drop_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute(f'DROP TRIGGER IF EXISTS {REPLY_DELETE_TRIGGER}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('KCLTicketingSystems', '0016_user_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigger, drop_trigger),
+    ]
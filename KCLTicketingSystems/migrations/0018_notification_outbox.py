@@ -0,0 +1,39 @@
+# Generated by Django 5.2.10 on 2026-10-17 19:12
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('KCLTicketingSystems', '0017_conversation_search_reply_delete_trigger'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationOutboxEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=255)),
+                ('message', models.TextField()),
+                ('recipient_ids', models.JSONField(blank=True, default=list)),
+                ('include_admins', models.BooleanField(default=False)),
+                ('except_user_id', models.IntegerField(blank=True, null=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('available_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('dispatched_at', models.DateTimeField(blank=True, null=True)),
+                ('meeting_request', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='KCLTicketingSystems.meetingrequest')),
+                ('ticket', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='KCLTicketingSystems.ticket')),
+            ],
+            options={
+                'db_table': 'KCLTicketingSystems_notification_outbox',
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['status', 'available_at'], name='KCLTicketin_status_e63466_idx')],
+            },
+        ),
+    ]
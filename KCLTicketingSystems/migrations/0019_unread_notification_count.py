@@ -0,0 +1,36 @@
+# Generated by Django 5.2.10 on 2026-10-17 19:15
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_unread_counts(apps, schema_editor):
+    Notification = apps.get_model('KCLTicketingSystems', 'Notification')
+    UnreadNotificationCount = apps.get_model('KCLTicketingSystems', 'UnreadNotificationCount')
+    rows = Notification.objects.filter(is_read=False).values('user_id').annotate(n=Count('id')).order_by()
+    UnreadNotificationCount.objects.bulk_create(
+        UnreadNotificationCount(user_id=r['user_id'], unread=r['n']) for r in rows
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('KCLTicketingSystems', '0018_notification_outbox'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UnreadNotificationCount',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='unread_notification_count', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('unread', models.IntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'KCLTicketingSystems_unread_notification_count',
+            },
+        ),
+        migrations.RunPython(populate_unread_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.10 on 2026-10-17 19:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('KCLTicketingSystems', '0019_unread_notification_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', 'created_at'], name='KCLTicketin_user_id_9f5d73_idx'),
+        ),
+    ]
@@ -4,7 +4,13 @@ from .ticket import Ticket
 from .attachment import Attachment
 from .reply import Reply
 from .notification import Notification
+from .notification_outbox import NotificationOutboxEvent
 from .office_hours import OfficeHours
 from .meeting_request import MeetingRequest
+from .ticket_counter import TicketCounter
+from .unread_notification_count import UnreadNotificationCount
+from .export_job import ExportJob
+from .daily_department_stats import DailyDepartmentStats, DailyStatsRollupRun
 
-__all__ = ['User', 'Ticket', 'Attachment', 'Reply', 'OfficeHours', 'MeetingRequest', 'Notification']  # Expose models for admin and imports
+__all__ = ['User', 'Ticket', 'Attachment', 'Reply', 'OfficeHours', 'MeetingRequest', 'Notification', 'NotificationOutboxEvent', 'TicketCounter', 'UnreadNotificationCount', 'ExportJob',
+           'DailyDepartmentStats', 'DailyStatsRollupRun']  # Expose models for admin and imports
@@ -0,0 +1,64 @@
+"""Per-day, per-department ticket statistics rolled up from the ticket table."""
+
+from django.db import models
+
+
+class DailyDepartmentStats(models.Model):
+    """
+    Ticket counts and timing sums for tickets created on ``day`` in ``department``.
+
+    Written by ``manage.py rollup_daily_stats``; ``statistics_service`` sums these
+    rows for date-range reports instead of re-aggregating every ticket. Timings
+    are stored as sums (with their counts) so rows for any set of days can be
+    added together and averaged afterwards.
+    """
+
+    day = models.DateField()
+    department = models.CharField(max_length=255)
+    total_tickets = models.IntegerField(default=0)
+    pending = models.IntegerField(default=0)
+    in_progress = models.IntegerField(default=0)
+    resolved = models.IntegerField(default=0)
+    closed = models.IntegerField(default=0)
+    low = models.IntegerField(default=0)
+    medium = models.IntegerField(default=0)
+    high = models.IntegerField(default=0)
+    urgent = models.IntegerField(default=0)
+    # Closed tickets: sum of (updated_at - created_at); averaged over ``closed``.
+    resolution_seconds = models.FloatField(default=0)
+    first_response_seconds = models.FloatField(default=0)
+    first_response_count = models.IntegerField(default=0)
+    # ``services.latency_sketch`` bucket counts, merged across days for percentiles.
+    resolution_sketch = models.JSONField(default=dict)
+    first_response_sketch = models.JSONField(default=dict)
+    rolled_up_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'KCLTicketingSystems_daily_department_stats'
+        constraints = [
+            models.UniqueConstraint(fields=["day", "department"], name="unique_daily_department_stats"),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.department}: {self.total_tickets}"
+
+
+class DailyStatsRollupRun(models.Model):
+    """
+    One run of the daily statistics rollup.
+
+    ``started_at`` of the latest run is the watermark for the next one: only days
+    with tickets updated, or staff replies posted, since then are recomputed.
+    Days before that run's date are treated as covered by the rollup.
+    """
+
+    started_at = models.DateTimeField()
+    finished_at = models.DateTimeField(null=True, blank=True)
+    days_rolled = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'KCLTicketingSystems_daily_stats_rollup_run'
+        ordering = ("-started_at",)
+
+    def __str__(self):
+        return f"Rollup at {self.started_at} ({self.days_rolled} days)"
@@ -0,0 +1,55 @@
+"""Background CSV export jobs and their stored artifacts."""
+
+from django.conf import settings
+from django.db import models
+
+
+class ExportJob(models.Model):
+    """
+    One requested export, produced out of band by ``manage.py run_export_jobs``.
+
+    Jobs are deduplicated on (export_type, start_date, end_date, watermark):
+    the range is normalised to whole hours and ``watermark`` fingerprints the
+    tickets and replies in it, so a repeat request for unchanged data is served
+    from the stored ``file``.
+    """
+
+    class ExportType(models.TextChoices):
+        TICKETS_CSV = "tickets_csv", "Tickets CSV"
+        STATISTICS_CSV = "statistics_csv", "Statistics CSV"
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    export_type = models.CharField(max_length=20, choices=ExportType.choices)
+    start_date = models.DateTimeField()
+    end_date = models.DateTimeField()
+    watermark = models.CharField(max_length=64)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    file = models.FileField(upload_to="exports/", blank=True)
+    size_bytes = models.PositiveBigIntegerField(null=True, blank=True)
+    error = models.TextField(blank=True, default="")
+    requested_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="export_jobs",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'KCLTicketingSystems_export_job'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=["export_type", "start_date", "end_date", "watermark"]),
+            models.Index(fields=["status", "created_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.export_type} {self.start_date:%Y-%m-%d}..{self.end_date:%Y-%m-%d} ({self.status})"
@@ -42,6 +42,9 @@ class MeetingRequest(models.Model):
     class Meta:
         db_table = 'KCLTicketingSystems_meeting_request'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['staff', 'status', 'meeting_datetime']),
+        ]
     
     def __str__(self):
         return f"{self.student} -> {self.staff} on {self.meeting_datetime}"
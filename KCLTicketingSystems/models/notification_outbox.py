@@ -0,0 +1,44 @@
+"""Outbox of notification events awaiting fan-out into ``Notification`` rows."""
+
+from django.db import models
+from django.utils import timezone
+
+
+class NotificationOutboxEvent(models.Model):
+    """
+    One notification to deliver, written in the same transaction as the change
+    that caused it and drained by ``manage.py dispatch_notifications``.
+
+    Recipients are ``recipient_ids`` plus, when ``include_admins`` is set, every
+    admin at dispatch time except ``except_user_id``. A failed dispatch is
+    retried from ``available_at`` with backoff until ``attempts`` runs out.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    title = models.CharField(max_length=255)
+    message = models.TextField()
+    ticket = models.ForeignKey("Ticket", on_delete=models.CASCADE, null=True, blank=True)
+    meeting_request = models.ForeignKey("MeetingRequest", on_delete=models.CASCADE, null=True, blank=True)
+    recipient_ids = models.JSONField(default=list, blank=True)
+    include_admins = models.BooleanField(default=False)
+    except_user_id = models.IntegerField(null=True, blank=True)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    available_at = models.DateTimeField(default=timezone.now)
+    dispatched_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'KCLTicketingSystems_notification_outbox'
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=["status", "available_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.title} ({self.status})"
@@ -39,6 +39,9 @@ class OfficeHours(models.Model):
         db_table = 'KCLTicketingSystems_office_hours'
         verbose_name_plural = "Office Hours"
         ordering = ['day_of_week', 'start_time']
+        indexes = [
+            models.Index(fields=['staff', 'day_of_week']),
+        ]
     
     def __str__(self):
         return f"{self.staff} - {self.day_of_week} {self.start_time}-{self.end_time}"
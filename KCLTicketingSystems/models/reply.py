@@ -1,7 +1,7 @@
 """Threaded reply model: one ticket, optional parent for nesting."""
 from django.db import models
 from .ticket import Ticket
-from .user import User
+from .user import User, _is_staff_or_admin
 
 
 class Reply(models.Model):
@@ -23,7 +23,26 @@ class Reply(models.Model):
         ordering = ('created_at',)
         indexes = [
             models.Index(fields=["ticket", "parent"]),
+            models.Index(fields=["created_at", "id"]),
+            models.Index(fields=["ticket", "created_at", "id"]),
         ]
 
     def __str__(self):
-        return f"{self.body} (posted at {self.created_at})"
\ No newline at end of file
+        return f"{self.body} (posted at {self.created_at})"
+
+    def save(self, *args, **kwargs):
+        is_new = self._state.adding
+        super().save(*args, **kwargs)
+        if is_new:
+            self._touch_ticket_last_reply()
+
+    def _touch_ticket_last_reply(self):
+        """Record this reply as the ticket's latest without touching ``updated_at``."""
+        by_staff = _is_staff_or_admin(self.user)
+        Ticket.objects.filter(pk=self.ticket_id).update(
+            last_reply_at=self.created_at,
+            last_reply_by_staff=by_staff,
+        )
+        if Reply.ticket.is_cached(self):
+            self.ticket.last_reply_at = self.created_at
+            self.ticket.last_reply_by_staff = by_staff
@@ -1,6 +1,6 @@
 """Support ticket model and lifecycle (status, priority, assignment)."""
 
-from django.db import models
+from django.db import models, transaction
 from django.conf import settings
 
 
@@ -78,5 +78,41 @@ class Ticket(models.Model):
         related_name="closed_tickets",
     )
 
+    # Denormalised from the latest Reply (kept current by Reply.save) so the
+    # stale awaiting_response sweep is a single indexed UPDATE.
+    last_reply_at = models.DateTimeField(null=True, blank=True)
+    last_reply_by_staff = models.BooleanField(default=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "last_reply_by_staff", "last_reply_at"]),
+            models.Index(fields=["created_at", "id"]),
+            # Hot list filters: staff dashboard, admin status/department filters.
+            models.Index(fields=["assigned_to", "status", "created_at"]),
+            models.Index(fields=["status", "created_at"]),
+            models.Index(fields=["department", "created_at"]),
+            # Incremental export watermark.
+            models.Index(fields=["updated_at", "id"]),
+        ]
+
     def __str__(self):
-        return f"{self.user} - {self.type_of_issue}"
\ No newline at end of file
+        return f"{self.user} - {self.type_of_issue}"
+
+    def save(self, *args, **kwargs):
+        """Save and move this ticket between ``TicketCounter`` keys in one transaction."""
+        # Import here to avoid circular import
+        from ..services.ticket_counters import apply_counter_delta, ticket_counter_key
+
+        with transaction.atomic():
+            old_key = self._stored_counter_key()
+            super().save(*args, **kwargs)
+            apply_counter_delta(old_key, ticket_counter_key(self))
+
+    def _stored_counter_key(self):
+        """Stored key, row-locked so concurrent saves of this ticket move the counters one at a time."""
+        if self._state.adding or self.pk is None:
+            return None
+        row = Ticket.objects.select_for_update().filter(pk=self.pk).values_list("department", "status", "priority").first()
+        if row is None:
+            return None
+        return (row[0] or "", row[1], row[2])
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""Running ticket counts per (department, status, priority) for cheap dashboards."""
+
+from django.db import models
+
+
+class TicketCounter(models.Model):
+    """
+    Denormalised count of tickets sharing one (department, status, priority) key.
+
+    Maintained by ``services.ticket_counters`` whenever tickets are created,
+    change key, or are deleted; ``manage.py reconcile_ticket_counters`` rebuilds
+    it from the ticket table and reports drift.
+    """
+
+    department = models.CharField(max_length=255)
+    status = models.CharField(max_length=20)
+    priority = models.CharField(max_length=20)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'KCLTicketingSystems_ticket_counter'
+        constraints = [
+            models.UniqueConstraint(fields=["department", "status", "priority"], name="unique_ticket_counter_key"),
+        ]
+
+    def __str__(self):
+        return f"{self.department}/{self.status}/{self.priority}: {self.count}"
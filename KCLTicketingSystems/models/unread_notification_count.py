@@ -0,0 +1,28 @@
+"""Per-user unread notification counter for the navbar badge."""
+
+from django.conf import settings
+from django.db import models
+
+
+class UnreadNotificationCount(models.Model):
+    """
+    Denormalised number of unread notifications for one user.
+
+    Maintained by ``services.unread_counts`` when notifications are inserted,
+    marked read, or deleted with their ticket or meeting request;
+    ``manage.py reconcile_unread_counts`` rebuilds it and reports drift.
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="unread_notification_count",
+    )
+    unread = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'KCLTicketingSystems_unread_notification_count'
+
+    def __str__(self):
+        return f"{self.user_id}: {self.unread} unread"
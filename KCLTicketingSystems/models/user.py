@@ -3,12 +3,20 @@ from django.contrib.auth.models import AbstractUser
 from django.db import models
 
 
+def _is_staff_or_admin(user):
+    """Return True if ``user`` is staff, admin, or superuser (for reply routing)."""
+    if not user:
+        return False
+    return getattr(user, "is_superuser", False) or (getattr(user, "role", "") or "").lower() in ("staff", "admin")
+
+
 class User(AbstractUser):
     """Auth user with KCL email, K-number, department, and student/staff/admin role."""
 
     email = models.EmailField(unique=True)
     k_number = models.CharField(max_length=20, blank=True, default='')
     department = models.CharField(max_length=255, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Role(models.TextChoices):
         STUDENT = "student", "Student"
@@ -23,6 +31,9 @@ class User(AbstractUser):
 
     class Meta:
         db_table = 'KCLTicketingSystems_user'
+        indexes = [
+            models.Index(fields=["date_joined", "id"]),
+        ]
 
     def __str__(self):
         return f"{self.first_name} {self.last_name} ({self.k_number})" if self.k_number else f"{self.first_name} {self.last_name}"
\ No newline at end of file
@@ -0,0 +1,126 @@
+"""
+Keyset (cursor) pagination for newest-first admin lists.
+
+Pages are addressed by an opaque token encoding the ``(timestamp, id)`` of the
+row at the page boundary, so every page is a bounded index range scan and page
+N+1 costs the same as page 1. Used as an opt-in alternative to OFFSET paging.
+"""
+import base64
+import json
+from datetime import datetime
+
+from django.db.models import Q
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor token cannot be decoded."""
+
+
+class InvalidPageParam(ValueError):
+    """Raised when ``page`` or ``page_size`` is not an integer."""
+
+
+def parse_page_number(raw):
+    """Parse ``page`` (1-based); values below 1 become 1."""
+    if raw in (None, ""):
+        return 1
+    try:
+        return max(1, int(raw))
+    except (TypeError, ValueError) as exc:
+        raise InvalidPageParam("page must be an integer") from exc
+
+
+def parse_page_size(raw, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE, name="page_size"):
+    """Parse a page size parameter (``name`` in errors), clamped to 1..``maximum``; ``default`` when absent."""
+    if raw in (None, ""):
+        return default
+    try:
+        return max(1, min(int(raw), maximum))
+    except (TypeError, ValueError) as exc:
+        raise InvalidPageParam(f"{name} must be an integer") from exc
+
+
+def encode_cursor(value, pk, direction):
+    """Build an opaque token for the row ``(value, pk)``; ``direction`` is ``next`` or ``prev``."""
+    raw = json.dumps({"v": value.isoformat(), "id": pk, "d": direction})
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(token):
+    """Return ``(value, pk, direction)`` from a token produced by ``encode_cursor``."""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(token.encode()).decode())
+        direction = data["d"]
+        if direction not in ("next", "prev"):
+            raise ValueError(direction)
+        return datetime.fromisoformat(data["v"]), int(data["id"]), direction
+    except (ValueError, KeyError, TypeError, UnicodeDecodeError) as exc:
+        raise InvalidCursor("Invalid cursor") from exc
+
+
+def _after(field, value, pk):
+    return Q(**{f"{field}__lt": value}) | Q(**{field: value, "id__lt": pk})
+
+
+def _before(field, value, pk):
+    return Q(**{f"{field}__gt": value}) | Q(**{field: value, "id__gt": pk})
+
+
+def _boundary_token(row, field, direction):
+    if isinstance(row, dict):  # rows from ``values()``
+        return encode_cursor(row[field], row["id"], direction)
+    return encode_cursor(getattr(row, field), row.pk, direction)
+
+
+def keyset_page(queryset, field, token, page_size):
+    """
+    Return ``(rows, next_token, prev_token)`` for a list ordered by ``-field, -id``.
+
+    ``token`` is None for the first page. Filters already applied to
+    ``queryset`` are preserved; any existing ordering is replaced.
+    ``page_size`` must be at least 1 (see ``parse_page_size``).
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    if not token:
+        return _forward_page(queryset, field, page_size, has_prev=False)
+    value, pk, direction = decode_cursor(token)
+    if direction == "next":
+        return _forward_page(queryset.filter(_after(field, value, pk)), field, page_size, has_prev=True)
+    return _backward_page(queryset.filter(_before(field, value, pk)), field, page_size)
+
+
+def _forward_page(queryset, field, page_size, has_prev):
+    rows = list(queryset.order_by(f"-{field}", "-id")[: page_size + 1])
+    has_next = len(rows) > page_size
+    rows = rows[:page_size]
+    next_token = _boundary_token(rows[-1], field, "next") if has_next and rows else None
+    prev_token = _boundary_token(rows[0], field, "prev") if has_prev and rows else None
+    return rows, next_token, prev_token
+
+
+def _backward_page(queryset, field, page_size):
+    rows = list(queryset.order_by(field, "id")[: page_size + 1])
+    has_prev = len(rows) > page_size
+    rows = list(reversed(rows[:page_size]))
+    next_token = _boundary_token(rows[-1], field, "next") if rows else None
+    prev_token = _boundary_token(rows[0], field, "prev") if has_prev else None
+    return rows, next_token, prev_token
+
+
+def encode_rank_cursor(rank, key):
+    """Token for the last row of a relevance-ordered page, ordered by ``(rank, key)`` ascending."""
+    raw = json.dumps({"r": rank, "k": key})
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_rank_cursor(token):
+    """Return ``(rank, key)`` from a token produced by ``encode_rank_cursor``."""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(token.encode()).decode())
+        return float(data["r"]), int(data["k"])
+    except (ValueError, KeyError, TypeError, UnicodeDecodeError) as exc:
+        raise InvalidCursor("Invalid cursor") from exc
@@ -3,6 +3,9 @@ HTML sanitization for ticket additional_details field.
 Only allows: bold, italic, lists (ordered/unordered), indentation.
 """
 
+import html
+import re
+
 import bleach
 
 
@@ -20,6 +23,9 @@ ALLOWED_ATTRIBUTES = {
     'p': ['data-indent'],
 }
 
+# Tags that separate words when rendered; replaced by a space before stripping.
+_BLOCK_BOUNDARY = re.compile(r'<\s*/?\s*(?:br|p|div|li|ol|ul)\b[^>]*>', re.IGNORECASE)
+
 
 def sanitize_additional_details(html_content):
     """
@@ -40,3 +46,20 @@ def sanitize_additional_details(html_content):
         attributes=ALLOWED_ATTRIBUTES,
         strip=True,  # Remove disallowed tags entirely instead of escaping
     )
+
+
+def additional_details_plain_text(html_content):
+    """
+    Strip all markup from sanitized additional_details, for search indexing.
+
+    Args:
+        html_content: Sanitized HTML string stored on the ticket
+
+    Returns:
+        Plain text with block tags turned into whitespace and entities unescaped
+    """
+    if not html_content:
+        return ""
+
+    text = bleach.clean(_BLOCK_BOUNDARY.sub(' ', html_content), tags=[], attributes={}, strip=True)
+    return html.unescape(text)
@@ -13,9 +13,11 @@ from .models.reply import Reply
 from .models.user import User
 from .models.office_hours import OfficeHours
 from .models.meeting_request import MeetingRequest
+from .models.export_job import ExportJob
 from .sanitizer import sanitize_additional_details
 from .services.ticket_assignment import create_ticket_with_department_assignment
 from .services.meeting_policy import validate_meeting_slot
+from .services.reply_tree import load_replies
 
 User = get_user_model()
 
@@ -122,7 +124,7 @@ class ReplyCreateSerializer(serializers.ModelSerializer):
 class TicketSerializer(serializers.ModelSerializer):
     """Serializer for Ticket model - Admin view"""
     user = UserSerializer(read_only=True)
-    replies = ReplySerializer(many=True, read_only=True)
+    replies = serializers.SerializerMethodField()
     assigned_to_details = UserSerializer(source='assigned_to', read_only=True)
     assigned_to = serializers.PrimaryKeyRelatedField(
         queryset=User.objects.all(),
@@ -136,6 +138,11 @@ class TicketSerializer(serializers.ModelSerializer):
         fields = '__all__'
         read_only_fields = ['created_at', 'updated_at']
 
+    def get_replies(self, obj):
+        """Every reply (each with its children), loaded in one query."""
+        replies = load_replies([obj.id]).get(obj.id, [])
+        return ReplySerializer(replies, many=True, context=self.context).data
+
     def get_closed_by_role(self, obj):
         """Lowercased role of the user who closed the ticket, if status is closed."""
         if obj.status == 'closed' and obj.closed_by_id and hasattr(obj, 'closed_by') and obj.closed_by:
@@ -307,6 +314,22 @@ class DashboardStatsSerializer(serializers.Serializer):
     recent_tickets = TicketListSerializer(many=True)
 
 
+class ExportJobSerializer(serializers.ModelSerializer):
+    """Status of a background export; ``download_url`` is set once the artifact exists."""
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ExportJob
+        fields = [
+            'id', 'export_type', 'status', 'start_date', 'end_date', 'size_bytes',
+            'error', 'created_at', 'started_at', 'finished_at', 'download_url',
+        ]
+
+    def get_download_url(self, obj):
+        if obj.status != ExportJob.Status.DONE:
+            return None
+        return f"/api/admin/exports/{obj.id}/download/"
+
 
 class StaffListSerializer(serializers.ModelSerializer):
     """Minimal staff profile fields for assignment dropdowns and directory lists."""
@@ -0,0 +1,26 @@
+"""Cached ids of admin users, the recipients of admin notification fan-out."""
+
+from django.conf import settings
+from django.core.cache import cache
+
+from ..models.user import User
+
+ADMIN_IDS_CACHE_KEY = "kcl:admin-user-ids"
+
+
+def _ttl():
+    return getattr(settings, "ADMIN_RECIPIENTS_CACHE_TTL", 300)
+
+
+def admin_ids():
+    """Ids of users with the admin role, from the cache or one query on a miss."""
+    return cache.get_or_set(
+        ADMIN_IDS_CACHE_KEY,
+        lambda: list(User.objects.filter(role=User.Role.ADMIN).values_list("id", flat=True)),
+        timeout=_ttl(),
+    )
+
+
+def invalidate_admin_ids():
+    """Drop the cached ids; call after changing roles outside ``User.save``."""
+    cache.delete(ADMIN_IDS_CACHE_KEY)
@@ -0,0 +1,195 @@
+"""
+Full-text search over ticket conversations (reply bodies and additional_details).
+
+On SQLite, documents live in one FTS5 table whose rowid is the reply id for
+replies and the negated ticket id for a ticket's additional_details, kept in
+step by model signals and, for reply deletes, a trigger from migration 0017 (so cascading a
+ticket's replies costs no query per reply). On Postgres, GIN expression indexes on
+``to_tsvector('simple', ...)`` over both columns need no sync. Results are
+ordered by ``(rank, doc_key)`` (lower rank is better) and paged by cursor.
+"""
+import html
+import re
+
+from django.db import connection
+
+from ..models import Reply, Ticket
+from ..pagination import decode_rank_cursor, encode_rank_cursor
+from ..sanitizer import additional_details_plain_text
+from .ticket_search import search_terms
+
+FTS_TABLE = "KCLTicketingSystems_conversation_search"
+
+# Snippet highlight markers: control characters that never occur in user text,
+# swapped for <mark> tags after the snippet has been HTML-escaped.
+_START, _STOP = "\x02", "\x03"
+_SNIPPET_TOKENS = 12
+_TAG = re.compile(r"<[^>]*>")
+
+
+def _backend():
+    return connection.vendor if connection.vendor in ("sqlite", "postgresql") else None
+
+
+# ----------------------------- writes -----------------------------
+
+def _replace_documents(rows):
+    """Upsert ``(doc_key, body, ticket_id, reply_id)`` rows into the SQLite FTS table."""
+    if _backend() != "sqlite" or not rows:
+        return
+    with connection.cursor() as cursor:
+        cursor.executemany(f'DELETE FROM "{FTS_TABLE}" WHERE rowid = %s', [(row[0],) for row in rows])
+        cursor.executemany(
+            f'INSERT INTO "{FTS_TABLE}" (rowid, body, ticket_id, reply_id) VALUES (%s, %s, %s, %s)',
+            rows,
+        )
+
+
+def _delete_document(doc_key):
+    if _backend() != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM "{FTS_TABLE}" WHERE rowid = %s', [doc_key])
+
+
+def index_replies(replies):
+    """Write the search documents for ``replies``."""
+    _replace_documents([(reply.pk, reply.body or "", reply.ticket_id, reply.pk) for reply in replies])
+
+
+def index_ticket_details(tickets):
+    """Write the additional_details documents for ``tickets``."""
+    _replace_documents([
+        (-ticket.pk, additional_details_plain_text(ticket.additional_details), ticket.pk, None)
+        for ticket in tickets
+    ])
+
+
+def remove_ticket_details(ticket_id):
+    _delete_document(-ticket_id)
+
+
+def rebuild_conversation_index(batch_size=500):
+    """Re-index every reply and ticket description on SQLite; returns the number of documents."""
+    if _backend() != "sqlite":
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM "{FTS_TABLE}"')
+    indexed = 0
+    for model, index in ((Ticket, index_ticket_details), (Reply, index_replies)):
+        last_id = 0
+        while batch := list(model.objects.filter(id__gt=last_id).order_by("id")[:batch_size]):
+            index(batch)
+            indexed += len(batch)
+            last_id = batch[-1].id
+    return indexed
+
+
+# ----------------------------- reads ------------------------------
+
+def _sqlite_documents(terms):
+    query = " AND ".join(f'"{term}"*' for term in terms)
+    sql = (
+        f'SELECT rowid AS doc_key, ticket_id, reply_id, bm25("{FTS_TABLE}") AS rank '
+        f'FROM "{FTS_TABLE}" WHERE "{FTS_TABLE}" MATCH %s'
+    )
+    return sql, [query]
+
+
+def _postgres_documents(terms):
+    query = " & ".join(f"{term}:*" for term in terms)
+    sql = (
+        "SELECT r.id AS doc_key, r.ticket_id, r.id AS reply_id, "
+        "-ts_rank(to_tsvector('simple', r.body), q) AS rank "
+        f"FROM \"{Reply._meta.db_table}\" r, to_tsquery('simple', %s) q "
+        "WHERE to_tsvector('simple', r.body) @@ q "
+        "UNION ALL "
+        "SELECT -t.id, t.id, NULL, -ts_rank(to_tsvector('simple', t.additional_details), q) "
+        f"FROM \"{Ticket._meta.db_table}\" t, to_tsquery('simple', %s) q "
+        "WHERE to_tsvector('simple', t.additional_details) @@ q"
+    )
+    return sql, [query, query]
+
+
+def _page_rows(documents, tickets, cursor, page_size):
+    """Fetch ``page_size + 1`` ``(doc_key, ticket_id, reply_id, rank)`` rows after ``cursor``."""
+    documents_sql, params = documents
+    tickets_sql, ticket_params = tickets.values("id").query.sql_with_params()
+    sql = f"SELECT doc_key, ticket_id, reply_id, rank FROM ({documents_sql}) docs WHERE ticket_id IN ({tickets_sql})"
+    params = [*params, *ticket_params]
+    if cursor:
+        rank, key = decode_rank_cursor(cursor)
+        sql += " AND (rank > %s OR (rank = %s AND doc_key > %s))"
+        params += [rank, rank, key]
+    sql += " ORDER BY rank, doc_key LIMIT %s"
+    with connection.cursor() as db_cursor:
+        db_cursor.execute(sql, [*params, page_size + 1])
+        return db_cursor.fetchall()
+
+
+def _sqlite_snippets(terms, doc_keys):
+    placeholders = ", ".join(["%s"] * len(doc_keys))
+    sql = (
+        f"SELECT rowid, snippet(\"{FTS_TABLE}\", 0, %s, %s, '…', {_SNIPPET_TOKENS}) "
+        f'FROM "{FTS_TABLE}" WHERE "{FTS_TABLE}" MATCH %s AND rowid IN ({placeholders})'
+    )
+    query = " AND ".join(f'"{term}"*' for term in terms)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [_START, _STOP, query, *doc_keys])
+        return dict(cursor.fetchall())
+
+
+def _postgres_snippets(terms, doc_keys):
+    options = f"StartSel={_START}, StopSel={_STOP}, MaxWords={_SNIPPET_TOKENS}, MinWords=4"
+    query = " & ".join(f"{term}:*" for term in terms)
+    reply_ids = [key for key in doc_keys if key > 0]
+    ticket_ids = [-key for key in doc_keys if key < 0]
+    sql = (
+        "SELECT r.id, ts_headline('simple', r.body, to_tsquery('simple', %s), %s) "
+        f'FROM "{Reply._meta.db_table}" r WHERE r.id = ANY(%s) '
+        "UNION ALL "
+        "SELECT -t.id, ts_headline('simple', t.additional_details, to_tsquery('simple', %s), %s) "
+        f'FROM "{Ticket._meta.db_table}" t WHERE t.id = ANY(%s)'
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [query, options, reply_ids, query, options, ticket_ids])
+        # additional_details is stored as sanitised HTML; keep only its text.
+        return {key: _TAG.sub(" ", text) if key < 0 else text for key, text in cursor.fetchall()}
+
+
+def _render_snippet(raw):
+    """HTML-escape a snippet, then turn the highlight markers into ``<mark>`` tags."""
+    escaped = html.escape(raw or "")
+    return escaped.replace(_START, "<mark>").replace(_STOP, "</mark>")
+
+
+def search_conversations(search, tickets, cursor=None, page_size=20):
+    """
+    Search reply bodies and additional_details of the tickets in ``tickets``.
+
+    Args:
+        search: User search string; every word must prefix-match.
+        tickets: Ticket queryset the caller may read (access rules applied by the caller).
+        cursor: Token from a previous page's ``next``, or None.
+        page_size: Results per page.
+
+    Returns:
+        ``(results, next_token)`` where each result has ``ticket_id``,
+        ``reply_id`` (None for a ticket's additional_details), ``rank`` and a
+        ``snippet`` with matches wrapped in ``<mark>``.
+    """
+    backend = _backend()
+    terms = search_terms(search)
+    if backend is None or not terms:
+        return [], None
+    documents = _sqlite_documents(terms) if backend == "sqlite" else _postgres_documents(terms)
+    rows = _page_rows(documents, tickets, cursor, page_size)
+    next_token = encode_rank_cursor(rows[page_size - 1][3], rows[page_size - 1][0]) if len(rows) > page_size else None
+    rows = rows[:page_size]
+    fetch_snippets = _sqlite_snippets if backend == "sqlite" else _postgres_snippets
+    snippets = fetch_snippets(terms, [row[0] for row in rows]) if rows else {}
+    results = [
+        {"ticket_id": ticket_id, "reply_id": reply_id, "rank": rank, "snippet": _render_snippet(snippets.get(key))}
+        for key, ticket_id, reply_id, rank in rows
+    ]
+    return results, next_token
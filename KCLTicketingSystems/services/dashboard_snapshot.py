@@ -0,0 +1,20 @@
+"""Short-lived cached snapshot of the admin dashboard payload."""
+
+from django.conf import settings
+from django.core.cache import cache
+
+DASHBOARD_STATS_CACHE_KEY = "kcl:admin-dashboard-stats"
+
+
+def _ttl():
+    return getattr(settings, "ADMIN_DASHBOARD_CACHE_TTL", 30)
+
+
+def get_dashboard_snapshot(build):
+    """Return the cached dashboard payload, calling ``build()`` to refresh it on a miss."""
+    return cache.get_or_set(DASHBOARD_STATS_CACHE_KEY, build, timeout=_ttl())
+
+
+def invalidate_dashboard_snapshot(**kwargs):
+    """Drop the cached payload; usable directly or as a model signal receiver."""
+    cache.delete(DASHBOARD_STATS_CACHE_KEY)
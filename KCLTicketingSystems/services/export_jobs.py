@@ -0,0 +1,134 @@
+"""
+Submit, claim and run background export jobs.
+
+Requests create (or reuse) an ``ExportJob``; ``manage.py run_export_jobs``
+claims pending jobs one at a time and streams the CSV into a temporary file in
+chunks before saving it under ``MEDIA_ROOT/exports/``. Jobs for the same export
+type, normalised range and data watermark are reused instead of regenerated.
+"""
+import hashlib
+import logging
+import tempfile
+from datetime import timedelta
+
+from django.core.files import File
+from django.db.models import Count, Max
+from django.utils import timezone
+
+from ..models.export_job import ExportJob
+from ..models.ticket import Ticket
+from . import ticket_export
+
+logger = logging.getLogger(__name__)
+
+# A RUNNING job not finished within this window is assumed to belong to a dead worker.
+STALE_RUNNING_AFTER = timedelta(hours=1)
+_REUSABLE_STATUSES = (ExportJob.Status.PENDING, ExportJob.Status.RUNNING, ExportJob.Status.DONE)
+
+
+def _aware(value):
+    return timezone.make_aware(value) if timezone.is_naive(value) else value
+
+
+def normalise_range(start_date, end_date):
+    """Widen ``[start, end]`` to whole hours so near-identical requests share one job."""
+    start = _aware(start_date).replace(minute=0, second=0, microsecond=0)
+    end = _aware(end_date)
+    floored = end.replace(minute=0, second=0, microsecond=0)
+    return start, (floored if floored == end else floored + timedelta(hours=1))
+
+
+def _tickets_in_range(start_date, end_date):
+    return Ticket.objects.filter(created_at__gte=start_date, created_at__lte=end_date)
+
+
+def data_watermark(start_date, end_date):
+    """Fingerprint of the tickets (and their replies) in range; changes whenever either changes."""
+    state = _tickets_in_range(start_date, end_date).aggregate(
+        tickets=Count("id", distinct=True),
+        updated=Max("updated_at"),
+        reply=Max("replies__id"),
+    )
+    raw = f"{state['tickets']}|{state['updated']}|{state['reply']}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def submit_export_job(export_type, start_date, end_date, requested_by=None):
+    """
+    Return ``(job, created)`` for the requested export.
+
+    An existing pending, running or finished job with the same type, normalised
+    range and watermark is returned instead of queueing a new one.
+    """
+    start, end = normalise_range(start_date, end_date)
+    key = {"export_type": export_type, "start_date": start, "end_date": end,
+           "watermark": data_watermark(start, end)}
+    existing = ExportJob.objects.filter(status__in=_REUSABLE_STATUSES, **key).order_by("-created_at").first()
+    if existing is not None:
+        return existing, False
+    return ExportJob.objects.create(requested_by=requested_by, **key), True
+
+
+def requeue_stale_jobs():
+    """Return RUNNING jobs abandoned by a crashed worker to PENDING; returns how many."""
+    cutoff = timezone.now() - STALE_RUNNING_AFTER
+    return ExportJob.objects.filter(status=ExportJob.Status.RUNNING, started_at__lt=cutoff).update(
+        status=ExportJob.Status.PENDING, started_at=None
+    )
+
+
+def claim_next_job():
+    """Atomically move the oldest PENDING job to RUNNING and return it (None if the queue is empty)."""
+    while True:
+        job_id = (
+            ExportJob.objects.filter(status=ExportJob.Status.PENDING)
+            .order_by("created_at", "id").values_list("id", flat=True).first()
+        )
+        if job_id is None:
+            return None
+        claimed = ExportJob.objects.filter(pk=job_id, status=ExportJob.Status.PENDING).update(
+            status=ExportJob.Status.RUNNING, started_at=timezone.now()
+        )
+        if claimed:
+            return ExportJob.objects.get(pk=job_id)
+
+
+def _chunks_for(job):
+    tickets = _tickets_in_range(job.start_date, job.end_date)
+    if job.export_type == ExportJob.ExportType.STATISTICS_CSV:
+        return ticket_export.iter_statistics_csv(tickets)
+    return ticket_export.iter_ticket_csv(tickets.order_by("-created_at"))
+
+
+def _artifact_name(job):
+    return f"{job.export_type}_{job.start_date:%Y%m%d%H}_{job.end_date:%Y%m%d%H}_{job.watermark[:12]}.csv"
+
+
+def run_export_job(job):
+    """Write ``job``'s artifact chunk by chunk and mark it DONE, or FAILED with the error."""
+    try:
+        with tempfile.TemporaryFile() as handle:
+            for chunk in _chunks_for(job):
+                handle.write(chunk.encode("utf-8"))
+            job.size_bytes = handle.tell()
+            handle.seek(0)
+            job.file.save(_artifact_name(job), File(handle), save=False)
+        job.status = ExportJob.Status.DONE
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("Export job %s failed.", job.pk)
+        job.status, job.error = ExportJob.Status.FAILED, str(exc)
+    job.finished_at = timezone.now()
+    job.save()
+    return job
+
+
+def process_pending_jobs(limit=None):
+    """Run pending jobs until the queue is empty (or ``limit`` jobs ran); returns the jobs run."""
+    requeue_stale_jobs()
+    finished = []
+    while limit is None or len(finished) < limit:
+        job = claim_next_job()
+        if job is None:
+            break
+        finished.append(run_export_job(job))
+    return finished
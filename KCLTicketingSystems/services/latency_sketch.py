@@ -0,0 +1,61 @@
+"""
+Mergeable quantile sketch for durations, using fixed logarithmic buckets.
+
+A sketch is a dict mapping bucket index (as a string, so it round-trips
+through a JSONField) to a count. A duration of ``s`` seconds falls in bucket
+``floor(log_GAMMA(s + 1))``, so every bucket spans ``GAMMA``-fold range and a
+quantile read from it is within about ``(GAMMA - 1) / 2`` relative error.
+Sketches for any set of days merge by adding counts.
+"""
+import math
+
+GAMMA = 1.05
+PERCENTILES = (("p50", 0.50), ("p90", 0.90), ("p99", 0.99))
+_LOG_GAMMA = math.log(GAMMA)
+
+
+def bucket_for(seconds):
+    """Bucket index (as a string) for a non-negative duration in seconds."""
+    return str(int(math.log1p(max(seconds, 0.0)) / _LOG_GAMMA))
+
+
+def add(sketch, seconds):
+    """Count one duration in ``sketch`` (mutated and returned)."""
+    key = bucket_for(seconds)
+    sketch[key] = sketch.get(key, 0) + 1
+    return sketch
+
+
+def merge(into, other):
+    """Add ``other``'s counts into ``into`` (mutated and returned)."""
+    for key, count in (other or {}).items():
+        into[key] = into.get(key, 0) + count
+    return into
+
+
+def _bucket_value(index):
+    """Representative duration of a bucket: the midpoint of its (seconds + 1) range, minus 1."""
+    return GAMMA ** index * (1 + GAMMA) / 2 - 1
+
+
+def quantile(sketch, q):
+    """Approximate ``q``-quantile in seconds (nearest rank), or None for an empty sketch."""
+    total = sum(sketch.values())
+    if not total:
+        return None
+    rank = max(1, math.ceil(q * total))
+    seen = 0
+    for index in sorted(int(key) for key in sketch):
+        seen += sketch[str(index)]
+        if seen >= rank:
+            return max(_bucket_value(index), 0.0)
+    return None
+
+
+def percentile_hours(sketch):
+    """``{"p50": hours, "p90": hours, "p99": hours}`` rounded to 2dp (values None when empty)."""
+    result = {}
+    for name, q in PERCENTILES:
+        seconds = quantile(sketch or {}, q)
+        result[name] = round(seconds / 3600, 2) if seconds is not None else None
+    return result
@@ -0,0 +1,113 @@
+"""
+Count strategies for paginated admin lists.
+
+``?count=exact`` (default) returns an exact total cached per normalised filter
+set; ``?count=estimate`` counts up to a threshold and above it returns the
+database planner's row estimate; ``?count=none`` skips counting. Cached totals
+are keyed by a per-list generation number that signals bump on writes.
+"""
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+COUNT_EXACT = "exact"
+COUNT_ESTIMATE = "estimate"
+COUNT_NONE = "none"
+COUNT_MODES = (COUNT_EXACT, COUNT_ESTIMATE, COUNT_NONE)
+
+# Query parameters that change the page, not the result set being counted.
+_PAGING_PARAMS = {"page", "page_size", "cursor", "pagination", "count"}
+
+
+def _ttl():
+    return getattr(settings, "ADMIN_LIST_COUNT_CACHE_TTL", 60)
+
+
+def _threshold():
+    return getattr(settings, "ADMIN_LIST_EXACT_COUNT_THRESHOLD", 10000)
+
+
+def _generation_key(scope):
+    return f"kcl:list-count-gen:{scope}"
+
+
+def bump_list_count_generation(scope):
+    """Invalidate every cached count for ``scope`` (e.g. ``tickets`` or ``users``)."""
+    try:
+        cache.incr(_generation_key(scope))
+    except ValueError:
+        cache.set(_generation_key(scope), 1, timeout=None)
+
+
+def current_generation(scope):
+    """Generation number for ``scope``; part of any cache key that must drop on writes."""
+    return cache.get(_generation_key(scope), 0)
+
+
+def normalised_filters(params):
+    """Stable representation of the filter parameters that determine a list's total."""
+    filters = {}
+    for key in sorted(params.keys()):
+        if key in _PAGING_PARAMS:
+            continue
+        value = (params.get(key) or "").strip()
+        if value:
+            filters[key] = value.lower() if key == "search" else value
+    return filters
+
+
+def _cache_key(scope, mode, filters):
+    generation = current_generation(scope)
+    digest = hashlib.md5(json.dumps(filters, sort_keys=True).encode()).hexdigest()
+    return f"kcl:list-count:{scope}:{generation}:{mode}:{digest}"
+
+
+def count_mode(params):
+    """Return the requested count mode, defaulting to exact for unknown values."""
+    mode = params.get("count", COUNT_EXACT)
+    return mode if mode in COUNT_MODES else COUNT_EXACT
+
+
+def resolve_total(queryset, params, scope):
+    """Return ``(total, count_type)`` for ``queryset`` under the requested count mode."""
+    mode = count_mode(params)
+    if mode == COUNT_NONE:
+        return None, COUNT_NONE
+    key = _cache_key(scope, mode, normalised_filters(params))
+    cached = cache.get(key)
+    if cached is not None:
+        return tuple(cached)
+    result = _exact(queryset) if mode == COUNT_EXACT else _estimate(queryset)
+    cache.set(key, result, timeout=_ttl())
+    return result
+
+
+def _exact(queryset):
+    return queryset.count(), COUNT_EXACT
+
+
+def _estimate(queryset):
+    threshold = _threshold()
+    bounded = queryset.order_by()[: threshold + 1].count()
+    if bounded <= threshold:
+        return bounded, COUNT_EXACT
+    estimate = _planner_row_estimate(queryset)
+    if estimate is None:
+        return _exact(queryset)
+    return max(estimate, bounded), COUNT_ESTIMATE
+
+
+def _planner_row_estimate(queryset):
+    """Planner row estimate on Postgres; None on backends without a cheap estimate."""
+    if connection.vendor != "postgresql":
+        return None
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,195 @@
+"""
+Transactional outbox for in-app notifications.
+
+``utils.notify_*`` append ``NotificationOutboxEvent`` rows with ``enqueue``
+inside the caller's transaction, so a request pays one small INSERT however
+many users end up notified, and a rolled-back request notifies nobody.
+``manage.py dispatch_notifications`` calls ``dispatch_batch`` to claim due
+events, expand their recipients (admins via the cached ``admin_ids``) and
+write every ``Notification`` of the batch with one ``bulk_create``, bumping
+the recipients' unread counters in the same transaction.
+
+A batch whose insert fails is retried event by event so one bad event cannot
+hold up the rest; failing events back off exponentially and are marked
+FAILED after ``NOTIFICATION_OUTBOX_MAX_ATTEMPTS``.
+"""
+import logging
+from collections import namedtuple
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, transaction
+from django.db.models import Count, Min, Q
+from django.utils import timezone
+
+from ..models import Notification, NotificationOutboxEvent, User
+from .admin_recipients import admin_ids
+from .unread_counts import count_inserted
+
+logger = logging.getLogger(__name__)
+
+# Delay before the first retry; doubles with every further failed attempt.
+RETRY_BACKOFF = timedelta(seconds=30)
+
+DispatchResult = namedtuple("DispatchResult", ["events", "notifications", "retried", "failed", "lag_seconds"])
+OutboxStats = namedtuple("OutboxStats", ["pending", "failed", "oldest_pending_seconds"])
+
+
+def _batch_size():
+    return getattr(settings, "NOTIFICATION_OUTBOX_BATCH_SIZE", 500)
+
+
+def _max_attempts():
+    return getattr(settings, "NOTIFICATION_OUTBOX_MAX_ATTEMPTS", 5)
+
+
+def event(title, message, user_ids=(), include_admins=False, except_user_id=None, ticket=None, meeting_request=None):
+    """Build an unsaved event for ``user_ids`` (and every admin but ``except_user_id``)."""
+    return NotificationOutboxEvent(
+        title=title, message=message, recipient_ids=[user_id for user_id in user_ids if user_id is not None],
+        include_admins=include_admins, except_user_id=except_user_id, ticket=ticket, meeting_request=meeting_request,
+    )
+
+
+def enqueue(events):
+    """Append ``events`` to the outbox with one INSERT in the current transaction."""
+    events = [item for item in events if item.recipient_ids or item.include_admins]
+    if events:
+        NotificationOutboxEvent.objects.bulk_create(events)
+
+
+def _recipients(item, admins):
+    ids = list(item.recipient_ids)
+    if item.include_admins:
+        ids.extend(admin_id for admin_id in admins if admin_id != item.except_user_id)
+    return list(dict.fromkeys(ids))
+
+
+def _notifications(item, user_ids):
+    return [
+        Notification(
+            user_id=user_id, title=item.title, message=item.message,
+            ticket_id=item.ticket_id, meeting_request_id=item.meeting_request_id,
+        )
+        for user_id in user_ids
+    ]
+
+
+def _due(now):
+    return NotificationOutboxEvent.objects.filter(
+        status=NotificationOutboxEvent.Status.PENDING, available_at__lte=now,
+    ).order_by("available_at", "id")
+
+
+def _write_one_by_one(rows):
+    """Insert each event's rows in its own savepoint; returns ``{event: error}`` for those that failed."""
+    errors = {}
+    for item, notifications in rows.items():
+        try:
+            with transaction.atomic():
+                Notification.objects.bulk_create(notifications)
+        except DatabaseError as exc:
+            errors[item] = exc
+    return errors
+
+
+def _record_failure(item, error, now):
+    item.attempts += 1
+    item.last_error = str(error)
+    if item.attempts >= _max_attempts():
+        item.status = NotificationOutboxEvent.Status.FAILED
+        logger.error("Notification outbox event %s failed after %s attempts: %s", item.pk, item.attempts, error)
+    else:
+        item.available_at = now + RETRY_BACKOFF * 2 ** (item.attempts - 1)
+        logger.warning("Notification outbox event %s failed (attempt %s): %s", item.pk, item.attempts, error)
+    item.save(update_fields=["attempts", "last_error", "status", "available_at"])
+
+
+def _claim(now, batch_size):
+    """Lock up to ``batch_size`` due events; concurrent workers skip each other's rows where supported."""
+    return list(_due(now).select_for_update(skip_locked=True)[:batch_size or _batch_size()])
+
+
+def _expand(events):
+    """``{event: [unsaved Notification, ...]}`` for the recipients of each event."""
+    admins = admin_ids() if any(item.include_admins for item in events) else []
+    recipients = {item: _recipients(item, admins) for item in events}
+    # Users deleted since the event was written are dropped rather than failing the insert.
+    live = set(
+        User.objects.filter(pk__in={user_id for ids in recipients.values() for user_id in ids})
+        .values_list("pk", flat=True)
+    )
+    return {item: _notifications(item, [user_id for user_id in ids if user_id in live])
+            for item, ids in recipients.items()}
+
+
+def _write_batch(rows):
+    """Insert every event's rows with one ``bulk_create``, falling back to one event at a time; returns errors."""
+    try:
+        with transaction.atomic():
+            Notification.objects.bulk_create([row for notifications in rows.values() for row in notifications])
+    except DatabaseError:
+        return _write_one_by_one(rows)
+    return {}
+
+
+def dispatch_batch(batch_size=None):
+    """
+    Deliver up to ``batch_size`` due events and return a ``DispatchResult``.
+
+    ``lag_seconds`` is the age of the oldest delivered event, i.e. how long
+    the slowest notification of the batch waited in the outbox.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        events = _claim(now, batch_size)
+        if not events:
+            return DispatchResult(0, 0, 0, 0, 0.0)
+        rows = _expand(events)
+        errors = _write_batch(rows)
+        delivered = [item for item in events if item not in errors]
+        NotificationOutboxEvent.objects.filter(pk__in=[item.pk for item in delivered]).update(
+            status=NotificationOutboxEvent.Status.DONE, dispatched_at=now, last_error="",
+        )
+        count_inserted(row for item in delivered for row in rows[item])
+        for item, error in errors.items():
+            _record_failure(item, error, now)
+
+    failed = sum(1 for item in errors if item.status == NotificationOutboxEvent.Status.FAILED)
+    return DispatchResult(
+        events=len(delivered),
+        notifications=sum(len(rows[item]) for item in delivered),
+        retried=len(errors) - failed,
+        failed=failed,
+        lag_seconds=max(((now - item.created_at).total_seconds() for item in delivered), default=0.0),
+    )
+
+
+def dispatch_pending(batch_size=None):
+    """Dispatch batches until no event is due; returns the ``DispatchResult`` of each batch."""
+    results = []
+    while True:
+        result = dispatch_batch(batch_size)
+        if not (result.events or result.retried or result.failed):
+            return results
+        results.append(result)
+
+
+def outbox_stats():
+    """Backlog size, failed events, and the age in seconds of the oldest pending event."""
+    row = NotificationOutboxEvent.objects.aggregate(
+        pending=Count("id", filter=Q(status=NotificationOutboxEvent.Status.PENDING)),
+        failed=Count("id", filter=Q(status=NotificationOutboxEvent.Status.FAILED)),
+        oldest=Min("created_at", filter=Q(status=NotificationOutboxEvent.Status.PENDING)),
+    )
+    oldest = (timezone.now() - row["oldest"]).total_seconds() if row["oldest"] else 0.0
+    return OutboxStats(row["pending"], row["failed"], oldest)
+
+
+def purge_dispatched(older_than=timedelta(days=7)):
+    """Delete DONE events dispatched before ``older_than`` ago; returns how many."""
+    cutoff = timezone.now() - older_than
+    deleted, _ = NotificationOutboxEvent.objects.filter(
+        status=NotificationOutboxEvent.Status.DONE, dispatched_at__lt=cutoff,
+    ).delete()
+    return deleted
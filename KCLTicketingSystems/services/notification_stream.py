@@ -0,0 +1,127 @@
+"""
+Push-style delivery of new notifications: Server-Sent Events and long-poll.
+
+Both transports are async and wait with ``asyncio.sleep`` between cheap
+indexed reads of ``id > last_id`` for one user, so under the ASGI entry point
+an idle client holds a coroutine, not a server worker. Reads go through the
+async ORM on the request's thread-sensitive executor, and that thread's
+database connection is closed before each wait, so open streams only hold
+connections while a read is running, whatever ``CONN_MAX_AGE`` says. Notification
+ids are the SSE event ids: a reconnecting ``EventSource`` sends the last one
+back as ``Last-Event-ID`` and resumes exactly where it stopped.
+"""
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Max
+
+from ..models.notification import Notification
+from .notification_feed import FIELDS
+
+# Rows fetched per read; a backlog larger than this is sent over several reads.
+BATCH_SIZE = 100
+# Reconnect delay suggested to EventSource clients, in milliseconds.
+RETRY_MS = 3000
+
+
+def _poll_interval():
+    return getattr(settings, "NOTIFICATION_STREAM_POLL_INTERVAL", 2)
+
+
+async def latest_id(user_id):
+    """Id of the user's newest notification, or 0; the cursor for clients that bring none."""
+    row = await Notification.objects.filter(user_id=user_id).aaggregate(last=Max("id"))
+    return row["last"] or 0
+
+
+async def notifications_after(user_id, last_id, limit=BATCH_SIZE):
+    """Up to ``limit`` of the user's notifications with id above ``last_id``, oldest first."""
+    rows = Notification.objects.filter(user_id=user_id, id__gt=last_id).order_by("id").values(*FIELDS)
+    return [row async for row in rows[:limit]]
+
+
+def _release_connection():
+    """Close this thread's connection between polls, unless a transaction (e.g. a TestCase) holds it."""
+    if not connection.in_atomic_block:
+        connection.close()
+
+
+async def _idle(seconds):
+    """Give back the database connection, then sleep ``seconds``."""
+    await sync_to_async(_release_connection)()
+    await asyncio.sleep(seconds)
+
+
+def sse_event(row):
+    """Format one notification row as an SSE ``notification`` event."""
+    data = json.dumps(row, cls=DjangoJSONEncoder)
+    return f"id: {row['id']}\nevent: notification\ndata: {data}\n\n"
+
+
+class _StreamClock:
+    """Deadline and keepalive bookkeeping for one ``event_stream`` connection."""
+
+    def __init__(self):
+        self._loop = asyncio.get_running_loop()
+        self.deadline = self._loop.time() + getattr(settings, "NOTIFICATION_STREAM_MAX_SECONDS", 300)
+        self._heartbeat = getattr(settings, "NOTIFICATION_STREAM_HEARTBEAT", 15)
+        self._quiet_since = self._loop.time()
+
+    def keepalive_due(self, sent_events):
+        """Note a pass that sent ``sent_events``; True when a keepalive should follow it."""
+        now = self._loop.time()
+        if sent_events or now - self._quiet_since >= self._heartbeat:
+            self._quiet_since = now
+            return not sent_events
+        return False
+
+    def expired(self):
+        return self._loop.time() >= self.deadline
+
+    async def pause(self):
+        """Sleep one poll interval, or until the deadline if that is sooner."""
+        await _idle(max(0.0, min(_poll_interval(), self.deadline - self._loop.time())))
+
+
+async def event_stream(user_id, last_id):
+    """
+    Yield SSE frames for notifications after ``last_id`` as they arrive.
+
+    Sends a ``: keepalive`` comment after ``NOTIFICATION_STREAM_HEARTBEAT``
+    quiet seconds so proxies keep the connection open, and ends after
+    ``NOTIFICATION_STREAM_MAX_SECONDS`` so clients reconnect (re-authenticating
+    and resuming from ``Last-Event-ID``).
+    """
+    clock = _StreamClock()
+    yield f"retry: {RETRY_MS}\n\n"
+    while True:
+        rows = await notifications_after(user_id, last_id)
+        for row in rows:
+            last_id = row["id"]
+            yield sse_event(row)
+        if clock.keepalive_due(bool(rows)):
+            yield ": keepalive\n\n"
+        if clock.expired():
+            return
+        if len(rows) < BATCH_SIZE:
+            await clock.pause()
+
+
+async def wait_for_notifications(user_id, last_id, timeout):
+    """
+    Long-poll: return notifications after ``last_id`` as soon as there are any.
+
+    Returns an empty list once ``timeout`` seconds pass without one.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        rows = await notifications_after(user_id, last_id)
+        remaining = deadline - loop.time()
+        if rows or remaining <= 0:
+            return rows
+        await _idle(min(_poll_interval(), remaining))
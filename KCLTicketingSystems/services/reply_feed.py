@@ -0,0 +1,76 @@
+"""
+Incremental and paged reads of a ticket's replies.
+
+Both modes return flat, chronological replies (each carrying ``parent`` so the
+client can place it in its thread) and walk the ``(ticket, created_at, id)``
+index, so the cost of a poll depends on how many replies are new rather than
+on how long the conversation is.
+"""
+from datetime import datetime
+
+from django.db.models import Q
+from django.utils import timezone
+
+from ..models.reply import Reply
+from ..pagination import InvalidCursor, decode_cursor, encode_cursor
+
+MAX_LIMIT = 200
+
+
+def _replies(ticket_id):
+    return Reply.objects.filter(ticket_id=ticket_id).select_related("user")
+
+
+def _flat(replies):
+    """Mark ``replies`` as childless so serialising them never queries for children."""
+    for reply in replies:
+        reply.prefetched_children = []
+    return replies
+
+
+def parse_after(value, ticket_id):
+    """
+    Resolve ``after`` (a reply id or an ISO timestamp) to a ``(created_at, id)`` boundary.
+
+    Raises:
+        InvalidCursor: for an unparsable value or a reply id not on this ticket.
+    """
+    if value.isdigit():
+        replies = Reply.objects.filter(ticket_id=ticket_id, pk=int(value))
+        created_at = replies.values_list("created_at", flat=True).first()
+        if created_at is None:
+            raise InvalidCursor("Unknown reply id")
+        return created_at, int(value)
+    try:
+        moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError as exc:
+        raise InvalidCursor("Invalid timestamp") from exc
+    # No id: only replies strictly after the timestamp.
+    return (timezone.make_aware(moment) if timezone.is_naive(moment) else moment), None
+
+
+def replies_after(ticket_id, boundary, limit=MAX_LIMIT):
+    """Up to ``limit`` replies after the ``(created_at, id)`` boundary, oldest first."""
+    created_at, pk = boundary
+    newer = Q(created_at__gt=created_at)
+    if pk is not None:
+        newer |= Q(created_at=created_at, id__gt=pk)
+    return _flat(list(_replies(ticket_id).filter(newer).order_by("created_at", "id")[:limit]))
+
+
+def latest_replies(ticket_id, limit, before=None):
+    """
+    Return ``(replies, before_token)``: the newest ``limit`` replies, or those older than ``before``.
+
+    ``replies`` is oldest first; ``before_token`` pages further back, or is
+    None once the start of the conversation is reached.
+    """
+    replies = _replies(ticket_id)
+    if before:
+        created_at, pk, _ = decode_cursor(before)
+        replies = replies.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
+    rows = list(replies.order_by("-created_at", "-id")[: limit + 1])
+    older = len(rows) > limit
+    rows = list(reversed(rows[:limit]))
+    token = encode_cursor(rows[0].created_at, rows[0].pk, "prev") if older else None
+    return _flat(rows), token
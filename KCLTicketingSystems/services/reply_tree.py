@@ -0,0 +1,42 @@
+"""
+Build threaded reply trees in memory from a single query.
+
+Every reply of the requested tickets is loaded at once (authors joined) in
+chronological order, and each one gets a ``prefetched_children`` list, which
+``ReplySerializer.get_children`` reads instead of querying. The number of
+queries is therefore one regardless of how deep or large the threads are.
+"""
+from collections import defaultdict
+
+from ..models.reply import Reply
+
+
+def load_replies(ticket_ids):
+    """
+    Return ``{ticket_id: [reply, ...]}`` for ``ticket_ids`` in chronological order.
+
+    Every returned reply has ``prefetched_children`` set to its direct replies.
+    """
+    replies = list(
+        Reply.objects.filter(ticket_id__in=list(ticket_ids))
+        .select_related("user")
+        .order_by("created_at", "id")
+    )
+    children = defaultdict(list)
+    by_ticket = defaultdict(list)
+    for reply in replies:
+        children[reply.parent_id].append(reply)
+        by_ticket[reply.ticket_id].append(reply)
+    for reply in replies:
+        reply.prefetched_children = children.get(reply.id, [])
+    return dict(by_ticket)
+
+
+def root_replies(replies):
+    """Top-level replies (no parent) from a ``load_replies`` list."""
+    return [reply for reply in replies if reply.parent_id is None]
+
+
+def reply_tree(ticket_id):
+    """Top-level replies of one ticket with the whole thread attached below them."""
+    return root_replies(load_replies([ticket_id]).get(ticket_id, []))
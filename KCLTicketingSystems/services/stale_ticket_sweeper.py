@@ -0,0 +1,102 @@
+"""
+Out-of-band sweeper that auto-closes stale ``awaiting_response`` tickets.
+
+The sweep used to run inline on every dashboard/conversation read. It now runs
+from the ``sweep_stale_tickets`` management command (once or on an interval) or,
+when ``STALE_TICKET_SWEEPER_BACKGROUND`` is enabled, from a daemon thread started
+by the app config. A lock guarantees only one worker sweeps at a time.
+"""
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+from ..utils import auto_close_stale_awaiting_response
+from .dashboard_snapshot import invalidate_dashboard_snapshot
+from .list_counts import bump_list_count_generation
+
+logger = logging.getLogger(__name__)
+
+SWEEP_LOCK_KEY = "kcl:stale-ticket-sweep:lock"
+SWEEP_ADVISORY_LOCK_ID = 804_113_001
+DEFAULT_STALE_DAYS = 3
+DEFAULT_INTERVAL_SECONDS = 300
+
+_background_thread = None
+
+
+def _lock_timeout():
+    """Seconds after which a cache lock from a crashed worker expires."""
+    return getattr(settings, "STALE_TICKET_SWEEP_LOCK_TIMEOUT", 600)
+
+
+def _acquire_lock():
+    """Take the sweep lock; Postgres advisory lock in production, cache lock otherwise."""
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_try_advisory_lock(%s)", [SWEEP_ADVISORY_LOCK_ID])
+            return bool(cursor.fetchone()[0])
+    return cache.add(SWEEP_LOCK_KEY, "1", timeout=_lock_timeout())
+
+
+def _release_lock():
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_unlock(%s)", [SWEEP_ADVISORY_LOCK_ID])
+        return
+    cache.delete(SWEEP_LOCK_KEY)
+
+
+def run_sweep(days=DEFAULT_STALE_DAYS):
+    """
+    Run one locked sweep.
+
+    Returns:
+        dict with ``closed`` (tickets closed) and ``duration_ms``, or None when
+        another worker currently holds the lock.
+    """
+    if not _acquire_lock():
+        logger.info("Stale ticket sweep skipped: another worker holds the lock.")
+        return None
+    started = time.monotonic()
+    try:
+        closed = auto_close_stale_awaiting_response(days=days)
+    finally:
+        _release_lock()
+    duration_ms = round((time.monotonic() - started) * 1000, 2)
+    if closed:
+        invalidate_dashboard_snapshot()
+        bump_list_count_generation("tickets")
+    logger.info("Stale ticket sweep closed %s ticket(s) in %sms.", closed, duration_ms)
+    return {"closed": closed, "duration_ms": duration_ms}
+
+
+def _background_loop(interval, days):
+    while True:
+        try:
+            run_sweep(days=days)
+        except Exception:  # noqa: BLE001
+            logger.exception("Background stale ticket sweep failed.")
+        finally:
+            connection.close()
+        time.sleep(interval)
+
+
+def start_background_sweeper(interval=None, days=DEFAULT_STALE_DAYS):
+    """Start the in-process daemon sweeper once per process; return the thread."""
+    global _background_thread
+    if _background_thread is not None and _background_thread.is_alive():
+        return _background_thread
+    if interval is None:
+        interval = getattr(settings, "STALE_TICKET_SWEEP_INTERVAL", DEFAULT_INTERVAL_SECONDS)
+    _background_thread = threading.Thread(
+        target=_background_loop,
+        args=(interval, days),
+        name="stale-ticket-sweeper",
+        daemon=True,
+    )
+    _background_thread.start()
+    return _background_thread
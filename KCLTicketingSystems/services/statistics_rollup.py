@@ -0,0 +1,79 @@
+"""
+Incremental rollup of tickets into ``DailyDepartmentStats``.
+
+Each run recomputes only the days (by ticket creation date) that have tickets
+updated, or staff replies posted, since the previous run started; the first
+run, or ``full=True``, recomputes every day. Ticket deletions do not mark a day
+as changed, so a periodic full run keeps those days exact: the
+``rollup_daily_stats --loop`` worker (Procfile ``rollup``) does both.
+"""
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from ..models.daily_department_stats import DailyDepartmentStats, DailyStatsRollupRun
+from ..models.reply import Reply
+from ..models.ticket import Ticket
+from ..models.user import User
+from .statistics_service import SKETCH_FIELDS, SUM_FIELDS, day_start, department_sums
+
+# Re-examine changes slightly before the previous run so rows committed during it are not missed.
+ROLLUP_OVERLAP = timedelta(minutes=5)
+ROLLUP_BATCH_DAYS = 31
+
+
+def _ticket_days(tickets):
+    return set(tickets.annotate(day=TruncDate("created_at")).values_list("day", flat=True).order_by().distinct())
+
+
+def changed_days(since):
+    """Creation days of tickets updated, or given a staff reply, at or after ``since``."""
+    replies = Reply.objects.filter(created_at__gte=since, user__role__in=[User.Role.STAFF, User.Role.ADMIN])
+    reply_days = replies.annotate(day=TruncDate("ticket__created_at")).values_list("day", flat=True)
+    return _ticket_days(Ticket.objects.filter(updated_at__gte=since)) | set(reply_days.order_by().distinct())
+
+
+def _created_on(days):
+    condition = Q()
+    for day in days:
+        condition |= Q(created_at__gte=day_start(day), created_at__lt=day_start(day + timedelta(days=1)))
+    return condition
+
+
+def rollup_days(days, rolled_up_at=None):
+    """Replace the rollup rows for ``days``, ``ROLLUP_BATCH_DAYS`` at a time; returns rows written."""
+    rolled_up_at = rolled_up_at or timezone.now()
+    days = sorted(days)
+    written = 0
+    for offset in range(0, len(days), ROLLUP_BATCH_DAYS):
+        batch = days[offset:offset + ROLLUP_BATCH_DAYS]
+        sums = department_sums(Ticket.objects.filter(_created_on(batch)), by_day=True)
+        rows = [
+            DailyDepartmentStats(day=day, department=department, rolled_up_at=rolled_up_at,
+                                 **{field: values[field] for field in (*SUM_FIELDS, *SKETCH_FIELDS)})
+            for (day, department), values in sums.items()
+        ]
+        with transaction.atomic():
+            DailyDepartmentStats.objects.filter(day__in=batch).delete()
+            DailyDepartmentStats.objects.bulk_create(rows)
+        written += len(rows)
+    return written
+
+
+def run_rollup(full=False):
+    """Roll up the days changed since the last finished run (every day if none, or ``full``)."""
+    previous = DailyStatsRollupRun.objects.filter(finished_at__isnull=False).first()
+    run = DailyStatsRollupRun.objects.create(started_at=timezone.now())
+    if full or previous is None:
+        days = _ticket_days(Ticket.objects.all())
+        DailyDepartmentStats.objects.exclude(day__in=days).delete()
+    else:
+        days = changed_days(previous.started_at - ROLLUP_OVERLAP)
+    rollup_days(days, rolled_up_at=run.started_at)
+    run.days_rolled = len(days)
+    run.finished_at = timezone.now()
+    run.save(update_fields=["days_rolled", "finished_at"])
+    return run
@@ -1,53 +1,62 @@
-"""Statistics and analytics helpers for admin reporting endpoints."""
+"""
+Statistics and analytics helpers for admin reporting endpoints.
 
-from collections import defaultdict
+Date-range reports sum ``DailyDepartmentStats`` rows for whole days the last
+rollup run covered, and aggregate raw tickets only for the rest (today, and
+partial days at the edges of the range). Percentiles come from merging the
+per-day ``latency_sketch`` buckets rather than sorting tickets.
+"""
 
-from django.db.models import Q, Count, Avg, F, ExpressionWrapper, DurationField
+from datetime import datetime, time, timedelta
 
+from django.db.models import Q, Count, Avg, F, ExpressionWrapper, DurationField, Min, OuterRef, Subquery, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from ..models.daily_department_stats import DailyDepartmentStats, DailyStatsRollupRun
 from ..models.ticket import Ticket
 from ..models.reply import Reply
 from ..models.user import User
+from . import latency_sketch, ticket_counters
 
-
-def compute_dept_response_times(tickets):
-    """Map department -> average first staff/admin response time in hours."""
-    first_reply = _first_staff_reply_map(tickets)
-    ticket_meta = _ticket_meta_map(tickets)
-    return _dept_response_time_hours(first_reply, ticket_meta)
-
-
-def _first_staff_reply_map(tickets):
-    staff_roles = [User.Role.STAFF, User.Role.ADMIN]
-    first_reply = {}
-    rows = Reply.objects.filter(ticket__in=tickets, user__role__in=staff_roles)
-    for reply in rows.order_by("created_at").values("ticket_id", "created_at"):
-        ticket_id = reply["ticket_id"]
-        if ticket_id not in first_reply:
-            first_reply[ticket_id] = reply["created_at"]
-    return first_reply
+COUNT_FIELDS = ("total_tickets", "pending", "in_progress", "resolved", "closed", "low", "medium", "high", "urgent")
+SUM_FIELDS = (*COUNT_FIELDS, "resolution_seconds", "first_response_seconds", "first_response_count")
+SKETCH_FIELDS = ("resolution_sketch", "first_response_sketch")
+SKETCH_CHUNK_SIZE = 2000
 
 
-def _ticket_meta_map(tickets):
+def compute_dept_response_times(tickets):
+    """Map department -> average first staff/admin response time in hours (one grouped query)."""
+    rows = (
+        with_first_staff_response(tickets).values("department")
+        .annotate(avg_response=Avg("first_response_time")).order_by()
+    )
     return {
-        ticket_id: (department, created_at)
-        for ticket_id, department, created_at in tickets.values_list("id", "department", "created_at")
+        row["department"]: round(row["avg_response"].total_seconds() / 3600, 2)
+        for row in rows if row["avg_response"] is not None
     }
 
 
-def _dept_response_time_hours(first_reply, ticket_meta):
-    dept_times = defaultdict(list)
-    for ticket_id, first_reply_at in first_reply.items():
-        meta = ticket_meta.get(ticket_id)
-        if not meta:
-            continue
-        department, created_at = meta
-        if not (department and created_at):
-            continue
-        delta = (first_reply_at - created_at).total_seconds()
-        if delta < 0:
-            continue
-        dept_times[department].append(delta)
-    return {dept: round((sum(times) / len(times)) / 3600, 2) for dept, times in dept_times.items()}
+def with_first_staff_response(tickets):
+    """
+    Annotate ``first_response_time`` (first staff/admin reply minus creation) on ``tickets``.
+
+    The first reply comes from a correlated ``Min`` subquery. Tickets without a
+    department, without a staff reply, or whose first staff reply predates
+    them are excluded.
+    """
+    first_reply = (
+        Reply.objects.filter(ticket=OuterRef("pk"), user__role__in=[User.Role.STAFF, User.Role.ADMIN])
+        .order_by().values("ticket").annotate(first=Min("created_at")).values("first")
+    )
+    return (
+        tickets.exclude(department="")
+        .annotate(first_staff_reply_at=Subquery(first_reply))
+        .filter(first_staff_reply_at__gte=F("created_at"))
+        .annotate(first_response_time=ExpressionWrapper(
+            F("first_staff_reply_at") - F("created_at"), output_field=DurationField()
+        ))
+    )
 
 
 def ticket_department_stats_annotations():
@@ -74,6 +83,11 @@ def ticket_department_stats_queryset(tickets):
     return tickets.values("department").annotate(**ticket_department_stats_annotations()).order_by("-total_tickets")
 
 
+def all_time_department_statistics():
+    """Department breakdowns read from the TicketCounter table (no ticket scan, no timings)."""
+    return format_department_statistics(ticket_counters.department_breakdown(), {})
+
+
 def format_department_statistics(department_stats, dept_response_times):
     """Shape department stats into API/CSV-friendly dicts."""
     return [_format_department_stat_row(stat, dept_response_times) for stat in department_stats]
@@ -88,6 +102,8 @@ def _format_department_stat_row(stat, dept_response_times):
         "priority_breakdown": _priority_breakdown(stat),
         "avg_resolution_time_hours": _avg_resolution_hours(stat),
         "avg_response_time_hours": dept_response_times.get(department),
+        "resolution_time_percentiles_hours": stat.get("resolution_percentiles"),
+        "response_time_percentiles_hours": stat.get("first_response_percentiles"),
     }
 
 
@@ -114,3 +130,146 @@ def _avg_resolution_hours(stat):
     if not duration:
         return None
     return round(duration.total_seconds() / 3600, 2)
+
+
+# ----------------------- rollup-backed range reports -----------------------
+
+def _empty_sums():
+    return {**dict.fromkeys(SUM_FIELDS, 0), **{field: {} for field in SKETCH_FIELDS}}
+
+
+def _sum_annotations():
+    annotations = ticket_department_stats_annotations()
+    annotations.pop("avg_resolution_seconds")
+    annotations["resolution_total"] = Sum(
+        ExpressionWrapper(F("updated_at") - F("created_at"), output_field=DurationField()),
+        filter=Q(status=Ticket.Status.CLOSED, updated_at__isnull=False),
+    )
+    return annotations
+
+
+def department_sums(tickets, by_day=False):
+    """
+    Additive per-department statistics for ``tickets``.
+
+    Returns a dict keyed by department (or ``(created day, department)`` when
+    ``by_day``) whose values hold ``SUM_FIELDS`` and ``SKETCH_FIELDS``.
+    """
+    group = ("day", "department") if by_day else ("department",)
+    if by_day:
+        tickets = tickets.annotate(day=TruncDate("created_at"))
+    sums = {}
+    for row in tickets.values(*group).annotate(**_sum_annotations()).order_by():
+        key = _group_key([row[field] for field in group])
+        resolution = row["resolution_total"]
+        sums[key] = {
+            **_empty_sums(),
+            **{field: row[field] for field in COUNT_FIELDS},
+            "resolution_seconds": resolution.total_seconds() if resolution else 0.0,
+        }
+    _add_first_responses(sums, tickets, group)
+    _add_sketches(sums, tickets, group)
+    return sums
+
+
+def _group_key(values):
+    return tuple(values) if len(values) > 1 else values[0]
+
+
+def _add_first_responses(sums, tickets, group):
+    rows = with_first_staff_response(tickets).values(*group).annotate(
+        total=Sum("first_response_time"), responded=Count("id"),
+    ).order_by()
+    for row in rows:
+        key = _group_key([row[field] for field in group])
+        sums[key]["first_response_seconds"] = row["total"].total_seconds()
+        sums[key]["first_response_count"] = row["responded"]
+
+
+def _add_sketches(sums, tickets, group):
+    """Stream per-ticket durations into the resolution and first-response sketches."""
+    sources = (
+        ("resolution_sketch", tickets.filter(status=Ticket.Status.CLOSED, updated_at__isnull=False), "updated_at"),
+        ("first_response_sketch", with_first_staff_response(tickets), "first_staff_reply_at"),
+    )
+    for field, queryset, end_field in sources:
+        rows = queryset.values_list(*group, "created_at", end_field).order_by()
+        for *key, started, ended in rows.iterator(chunk_size=SKETCH_CHUNK_SIZE):
+            latency_sketch.add(sums[_group_key(key)][field], (ended - started).total_seconds())
+
+
+def day_start(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def _aware(value):
+    return timezone.make_aware(value) if timezone.is_naive(value) else value
+
+
+def rollup_covered_until():
+    """Days before the returned date are covered by the rollup (None if it never ran)."""
+    run = DailyStatsRollupRun.objects.filter(finished_at__isnull=False).first()
+    return timezone.localdate(run.started_at) if run else None
+
+
+def _rollup_day_span(start, end):
+    """Half-open ``[first, stop)`` of whole days inside ``[start, end]`` served from the rollup."""
+    covered_until = rollup_covered_until()
+    if covered_until is None:
+        return None
+    first = timezone.localdate(start)
+    if day_start(first) != start:
+        first += timedelta(days=1)
+    stop = min(timezone.localdate(end), covered_until)
+    return (first, stop) if first < stop else None
+
+
+def _add_sums(into, department, sums):
+    totals = into.setdefault(department, _empty_sums())
+    for field in SUM_FIELDS:
+        totals[field] += sums[field] or 0
+    for field in SKETCH_FIELDS:
+        latency_sketch.merge(totals[field], sums[field])
+
+
+def range_department_sums(start_date, end_date):
+    """Per-department ``SUM_FIELDS`` and ``SKETCH_FIELDS`` for tickets created in ``[start_date, end_date]``."""
+    start, end = _aware(start_date), _aware(end_date)
+    span = _rollup_day_span(start, end)
+    if span is None:
+        return department_sums(Ticket.objects.filter(created_at__gte=start, created_at__lte=end))
+    first, stop = span
+    totals = {}
+    rolled = DailyDepartmentStats.objects.filter(day__gte=first, day__lt=stop)
+    for row in rolled.values("department", *SUM_FIELDS, *SKETCH_FIELDS).iterator():
+        _add_sums(totals, row["department"], row)
+    raw = Ticket.objects.filter(
+        Q(created_at__gte=start, created_at__lt=day_start(first))
+        | Q(created_at__gte=day_start(stop), created_at__lte=end)
+    )
+    for department, sums in department_sums(raw).items():
+        _add_sums(totals, department, sums)
+    return totals
+
+
+def department_stats_from_sums(totals):
+    """
+    Turn ``range_department_sums`` output into ``(department_stats, dept_response_times)``.
+
+    ``department_stats`` has the shape of ``ticket_department_stats_queryset`` rows.
+    """
+    department_stats = []
+    response_times = {}
+    for department, sums in totals.items():
+        resolution = sums["resolution_seconds"] / sums["closed"] if sums["closed"] else None
+        department_stats.append({
+            "department": department,
+            **{field: sums[field] for field in COUNT_FIELDS},
+            "avg_resolution_seconds": timedelta(seconds=resolution) if resolution is not None else None,
+            "resolution_percentiles": latency_sketch.percentile_hours(sums["resolution_sketch"]),
+            "first_response_percentiles": latency_sketch.percentile_hours(sums["first_response_sketch"]),
+        })
+        if sums["first_response_count"]:
+            response_times[department] = round(sums["first_response_seconds"] / sums["first_response_count"] / 3600, 2)
+    department_stats.sort(key=lambda stat: -stat["total_tickets"])
+    return department_stats, response_times
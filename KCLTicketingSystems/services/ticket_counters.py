@@ -0,0 +1,102 @@
+"""
+Maintenance and reads for the ``TicketCounter`` table.
+
+Writers call ``apply_counter_delta`` inside the transaction that changes the
+ticket, so counts move atomically with the rows they describe. Readers get
+status totals and per-department breakdowns in O(departments) rather than
+scanning the ticket table.
+"""
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F, Sum
+
+from ..models.ticket import Ticket
+from ..models.ticket_counter import TicketCounter
+
+KEY_FIELDS = ("department", "status", "priority")
+
+
+def ticket_counter_key(ticket):
+    """Return the (department, status, priority) key for a ticket instance."""
+    return (ticket.department or "", ticket.status, ticket.priority)
+
+
+def _bump(key, amount):
+    counter, _ = TicketCounter.objects.get_or_create(
+        department=key[0], status=key[1], priority=key[2]
+    )
+    TicketCounter.objects.filter(pk=counter.pk).update(count=F("count") + amount)
+
+
+def apply_counter_delta(old_key, new_key, amount=1):
+    """Move ``amount`` tickets from ``old_key`` to ``new_key`` (either may be None)."""
+    if old_key == new_key:
+        return
+    with transaction.atomic():
+        if old_key is not None:
+            _bump(old_key, -amount)
+        if new_key is not None:
+            _bump(new_key, amount)
+
+
+def apply_grouped_status_change(rows, new_status):
+    """Apply counter deltas for a bulk status UPDATE given ``values(department, priority, n)`` rows."""
+    for row in rows:
+        old_key = (row["department"] or "", row["status"], row["priority"])
+        new_key = (row["department"] or "", new_status, row["priority"])
+        apply_counter_delta(old_key, new_key, amount=row["n"])
+
+
+def _source_counts():
+    rows = Ticket.objects.values(*KEY_FIELDS).annotate(n=Count("id")).order_by()
+    return Counter({(r["department"] or "", r["status"], r["priority"]): r["n"] for r in rows})
+
+
+def _stored_counts():
+    rows = TicketCounter.objects.values_list(*KEY_FIELDS, "count")
+    return Counter({(d, s, p): n for d, s, p, n in rows if n})
+
+
+def rebuild_ticket_counters():
+    """
+    Recount tickets from source rows and replace the counter table.
+
+    Returns:
+        dict mapping each drifted key to ``(stored, actual)``.
+    """
+    with transaction.atomic():
+        actual = _source_counts()
+        stored = _stored_counts()
+        drift = {k: (stored[k], actual[k]) for k in set(actual) | set(stored) if stored[k] != actual[k]}
+        TicketCounter.objects.all().delete()
+        TicketCounter.objects.bulk_create(
+            TicketCounter(department=k[0], status=k[1], priority=k[2], count=n) for k, n in actual.items()
+        )
+    return drift
+
+
+def status_totals():
+    """Map status -> ticket count, plus ``total``, from the counter table."""
+    rows = TicketCounter.objects.values("status").annotate(n=Sum("count")).order_by()
+    totals = {row["status"]: row["n"] or 0 for row in rows}
+    totals["total"] = sum(totals.values())
+    return totals
+
+
+def department_breakdown():
+    """Per-department status and priority counts, shaped like ``ticket_department_stats_queryset`` rows."""
+    departments = defaultdict(Counter)
+    for department, status, priority, count in TicketCounter.objects.values_list(*KEY_FIELDS, "count"):
+        departments[department]["total_tickets"] += count
+        departments[department][status] += count
+        departments[department][priority] += count
+    rows = [_breakdown_row(dept, counts) for dept, counts in departments.items() if counts["total_tickets"]]
+    return sorted(rows, key=lambda row: -row["total_tickets"])
+
+
+def _breakdown_row(department, counts):
+    row = {"department": department, "total_tickets": counts["total_tickets"]}
+    row.update({name: counts[name] for name in (*Ticket.Status.values, *Ticket.Priority.values)})
+    row["avg_resolution_seconds"] = None
+    return row
@@ -0,0 +1,223 @@
+"""
+Row-streaming exports: ticket CSV, per-department statistics CSV, and an
+incremental NDJSON feed of tickets (and replies) changed since a watermark.
+
+Ticket rows are read with ``values_list(...).iterator(chunk_size)`` (joins to
+the submitter and assignee included), formatted ``chunk_size`` rows at a time
+and yielded as text, so memory stays flat however many tickets are exported.
+``gzip_stream`` compresses any such stream incrementally.
+"""
+import csv
+import io
+import json
+import zlib
+from datetime import timedelta
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Max, Q
+from django.utils import timezone
+
+from ..models.reply import Reply
+from ..models.ticket import Ticket
+from . import latency_sketch, statistics_service
+
+EXPORT_CHUNK_SIZE = 2000
+
+TICKET_CSV_HEADER = [
+    "Ticket ID",
+    "Department",
+    "Issue Type",
+    "Status",
+    "Priority",
+    "Created Date",
+    "Updated Date",
+    "User K-Number",
+    "User Name",
+    "User Email",
+    "Assigned To",
+    "Additional Details",
+    "Admin Notes",
+]
+
+_EXPORT_FIELDS = (
+    "id",
+    "department",
+    "type_of_issue",
+    "status",
+    "priority",
+    "created_at",
+    "updated_at",
+    "user_id",
+    "user__k_number",
+    "user__first_name",
+    "user__last_name",
+    "user__email",
+    "k_number",
+    "k_email",
+    "assigned_to_id",
+    "assigned_to__first_name",
+    "assigned_to__last_name",
+    "additional_details",
+    "admin_notes",
+)
+
+_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def _csv_row(values):
+    row = dict(zip(_EXPORT_FIELDS, values))
+    has_user = row["user_id"] is not None
+    return [
+        row["id"],
+        row["department"],
+        row["type_of_issue"],
+        row["status"],
+        row["priority"],
+        row["created_at"].strftime(_DATE_FORMAT),
+        row["updated_at"].strftime(_DATE_FORMAT) if row["updated_at"] else "",
+        row["user__k_number"] if has_user else row["k_number"],
+        f"{row['user__first_name']} {row['user__last_name']}" if has_user else "",
+        row["user__email"] if has_user else row["k_email"],
+        f"{row['assigned_to__first_name']} {row['assigned_to__last_name']}" if row["assigned_to_id"] else "",
+        row["additional_details"],
+        row["admin_notes"] or "",
+    ]
+
+
+def _render(rows):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+def iter_ticket_csv(tickets, chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield the CSV header, then one text block per ``chunk_size`` tickets of ``tickets``."""
+    yield _render([TICKET_CSV_HEADER])
+    batch = []
+    for values in tickets.values_list(*_EXPORT_FIELDS).iterator(chunk_size=chunk_size):
+        batch.append(_csv_row(values))
+        if len(batch) >= chunk_size:
+            yield _render(batch)
+            batch = []
+    if batch:
+        yield _render(batch)
+
+
+def gzip_stream(chunks):
+    """Gzip-compress an iterable of text chunks incrementally, yielding bytes."""
+    compressor = zlib.compressobj(wbits=31)  # 31 = gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+STATISTICS_CSV_HEADER = [
+    "Department",
+    "Total Tickets",
+    "Pending",
+    "In Progress",
+    "Resolved",
+    "Closed",
+    "Low Priority",
+    "Medium Priority",
+    "High Priority",
+    "Urgent Priority",
+    "Avg Resolution Time (hours)",
+    "Avg Response Time (hours)",
+    "Resolution p50 (hours)",
+    "Resolution p90 (hours)",
+    "Resolution p99 (hours)",
+    "Response p50 (hours)",
+    "Response p90 (hours)",
+    "Response p99 (hours)",
+]
+
+
+def _percentile_cells(percentiles):
+    percentiles = percentiles or {}
+    return [percentiles.get(name) if percentiles.get(name) is not None else "" for name, _ in latency_sketch.PERCENTILES]
+
+
+def statistics_csv_rows(department_stats, dept_response_times):
+    """CSV rows for department stats plus response times and, when present, percentiles (hours)."""
+    for stat in department_stats:
+        avg_resolution = stat["avg_resolution_seconds"]
+        yield [
+            stat["department"],
+            stat["total_tickets"],
+            stat["pending"],
+            stat["in_progress"],
+            stat["resolved"],
+            stat["closed"],
+            stat["low"],
+            stat["medium"],
+            stat["high"],
+            stat["urgent"],
+            round(avg_resolution.total_seconds() / 3600, 2) if avg_resolution else "",
+            dept_response_times.get(stat["department"], ""),
+            *_percentile_cells(stat.get("resolution_percentiles")),
+            *_percentile_cells(stat.get("first_response_percentiles")),
+        ]
+
+
+def iter_statistics_csv(tickets):
+    """Yield the statistics CSV for ``tickets`` (one row per department, so a single block)."""
+    totals = statistics_service.department_sums(tickets)
+    department_stats, dept_response_times = statistics_service.department_stats_from_sums(totals)
+    yield _render([STATISTICS_CSV_HEADER, *statistics_csv_rows(department_stats, dept_response_times)])
+
+
+# ---------------------- incremental NDJSON feed -----------------------
+
+# Rows newer than ``now - lag`` are left for the next pull so writes still
+# in flight (auto_now stamped before commit) are not skipped.
+INCREMENTAL_EXPORT_LAG = timedelta(seconds=30)
+
+_NDJSON_TICKET_FIELDS = (
+    "id", "department", "type_of_issue", "status", "priority", "user_id", "assigned_to_id",
+    "closed_by_id", "additional_details", "admin_notes", "created_at", "updated_at", "last_reply_at",
+)
+_NDJSON_REPLY_FIELDS = ("id", "ticket_id", "user_id", "parent_id", "body", "created_at")
+
+
+def incremental_window(since=None, since_id=0):
+    """
+    Return ``(tickets, replies, next_watermark)`` for changes after ``(since, since_id)``.
+
+    Tickets are those with ``(updated_at, id)`` past the watermark and
+    ``updated_at`` up to the upper bound; replies are those created in
+    ``(since, upper]``. ``next_watermark`` is ``(upper, last id at upper)``.
+    """
+    upper = timezone.now() - INCREMENTAL_EXPORT_LAG
+    tickets = Ticket.objects.filter(updated_at__lte=upper)
+    replies = Reply.objects.filter(created_at__lte=upper)
+    if since is not None:
+        tickets = tickets.filter(Q(updated_at__gt=since) | Q(updated_at=since, id__gt=since_id))
+        replies = replies.filter(created_at__gt=since)
+    last_id = Ticket.objects.filter(updated_at=upper).aggregate(last=Max("id"))["last"] or 0
+    return tickets.order_by("updated_at", "id"), replies.order_by("created_at", "id"), (upper, last_id)
+
+
+def _ndjson_lines(queryset, fields, record_type, chunk_size):
+    batch = []
+    for row in queryset.values(*fields).iterator(chunk_size=chunk_size):
+        batch.append(json.dumps({"type": record_type, **row}, cls=DjangoJSONEncoder))
+        if len(batch) >= chunk_size:
+            yield "\n".join(batch) + "\n"
+            batch = []
+    if batch:
+        yield "\n".join(batch) + "\n"
+
+
+def iter_incremental_ndjson(tickets, replies=None, next_watermark=None, chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield ``ticket`` records, then ``reply`` records, then a closing ``watermark`` record."""
+    yield from _ndjson_lines(tickets, _NDJSON_TICKET_FIELDS, "ticket", chunk_size)
+    if replies is not None:
+        yield from _ndjson_lines(replies, _NDJSON_REPLY_FIELDS, "reply", chunk_size)
+    if next_watermark is not None:
+        since, since_id = next_watermark
+        # Serialise ``since`` at full precision; DjangoJSONEncoder would truncate it to milliseconds
+        # and the trailer must match the ``X-Next-Since`` header exactly.
+        yield json.dumps({"type": "watermark", "since": since.isoformat(), "since_id": since_id}) + "\n"
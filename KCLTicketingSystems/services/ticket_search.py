@@ -0,0 +1,203 @@
+"""
+Full-text search index for the admin ticket list.
+
+Each ticket gets one search document built from its id, department,
+type_of_issue, plain-text additional_details and the submitter's name,
+k_number and email. On SQLite the documents live in an FTS5 virtual table
+keyed by ticket id; on Postgres they live in a weighted ``tsvector`` column on
+the ticket table with a GIN index. Documents are written from model signals
+and can be rebuilt with the ``rebuild_ticket_search_index`` command. Other
+backends fall back to ``icontains`` matching.
+"""
+import re
+
+from django.db import connection
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
+
+from ..models.ticket import Ticket
+from ..sanitizer import additional_details_plain_text
+
+FTS_TABLE = "KCLTicketingSystems_ticket_search"
+SEARCH_VECTOR_COLUMN = "search_vector"
+
+# Fields whose change requires re-indexing a ticket / the submitter's tickets.
+TICKET_INDEXED_FIELDS = {"department", "type_of_issue", "additional_details", "user",
+                         "name", "surname", "k_number", "k_email"}
+USER_INDEXED_FIELDS = {"first_name", "last_name", "k_number", "email"}
+
+# Document columns in FTS5 column order, with bm25 weights and tsvector weights.
+_COLUMNS = (
+    ("ticket_ref", 10.0, "D"),
+    ("submitter", 8.0, "A"),
+    ("department", 4.0, "B"),
+    ("type_of_issue", 4.0, "B"),
+    ("details", 1.0, "C"),
+)
+_TEXT_COLUMNS = tuple(name for name, _, _ in _COLUMNS if name != "ticket_ref")
+_MAX_QUERY_TERMS = 8
+# Matches the unicode61 tokenizer: runs of letters/digits, underscore separates.
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+def _backend():
+    return connection.vendor if connection.vendor in ("sqlite", "postgresql") else None
+
+
+def _tokens(text):
+    return _TOKEN.findall((text or "").lower())
+
+
+def search_terms(search):
+    """Lower-cased words from a user's search string, capped at ``_MAX_QUERY_TERMS``."""
+    return _tokens(search)[:_MAX_QUERY_TERMS]
+
+
+def _normalised(text):
+    return " ".join(_tokens(text))
+
+
+def _submitter_text(ticket):
+    user = ticket.user
+    if user is not None:
+        parts = (user.first_name, user.last_name, user.k_number, user.email)
+    else:
+        parts = (ticket.name, ticket.surname, ticket.k_number, ticket.k_email)
+    return " ".join(part or "" for part in parts)
+
+
+def build_document(ticket):
+    """Return the normalised search columns for ``ticket`` in ``_COLUMNS`` order."""
+    return (
+        str(ticket.pk),
+        _normalised(_submitter_text(ticket)),
+        _normalised(ticket.department),
+        _normalised(ticket.type_of_issue),
+        _normalised(additional_details_plain_text(ticket.additional_details)),
+    )
+
+
+# ----------------------------- writes -----------------------------
+
+def _write_sqlite(cursor, documents):
+    ids = [(int(doc[0]),) for doc in documents]
+    cursor.executemany(f'DELETE FROM "{FTS_TABLE}" WHERE rowid = %s', ids)
+    cursor.executemany(
+        f'INSERT INTO "{FTS_TABLE}" (rowid, {", ".join(n for n, _, _ in _COLUMNS)}) '
+        f"VALUES (%s, {', '.join(['%s'] * len(_COLUMNS))})",
+        [(int(doc[0]), *doc) for doc in documents],
+    )
+
+
+def _write_postgres(cursor, documents):
+    vector = " || ".join(f"setweight(to_tsvector('simple', %s), '{weight}')" for _, _, weight in _COLUMNS)
+    cursor.executemany(
+        f'UPDATE "{Ticket._meta.db_table}" SET {SEARCH_VECTOR_COLUMN} = {vector} WHERE id = %s',
+        [(*doc, int(doc[0])) for doc in documents],
+    )
+
+
+def index_tickets(tickets):
+    """Write (or overwrite) the search documents for ``tickets``; returns how many were written."""
+    backend = _backend()
+    documents = [build_document(ticket) for ticket in tickets]
+    if backend is None or not documents:
+        return 0
+    with connection.cursor() as cursor:
+        if backend == "sqlite":
+            _write_sqlite(cursor, documents)
+        else:
+            _write_postgres(cursor, documents)
+    return len(documents)
+
+
+def remove_ticket(ticket_id):
+    """Drop a deleted ticket's document (the Postgres column goes with the row)."""
+    if _backend() != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM "{FTS_TABLE}" WHERE rowid = %s', [ticket_id])
+
+
+def rebuild_search_index(batch_size=500):
+    """Re-index every ticket in id order, ``batch_size`` at a time; returns the number indexed."""
+    if _backend() == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM "{FTS_TABLE}"')
+    indexed, last_id = 0, 0
+    while True:
+        batch = list(Ticket.objects.select_related("user").filter(id__gt=last_id).order_by("id")[:batch_size])
+        if not batch:
+            return indexed
+        indexed += index_tickets(batch)
+        last_id = batch[-1].id
+
+
+# ----------------------------- reads ------------------------------
+
+def _fts5_query(terms):
+    text_match = " AND ".join(f'{{{" ".join(_TEXT_COLUMNS)}}} : "{term}"*' for term in terms)
+    if len(terms) == 1 and terms[0].isdigit():
+        return f'({text_match}) OR ticket_ref : "{terms[0]}"'
+    return text_match
+
+
+def _tsquery(terms):
+    text_match = " & ".join(f"{term}:*ABC" for term in terms)
+    if len(terms) == 1 and terms[0].isdigit():
+        return f"({text_match}) | {terms[0]}:D"
+    return text_match
+
+
+def _icontains_filter(tickets, search):
+    return tickets.filter(
+        Q(user__first_name__icontains=search) |
+        Q(user__last_name__icontains=search) |
+        Q(user__k_number__icontains=search) |
+        Q(user__email__icontains=search) |
+        Q(department__icontains=search) |
+        Q(type_of_issue__icontains=search)
+    )
+
+
+def _sqlite_search(tickets, terms):
+    query = _fts5_query(terms)
+    weights = ", ".join(str(weight) for _, weight, _ in _COLUMNS)
+    rank = RawSQL(
+        f'SELECT bm25("{FTS_TABLE}", {weights}) FROM "{FTS_TABLE}" '
+        f'WHERE "{FTS_TABLE}" MATCH %s AND rowid = "{Ticket._meta.db_table}"."id"',
+        [query],
+        output_field=FloatField(),
+    )
+    matches = RawSQL(f'SELECT rowid FROM "{FTS_TABLE}" WHERE "{FTS_TABLE}" MATCH %s', [query])
+    return tickets.filter(id__in=matches).annotate(search_rank=rank)
+
+
+def _postgres_search(tickets, terms):
+    column = f'"{Ticket._meta.db_table}"."{SEARCH_VECTOR_COLUMN}"'
+    query = _tsquery(terms)
+    matches = RawSQL(f"{column} @@ to_tsquery('simple', %s)", [query], output_field=BooleanField())
+    # Negated so that, as with bm25, a lower rank is a better match.
+    rank = RawSQL(f"-ts_rank({column}, to_tsquery('simple', %s))", [query], output_field=FloatField())
+    return tickets.filter(matches).annotate(search_rank=rank)
+
+
+def search_tickets(tickets, search):
+    """
+    Filter ``tickets`` to those matching ``search`` and order them by relevance.
+
+    Every search word must prefix-match a word in the document; a lone number
+    also matches the ticket id exactly. Matches are annotated with
+    ``search_rank`` (lower is better) and ordered by it, newest first on ties.
+    """
+    backend = _backend()
+    if backend is None:
+        return _icontains_filter(tickets, search)
+    terms = search_terms(search)
+    if not terms:
+        return tickets.none()
+    if backend == "sqlite":
+        tickets = _sqlite_search(tickets, terms)
+    else:
+        tickets = _postgres_search(tickets, terms)
+    return tickets.order_by("search_rank", "-created_at")
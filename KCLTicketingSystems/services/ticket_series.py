@@ -0,0 +1,120 @@
+"""
+Ticket inflow time series for admin charts.
+
+Tickets created in a range are grouped in the database by hour, day or week
+(``Trunc*``), department and status. The range is widened to whole buckets so
+repeat requests share a cache entry; entries are keyed by the tickets list
+generation, which ticket writes bump, and expire after a short TTL.
+"""
+import hashlib
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+from django.db.models.functions import TruncDay, TruncHour, TruncWeek
+from django.utils import timezone
+
+from ..models.ticket import Ticket
+from .list_counts import current_generation
+
+BUCKETS = {
+    "hour": (TruncHour, timedelta(hours=1)),
+    "day": (TruncDay, timedelta(days=1)),
+    "week": (TruncWeek, timedelta(weeks=1)),
+}
+FILTER_FIELDS = ("department", "status")
+
+
+class SeriesTooLarge(ValueError):
+    """The requested range spans more buckets than ``max_buckets()`` allows."""
+
+
+def max_buckets():
+    return getattr(settings, "ADMIN_SERIES_MAX_BUCKETS", 500)
+
+
+def _ttl():
+    return getattr(settings, "ADMIN_SERIES_CACHE_TTL", 300)
+
+
+def _floor(moment, bucket):
+    moment = timezone.localtime(moment)
+    if bucket == "hour":
+        return moment.replace(minute=0, second=0, microsecond=0)
+    day = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    return day - timedelta(days=day.weekday()) if bucket == "week" else day
+
+
+def bucket_range(start, end, bucket):
+    """Widen ``[start, end]`` to the half-open ``[first bucket, bucket after end)`` span."""
+    step = BUCKETS[bucket][1]
+    first, last = _floor(start, bucket), _floor(end, bucket)
+    return first, last + step
+
+
+def _bucket_starts(first, stop, step):
+    starts = []
+    while first < stop:
+        starts.append(first)
+        first = timezone.localtime(first + step)
+    return starts
+
+
+def _cache_key(bucket, first, stop, filters):
+    digest = hashlib.md5(json.dumps(filters, sort_keys=True).encode()).hexdigest()
+    generation = current_generation("tickets")
+    return f"kcl:ticket-series:{generation}:{bucket}:{first.isoformat()}:{stop.isoformat()}:{digest}"
+
+
+def _grouped_counts(bucket, first, stop, filters):
+    trunc = BUCKETS[bucket][0]
+    return (
+        Ticket.objects.filter(created_at__gte=first, created_at__lt=stop, **filters)
+        .annotate(bucket=trunc("created_at"))
+        .values("bucket", "department", "status")
+        .annotate(count=Count("id"))
+        .order_by()
+    )
+
+
+def _build_series(bucket, first, stop, filters):
+    starts = _bucket_starts(first, stop, BUCKETS[bucket][1])
+    position = {start: index for index, start in enumerate(starts)}
+    series = {}
+    for row in _grouped_counts(bucket, first, stop, filters):
+        counts = series.setdefault((row["department"], row["status"]), [0] * len(starts))
+        counts[position[timezone.localtime(row["bucket"])]] += row["count"]
+    return {
+        "bucket": bucket,
+        "start": first.isoformat(),
+        "end": stop.isoformat(),
+        "buckets": [start.isoformat() for start in starts],
+        "series": [
+            {"department": department, "status": status, "counts": counts, "total": sum(counts)}
+            for (department, status), counts in sorted(series.items())
+        ],
+    }
+
+
+def ticket_inflow_series(start, end, bucket, filters=None):
+    """
+    Ticket counts per bucket for each (department, status) created in ``[start, end]``.
+
+    Args:
+        start: Range start (widened down to its bucket).
+        end: Range end (widened up to the end of its bucket).
+        bucket: ``"hour"``, ``"day"`` or ``"week"``.
+        filters: Optional ``{"department": ..., "status": ...}`` restrictions.
+
+    Raises:
+        SeriesTooLarge: When the range covers more than ``max_buckets()`` buckets.
+    """
+    filters = {field: value for field, value in (filters or {}).items() if field in FILTER_FIELDS and value}
+    start, end = (timezone.make_aware(value) if timezone.is_naive(value) else value for value in (start, end))
+    first, stop = bucket_range(start, end, bucket)
+    if (stop - first) / BUCKETS[bucket][1] > max_buckets():
+        raise SeriesTooLarge(f"Range covers more than {max_buckets()} {bucket} buckets.")
+    key = _cache_key(bucket, first, stop, filters)
+    return cache.get_or_set(key, lambda: _build_series(bucket, first, stop, filters), timeout=_ttl())
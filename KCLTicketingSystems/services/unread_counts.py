@@ -0,0 +1,92 @@
+"""
+Maintenance and reads for the ``UnreadNotificationCount`` table.
+
+Writers call ``apply_unread_deltas`` in the transaction that inserts, marks
+read or deletes notifications, so the badge count moves with the rows it
+describes and ``unread_count`` is one primary-key lookup however many
+notifications a user has.
+"""
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F
+
+from ..models.notification import Notification
+from ..models.unread_notification_count import UnreadNotificationCount
+
+
+def unread_count(user_id):
+    """The user's unread notification count, from the counter row."""
+    stored = UnreadNotificationCount.objects.filter(user_id=user_id).values_list("unread", flat=True).first()
+    return max(stored or 0, 0)
+
+
+def apply_unread_deltas(deltas):
+    """
+    Add ``{user_id: amount}`` to the stored counts (amounts may be negative).
+
+    Users sharing an amount are updated together, so a fan-out of one
+    notification each to many users is one UPDATE.
+    """
+    by_amount = defaultdict(list)
+    for user_id, amount in deltas.items():
+        if amount:
+            by_amount[amount].append(user_id)
+    if not by_amount:
+        return
+    with transaction.atomic():
+        UnreadNotificationCount.objects.bulk_create(
+            [UnreadNotificationCount(user_id=user_id) for user_ids in by_amount.values() for user_id in user_ids],
+            ignore_conflicts=True,
+        )
+        for amount, user_ids in by_amount.items():
+            UnreadNotificationCount.objects.filter(user_id__in=user_ids).update(unread=F("unread") + amount)
+
+
+def count_inserted(notifications):
+    """Count newly inserted ``Notification`` rows (saved instances) towards their users' badges."""
+    apply_unread_deltas(Counter(row.user_id for row in notifications if not row.is_read))
+
+
+def release_unread(notifications):
+    """Subtract the unread rows of a ``Notification`` queryset about to be deleted."""
+    rows = notifications.filter(is_read=False).values("user_id").annotate(n=Count("id")).order_by()
+    apply_unread_deltas({row["user_id"]: -row["n"] for row in rows})
+
+
+def mark_read(user_id, notification_id):
+    """Mark one of the user's notifications read; returns False if it does not exist."""
+    with transaction.atomic():
+        owned = Notification.objects.filter(id=notification_id, user_id=user_id)
+        changed = owned.filter(is_read=False).update(is_read=True)
+        if changed:
+            apply_unread_deltas({user_id: -changed})
+            return True
+        return owned.exists()
+
+
+def _source_counts():
+    rows = Notification.objects.filter(is_read=False).values("user_id").annotate(n=Count("id")).order_by()
+    return Counter({row["user_id"]: row["n"] for row in rows})
+
+
+def _stored_counts():
+    return Counter(dict(UnreadNotificationCount.objects.exclude(unread=0).values_list("user_id", "unread")))
+
+
+def rebuild_unread_counts():
+    """
+    Recount unread notifications and replace the counter table.
+
+    Returns:
+        dict mapping each drifted user id to ``(stored, actual)``.
+    """
+    with transaction.atomic():
+        actual = _source_counts()
+        stored = _stored_counts()
+        drift = {k: (stored[k], actual[k]) for k in set(actual) | set(stored) if stored[k] != actual[k]}
+        UnreadNotificationCount.objects.all().delete()
+        UnreadNotificationCount.objects.bulk_create(
+            UnreadNotificationCount(user_id=user_id, unread=n) for user_id, n in actual.items()
+        )
+    return drift
@@ -0,0 +1,81 @@
+"""
+Cheap watermarks for conditional GET (see ``conditional.conditional_get``).
+
+Each function returns ``(parts, last_modified)`` from a handful of aggregate
+queries over the rows a response is built from, never the rows themselves.
+``last_modified`` is only given where every change that alters the body also
+advances one of the timestamps; lists that can shrink (deletions, role
+changes) rely on counts and ids in ``parts`` and report None.
+"""
+from datetime import timedelta
+
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+
+from ..models import Attachment, Notification, OfficeHours, Reply, Ticket
+
+# Open tickets older than this are reported ``is_overdue`` by the ticket detail serializer.
+OVERDUE_AFTER = timedelta(days=3)
+OPEN_STATUSES = (Ticket.Status.PENDING, Ticket.Status.IN_PROGRESS)
+
+
+def _latest(*stamps):
+    return max((stamp for stamp in stamps if stamp is not None), default=None)
+
+
+def replies_watermark(ticket_id):
+    """A ticket's replies: count, newest id/time, and the latest author profile change."""
+    row = Reply.objects.filter(ticket_id=ticket_id).aggregate(
+        count=Count("id"), last_id=Max("id"), created=Max("created_at"), authors=Max("user__updated_at"),
+    )
+    return [row["count"], row["last_id"]], _latest(row["created"], row["authors"])
+
+
+def ticket_watermark(ticket_id):
+    """
+    A ticket with its replies, attachments and the users embedded in its detail.
+
+    The detail's ``is_overdue`` flips with the clock alone, so whether it is
+    set is part of the watermark and the flip counts as a modification.
+    Returns None if the ticket does not exist.
+    """
+    ticket = (
+        Ticket.objects.filter(pk=ticket_id)
+        .values_list("updated_at", "last_reply_at", "user__updated_at", "assigned_to__updated_at",
+                     "closed_by__updated_at", "status", "created_at")
+        .first()
+    )
+    if ticket is None:
+        return None
+    *stamps, ticket_status, created_at = ticket
+    became_overdue = created_at + OVERDUE_AFTER if ticket_status in OPEN_STATUSES else None
+    if became_overdue is not None and became_overdue > timezone.now():
+        became_overdue = None
+    reply_parts, replied = replies_watermark(ticket_id)
+    attachments = Attachment.objects.filter(ticket_id=ticket_id).aggregate(
+        count=Count("id"), last_id=Max("id"), uploaded=Max("uploaded_at"),
+    )
+    parts = [*stamps, became_overdue is not None, *reply_parts, attachments["count"], attachments["last_id"]]
+    return parts, _latest(*stamps, became_overdue, replied, attachments["uploaded"])
+
+
+def notifications_watermark(user):
+    """A user's notifications: count, newest id and unread count (mark-read has no timestamp)."""
+    row = Notification.objects.filter(user=user).aggregate(
+        count=Count("id"), last_id=Max("id"), unread=Count("id", filter=Q(is_read=False)),
+    )
+    return [row["count"], row["last_id"], row["unread"]], None
+
+
+def users_watermark(users):
+    """A user queryset: count, highest id and newest profile change."""
+    row = users.order_by().aggregate(count=Count("id"), last_id=Max("id"), updated=Max("updated_at"))
+    return [row["count"], row["last_id"], row["updated"]], None
+
+
+def office_hours_watermark(staff_id):
+    """One staff member's office hours: count, newest id and latest edit."""
+    row = OfficeHours.objects.filter(staff_id=staff_id).aggregate(
+        count=Count("id"), last_id=Max("id"), updated=Max("updated_at"),
+    )
+    return [row["count"], row["last_id"], row["updated"]], None
@@ -0,0 +1,90 @@
+"""Model signal receivers, connected from ``KclticketingsystemsConfig.ready``."""
+from django.db.models.signals import post_delete, post_save, pre_delete
+
+from .models import MeetingRequest, Notification, Reply, Ticket, User
+from .services.admin_recipients import invalidate_admin_ids
+from .services.dashboard_snapshot import invalidate_dashboard_snapshot
+from .services.list_counts import bump_list_count_generation
+from .services.ticket_counters import apply_counter_delta, ticket_counter_key
+from .services.unread_counts import count_inserted, release_unread
+from .services import conversation_search, ticket_search
+
+
+def _touches(update_fields, indexed_fields):
+    return update_fields is None or bool(indexed_fields & set(update_fields))
+
+
+def _decrement_ticket_counter(sender, instance, **kwargs):
+    """Runs inside the delete transaction, including cascades and queryset deletes."""
+    apply_counter_delta(ticket_counter_key(instance), None)
+
+
+def _invalidate_ticket_list_counts(sender, **kwargs):
+    bump_list_count_generation("tickets")
+
+
+def _invalidate_user_list_counts(sender, **kwargs):
+    # Ticket search matches on submitter fields, so user writes affect both lists.
+    bump_list_count_generation("users")
+    bump_list_count_generation("tickets")
+
+
+def _invalidate_admin_recipients(sender, update_fields=None, **kwargs):
+    if _touches(update_fields, {"role"}):
+        invalidate_admin_ids()
+
+
+def _count_unread_notification(sender, instance, created=False, **kwargs):
+    if created:
+        count_inserted([instance])
+
+
+def _release_ticket_notifications(sender, instance, **kwargs):
+    """Runs before the cascade deletes the ticket's notifications."""
+    release_unread(Notification.objects.filter(ticket_id=instance.pk))
+
+
+def _release_meeting_notifications(sender, instance, **kwargs):
+    release_unread(Notification.objects.filter(meeting_request_id=instance.pk))
+
+
+def _index_ticket(sender, instance, update_fields=None, **kwargs):
+    if _touches(update_fields, ticket_search.TICKET_INDEXED_FIELDS):
+        ticket_search.index_tickets([instance])
+    if _touches(update_fields, {"additional_details"}):
+        conversation_search.index_ticket_details([instance])
+
+
+def _unindex_ticket(sender, instance, **kwargs):
+    ticket_search.remove_ticket(instance.pk)
+    conversation_search.remove_ticket_details(instance.pk)
+
+
+def _index_reply(sender, instance, update_fields=None, **kwargs):
+    if _touches(update_fields, {"body"}):
+        conversation_search.index_replies([instance])
+
+
+def _reindex_submitter_tickets(sender, instance, created=False, update_fields=None, **kwargs):
+    if not created and _touches(update_fields, ticket_search.USER_INDEXED_FIELDS):
+        ticket_search.index_tickets(instance.tickets.select_related("user"))
+
+
+def connect_signals():
+    """Invalidate cached admin dashboard/list counts and admin ids; keep ticket/unread counters and the search index in step."""
+    post_delete.connect(_decrement_ticket_counter, sender=Ticket, dispatch_uid="ticket-counter-delete")
+    post_save.connect(_count_unread_notification, sender=Notification, dispatch_uid="unread-count-save")
+    pre_delete.connect(_release_ticket_notifications, sender=Ticket, dispatch_uid="unread-count-ticket-delete")
+    pre_delete.connect(_release_meeting_notifications, sender=MeetingRequest, dispatch_uid="unread-count-meeting-delete")
+    post_save.connect(_index_ticket, sender=Ticket, dispatch_uid="ticket-search-save")
+    post_delete.connect(_unindex_ticket, sender=Ticket, dispatch_uid="ticket-search-delete")
+    post_save.connect(_reindex_submitter_tickets, sender=User, dispatch_uid="ticket-search-user-save")
+    post_save.connect(_invalidate_admin_recipients, sender=User, dispatch_uid="admin-recipients-save")
+    post_delete.connect(_invalidate_admin_recipients, sender=User, dispatch_uid="admin-recipients-delete")
+    post_save.connect(_index_reply, sender=Reply, dispatch_uid="conversation-search-reply-save")
+    for signal, name in ((post_save, "save"), (post_delete, "delete")):
+        signal.connect(_invalidate_ticket_list_counts, sender=Ticket, dispatch_uid=f"list-count-{name}-Ticket")
+        signal.connect(_invalidate_user_list_counts, sender=User, dispatch_uid=f"list-count-{name}-User")
+    for model in (Ticket, User):
+        post_save.connect(invalidate_dashboard_snapshot, sender=model, dispatch_uid=f"dashboard-save-{model.__name__}")
+        post_delete.connect(invalidate_dashboard_snapshot, sender=model, dispatch_uid=f"dashboard-delete-{model.__name__}")
@@ -0,0 +1,114 @@
+"""
+Query budget harness: measure and report the SQL an endpoint runs.
+
+``measure`` runs one request inside ``CaptureQueriesContext`` (draining
+streamed bodies so their queries count too) and returns the response with a
+``Measurement`` of query count and total SQL time. ``seed`` adds a batch of
+rows around the given actors so the same endpoint can be measured at N and
+10N rows; a constant query count means no N+1.
+
+Set ``QUERY_BUDGET_REPORT`` to a file path, or ``-`` for stderr, to write the
+per-endpoint report collected by ``QueryBudgetReport``.
+"""
+import os
+import sys
+from collections import namedtuple
+from datetime import datetime, time, timedelta
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from ..models import Attachment, MeetingRequest, Notification, OfficeHours, Reply, Ticket, User
+
+Measurement = namedtuple("Measurement", ["queries", "seconds"])
+
+
+def measure(client, method, url, data=None):
+    """Return ``(response, Measurement)`` for one request made with ``client``."""
+    with CaptureQueriesContext(connection) as captured:
+        if method == "GET":
+            response = client.get(url, data)
+        else:
+            response = getattr(client, method.lower())(url, data, format="json")
+        if response.streaming:
+            b"".join(response.streaming_content)
+    seconds = sum(float(query["time"]) for query in captured.captured_queries)
+    return response, Measurement(len(captured), seconds)
+
+
+def seed(count, student, staff, tickets, prefix):
+    """
+    Add ``count`` of each row type the endpoints read.
+
+    Half go to the given actors (``student``'s tickets, notifications and
+    meetings, ``staff``'s assignments and office hours, replies and
+    attachments on each of ``tickets``) and half to fresh users, so both
+    per-user and global lists grow. Admins grow too, for notification fan-out.
+    """
+    day = timezone.localdate() + timedelta(days=7)
+    for i in range(count):
+        other = User.objects.create_user(
+            username=f"{prefix}-student-{i}", email=f"{prefix}-student-{i}@test.com", password="pass",
+            first_name="Seed", last_name=f"Student {i}",
+        )
+        colleague = User.objects.create_user(
+            username=f"{prefix}-staff-{i}", email=f"{prefix}-staff-{i}@test.com", password="pass",
+            role=User.Role.STAFF, department=staff.department,
+        )
+        User.objects.create_user(
+            username=f"{prefix}-admin-{i}", email=f"{prefix}-admin-{i}@test.com", password="pass", role=User.Role.ADMIN,
+        )
+        OfficeHours.objects.create(staff=staff, day_of_week=day.strftime("%A"), start_time=time(9), end_time=time(12))
+        OfficeHours.objects.create(staff=colleague, day_of_week=day.strftime("%A"), start_time=time(9), end_time=time(10))
+        for owner in (student, other):
+            extra = Ticket.objects.create(
+                user=owner, department="Informatics", type_of_issue="Seeded", assigned_to=staff,
+                closed_by=colleague if i % 2 else None, status=Ticket.Status.CLOSED if i % 2 else Ticket.Status.PENDING,
+            )
+            Reply.objects.create(ticket=extra, user=colleague, body="Seeded reply")
+            Notification.objects.create(user=owner, title="Seeded", message="m", ticket=extra)
+            MeetingRequest.objects.create(
+                student=owner, staff=staff if owner is other else colleague, description="Seeded",
+                meeting_datetime=timezone.make_aware(datetime.combine(day, time(9))) + timedelta(minutes=15 * (i % 4)),
+            )
+        for ticket in tickets:
+            Reply.objects.create(ticket=ticket, user=colleague if i % 2 else student, body=f"{prefix} reply {i}")
+        # bulk_create skips Attachment.save, which reads the size of a stored file.
+        Attachment.objects.bulk_create(
+            Attachment(ticket=ticket, file=f"attachments/{prefix}-{i}.txt", original_filename="a.txt", file_size=1)
+            for ticket in tickets
+        )
+
+
+class QueryBudgetReport:
+    """Collect measurements per endpoint and scale, and render them as a table."""
+
+    def __init__(self):
+        self.rows = {}
+
+    def add(self, endpoint, scale, measurement):
+        self.rows.setdefault(endpoint, {})[scale] = measurement
+
+    def render(self):
+        scales = sorted({scale for row in self.rows.values() for scale in row})
+        header = ["endpoint", *(f"{label} {scale}" for scale in scales for label in ("queries", "sql ms"))]
+        lines = [header]
+        for endpoint, row in sorted(self.rows.items()):
+            cells = [endpoint]
+            for scale in scales:
+                cells += [str(row[scale].queries), f"{row[scale].seconds * 1000:.1f}"] if scale in row else ["-", "-"]
+            lines.append(cells)
+        widths = [max(len(line[col]) for line in lines) for col in range(len(header))]
+        return "\n".join("  ".join(cell.ljust(width) for cell, width in zip(line, widths)) for line in lines)
+
+    def write(self):
+        """Write the table to ``QUERY_BUDGET_REPORT`` (a path, or ``-`` for stderr) if it is set."""
+        destination = os.environ.get("QUERY_BUDGET_REPORT")
+        if not destination:
+            return
+        if destination == "-":
+            sys.stderr.write(self.render() + "\n")
+            return
+        with open(destination, "w", encoding="utf-8") as handle:
+            handle.write(self.render() + "\n")
@@ -9,6 +9,7 @@ from datetime import timedelta
 
 from ..models.ticket import Ticket
 from ..models.user import User
+from ..services.dashboard_snapshot import invalidate_dashboard_snapshot
 
 
 class AdminDashboardStatsTest(TestCase):
@@ -107,6 +108,41 @@ class AdminDashboardStatsTest(TestCase):
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
+    def test_dashboard_stats_uses_one_query_per_table(self):
+        """Counters are aggregated: one ticket query, one user query, one recent-tickets query"""
+        self.client.force_authenticate(user=self.admin)
+        invalidate_dashboard_snapshot()
+        with self.assertNumQueries(3):
+            self.client.get(self.url)
+
+    def test_dashboard_stats_served_from_cache(self):
+        """A second read within the TTL issues no queries"""
+        self.client.force_authenticate(user=self.admin)
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data['total_tickets'], 3)
+
+    def test_dashboard_stats_cache_invalidated_on_ticket_write(self):
+        """Creating a ticket drops the cached snapshot"""
+        self.client.force_authenticate(user=self.admin)
+        self.client.get(self.url)
+        Ticket.objects.create(
+            user=self.student, department='Informatics', type_of_issue='New',
+            additional_details='New ticket', status=Ticket.Status.CLOSED
+        )
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['total_tickets'], 4)
+        self.assertEqual(response.data['closed_tickets'], 1)
+
+    def test_dashboard_stats_cache_invalidated_on_user_delete(self):
+        """Deleting a user drops the cached snapshot"""
+        self.client.force_authenticate(user=self.admin)
+        self.client.get(self.url)
+        self.user3.delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['total_users'], 4)
+
 
 class AdminTicketsListTest(TestCase):
     """Test cases for admin tickets list endpoint"""
@@ -0,0 +1,122 @@
+"""Tests for Admin Cursor Pagination."""
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ..models import Ticket, User
+from ..pagination import InvalidCursor, decode_cursor, encode_cursor
+
+
+class AdminCursorPaginationTest(TestCase):
+    TICKETS_URL = '/api/admin/tickets/'
+    USERS_URL = '/api/admin/users/'
+
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = User.objects.create_user(
+            username='admin', email='admin@test.com', password='pass',
+            role=User.Role.ADMIN, is_superuser=True,
+        )
+        self.student = User.objects.create_user(
+            username='student', email='student@test.com', password='pass', role=User.Role.STUDENT,
+        )
+        now = timezone.now()
+        self.tickets = []
+        for i in range(7):
+            ticket = Ticket.objects.create(
+                user=self.student, department='Informatics' if i % 2 else 'Engineering',
+                type_of_issue=f'Issue {i}', additional_details='Details',
+            )
+            # Two tickets share a timestamp to exercise the id tie-breaker.
+            Ticket.objects.filter(pk=ticket.pk).update(created_at=now - timedelta(minutes=min(i, 5)))
+            self.tickets.append(ticket)
+        self.client.force_authenticate(user=self.admin)
+
+    def _ids(self, response):
+        return [row['id'] for row in response.data['tickets']]
+
+    def _walk_forward(self, params):
+        seen, cursor = [], None
+        while True:
+            query = {**params, 'pagination': 'cursor', 'page_size': 3}
+            if cursor:
+                query['cursor'] = cursor
+            response = self.client.get(self.TICKETS_URL, query)
+            seen.extend(self._ids(response))
+            cursor = response.data['next']
+            if not cursor:
+                return seen
+
+    def test_cursor_pages_cover_all_tickets_newest_first(self):
+        expected = list(Ticket.objects.order_by('-created_at', '-id').values_list('id', flat=True))
+        self.assertEqual(self._walk_forward({}), expected)
+
+    def test_cursor_mode_keeps_filters(self):
+        expected = list(
+            Ticket.objects.filter(department='Engineering').order_by('-created_at', '-id').values_list('id', flat=True)
+        )
+        self.assertEqual(self._walk_forward({'department': 'Engineering'}), expected)
+
+    def test_cursor_mode_keeps_search(self):
+        self.assertEqual(self._walk_forward({'search': 'Issue 3'}), [self.tickets[3].id])
+
+    def test_prev_token_returns_previous_page(self):
+        first = self.client.get(self.TICKETS_URL, {'pagination': 'cursor', 'page_size': 3})
+        second = self.client.get(self.TICKETS_URL, {'cursor': first.data['next'], 'page_size': 3})
+        back = self.client.get(self.TICKETS_URL, {'cursor': second.data['prev'], 'page_size': 3})
+        self.assertEqual(self._ids(back), self._ids(first))
+        self.assertIsNone(back.data['prev'])
+        self.assertIsNone(first.data['prev'])
+
+    def test_cursor_mode_skips_total_count(self):
+        response = self.client.get(self.TICKETS_URL, {'pagination': 'cursor'})
+        self.assertNotIn('total', response.data)
+
+    def test_page_query_count_is_constant(self):
+        first = self.client.get(self.TICKETS_URL, {'pagination': 'cursor', 'page_size': 2})
+        with self.assertNumQueries(1):
+            self.client.get(self.TICKETS_URL, {'cursor': first.data['next'], 'page_size': 2})
+
+    def test_invalid_cursor_returns_400(self):
+        response = self.client.get(self.TICKETS_URL, {'cursor': 'not-a-token'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_page_size_is_clamped(self):
+        for size, expected in ((0, 1), (-5, 1), (1000, 7)):
+            response = self.client.get(self.TICKETS_URL, {'pagination': 'cursor', 'page_size': size})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(len(self._ids(response)), expected)
+        response = self.client.get(self.TICKETS_URL, {'page': -1, 'page_size': 0})
+        self.assertEqual((response.data['page'], response.data['page_size']), (1, 1))
+
+    def test_non_integer_page_params_return_400(self):
+        for params in ({'pagination': 'cursor', 'page_size': 'ten'}, {'page_size': '2.5'}, {'page': 'x'}):
+            self.assertEqual(self.client.get(self.TICKETS_URL, params).status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get(self.USERS_URL, {'pagination': 'cursor', 'page_size': 'ten'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_users_cursor_pagination(self):
+        first = self.client.get(self.USERS_URL, {'pagination': 'cursor', 'page_size': 1})
+        second = self.client.get(self.USERS_URL, {'cursor': first.data['next'], 'page_size': 1})
+        ids = [first.data['users'][0]['id'], second.data['users'][0]['id']]
+        self.assertCountEqual(ids, [self.admin.id, self.student.id])
+        self.assertIsNone(second.data['next'])
+
+    def test_offset_mode_unchanged(self):
+        response = self.client.get(self.TICKETS_URL, {'page': 2, 'page_size': 3})
+        self.assertEqual(response.data['total'], 7)
+        self.assertEqual(response.data['total_pages'], 3)
+
+
+class CursorTokenTest(TestCase):
+    def test_round_trip(self):
+        now = timezone.now()
+        self.assertEqual(decode_cursor(encode_cursor(now, 5, 'next')), (now, 5, 'next'))
+
+    def test_bad_direction_rejected(self):
+        with self.assertRaises(InvalidCursor):
+            decode_cursor(encode_cursor(timezone.now(), 5, 'sideways'))
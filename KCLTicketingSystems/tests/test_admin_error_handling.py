@@ -104,7 +104,7 @@ class AdminErrorHandlingTest(TestCase):
         self.client.force_authenticate(user=self.admin)
         
         # Mock a database error
-        with patch('KCLTicketingSystems.models.ticket.Ticket.objects.count') as mock_count:
+        with patch('KCLTicketingSystems.services.ticket_counters.status_totals') as mock_count:
             mock_count.side_effect = Exception('Database error')
             
             response = self.client.get('/api/admin/dashboard/stats/')
@@ -112,6 +112,28 @@ class AdminErrorHandlingTest(TestCase):
             self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
             self.assertIn('error', response.data)
 
+    def test_ticket_series_database_error(self):
+        """Test ticket inflow series with simulated database error"""
+        self.client.force_authenticate(user=self.admin)
+
+        with patch('KCLTicketingSystems.services.ticket_series.ticket_inflow_series') as mock_series:
+            mock_series.side_effect = Exception("Database error")
+            response = self.client.get('/api/admin/statistics/series/')
+
+            self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+            self.assertIn('error', response.data)
+
+    def test_ndjson_export_database_error(self):
+        """Test incremental NDJSON export with simulated database error"""
+        self.client.force_authenticate(user=self.admin)
+
+        with patch('KCLTicketingSystems.services.ticket_export.incremental_window') as mock_window:
+            mock_window.side_effect = Exception("Database error")
+            response = self.client.get('/api/admin/export/tickets-ndjson/')
+
+            self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+            self.assertNotIn(b'Database error', response.content)
+
     def test_pagination_invalid_page_number(self):
         """Test pagination with invalid page number"""
         self.client.force_authenticate(user=self.admin)
@@ -1,15 +1,21 @@
 """Tests for Admin Exports."""
 
 import csv
+import gzip
 import io
+import json
+from unittest.mock import patch
+
 from django.test import TestCase
 from django.utils import timezone
 from datetime import timedelta
 from rest_framework.test import APIClient
 from rest_framework import status
 
+from ..models.reply import Reply
 from ..models.ticket import Ticket
 from ..models.user import User
+from ..services import ticket_export
 
 
 class AdminExportStatisticsCSVTest(TestCase):
@@ -96,7 +102,13 @@ class AdminExportStatisticsCSVTest(TestCase):
             'High Priority',
             'Urgent Priority',
             'Avg Resolution Time (hours)',
-            'Avg Response Time (hours)'
+            'Avg Response Time (hours)',
+            'Resolution p50 (hours)',
+            'Resolution p90 (hours)',
+            'Resolution p99 (hours)',
+            'Response p50 (hours)',
+            'Response p90 (hours)',
+            'Response p99 (hours)',
         ]
         
         self.assertEqual(headers, expected_headers)
@@ -121,7 +133,7 @@ class AdminExportStatisticsCSVTest(TestCase):
         
         # Check that each row has correct number of columns
         for row in rows:
-            self.assertEqual(len(row), 12)  # 12 columns as per headers
+            self.assertEqual(len(row), 18)  # 18 columns as per headers
 
     def test_export_statistics_custom_days(self):
         """Test statistics export with custom days parameter"""
@@ -239,6 +251,10 @@ class AdminExportTicketsCSVTest(TestCase):
         self._create_users()
         self._create_tickets()
 
+    def _content(self, response):
+        """Consume the streamed CSV body."""
+        return b''.join(response.streaming_content).decode('utf-8')
+
     def test_export_tickets_unauthenticated(self):
         """Test that unauthenticated users cannot export tickets"""
         response = self.client.get(self.url)
@@ -266,7 +282,7 @@ class AdminExportTicketsCSVTest(TestCase):
         response = self.client.get(self.url)
         
         # Parse CSV content
-        content = response.content.decode('utf-8')
+        content = self._content(response)
         csv_reader = csv.reader(io.StringIO(content))
         headers = next(csv_reader)
         
@@ -285,7 +301,7 @@ class AdminExportTicketsCSVTest(TestCase):
         response = self.client.get(self.url)
         
         # Parse CSV content
-        content = response.content.decode('utf-8')
+        content = self._content(response)
         csv_reader = csv.reader(io.StringIO(content))
         
         # Skip header
@@ -310,7 +326,7 @@ class AdminExportTicketsCSVTest(TestCase):
         
         self.assertEqual(response.status_code, 200)
         
-        content = response.content.decode('utf-8')
+        content = self._content(response)
         csv_reader = csv.reader(io.StringIO(content))
         next(csv_reader)
         
@@ -356,10 +372,142 @@ class AdminExportTicketsCSVTest(TestCase):
         
         self.assertEqual(response.status_code, 200)
         
-        content = response.content.decode('utf-8')
+        content = self._content(response)
         csv_reader = csv.reader(io.StringIO(content))
         next(csv_reader)
         
         rows = list(csv_reader)
         # Should have no tickets in this date range
         self.assertEqual(len(rows), 0)
+
+    def test_export_tickets_is_streamed(self):
+        """Tickets export is a streaming response"""
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(self.url)
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(len(list(csv.reader(io.StringIO(self._content(response))))), 4)
+
+    def test_export_tickets_query_count_independent_of_rows(self):
+        """Rows are read through one joined values_list query, not per-ticket lookups"""
+        self.client.force_authenticate(user=self.admin)
+        for i in range(10):
+            Ticket.objects.create(
+                user=self.student2, department='Law', type_of_issue=f'Extra {i}',
+                additional_details='More', assigned_to=self.staff,
+            )
+        response = self.client.get(self.url)
+        with self.assertNumQueries(1):
+            rows = list(csv.reader(io.StringIO(self._content(response))))
+        self.assertEqual(len(rows), 14)
+
+    def test_export_tickets_gzip(self):
+        """compress=gzip streams a gzipped copy of the same CSV"""
+        self.client.force_authenticate(user=self.admin)
+        plain = self._content(self.client.get(self.url))
+        response = self.client.get(self.url, {'compress': 'gzip'})
+
+        self.assertEqual(response['Content-Type'], 'application/gzip')
+        self.assertIn('.csv.gz', response['Content-Disposition'])
+        self.assertEqual(gzip.decompress(b''.join(response.streaming_content)).decode('utf-8'), plain)
+
+    def test_export_tickets_without_linked_user(self):
+        """Tickets without a linked user fall back to their own contact fields"""
+        self.client.force_authenticate(user=self.admin)
+        Ticket.objects.create(
+            department='Law', type_of_issue='Walk-in', additional_details='Paper form',
+            k_number='K5555555', k_email='walkin@kcl.ac.uk',
+        )
+        rows = list(csv.reader(io.StringIO(self._content(self.client.get(self.url)))))
+        walk_in = next(row for row in rows if row[2] == 'Walk-in')
+        self.assertEqual((walk_in[7], walk_in[8], walk_in[9]), ('K5555555', '', 'walkin@kcl.ac.uk'))
+
+
+@patch.object(ticket_export, 'INCREMENTAL_EXPORT_LAG', timedelta(0))
+class AdminExportTicketsNDJSONTest(TestCase):
+    """Test cases for the incremental NDJSON tickets export"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = '/api/admin/export/tickets-ndjson/'
+        self.admin = User.objects.create_user(
+            username='admin', email='admin@test.com', password='testpass123',
+            k_number='99999999', role=User.Role.ADMIN, is_superuser=True
+        )
+        self.student = User.objects.create_user(
+            username='student', email='student@test.com', password='testpass123',
+            k_number='11111111', role=User.Role.STUDENT
+        )
+        self.ticket1 = Ticket.objects.create(user=self.student, department='Informatics', type_of_issue='One')
+        self.ticket2 = Ticket.objects.create(user=self.student, department='Law', type_of_issue='Two')
+        self.client.force_authenticate(user=self.admin)
+
+    def _records(self, response):
+        body = b''.join(response.streaming_content)
+        if response['Content-Type'] == 'application/gzip':
+            body = gzip.decompress(body)
+        return [json.loads(line) for line in body.decode('utf-8').splitlines()]
+
+    def _next_params(self, response):
+        return {'since': response['X-Next-Since'], 'since_id': response['X-Next-Since-Id']}
+
+    def test_export_ndjson_non_admin(self):
+        """Non-admin users cannot pull the feed"""
+        self.client.force_authenticate(user=self.student)
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_full_export_is_gzipped_with_watermark(self):
+        """Without a watermark every ticket is exported, gzipped, ending in a watermark record"""
+        response = self.client.get(self.url)
+        records = self._records(response)
+
+        self.assertEqual(response['Content-Type'], 'application/gzip')
+        self.assertEqual([r['id'] for r in records if r['type'] == 'ticket'], [self.ticket1.id, self.ticket2.id])
+        self.assertEqual(records[-1]['type'], 'watermark')
+        self.assertEqual(records[-1]['since_id'], int(response['X-Next-Since-Id']))
+
+    def test_next_pull_returns_only_changed_tickets(self):
+        """Passing the returned watermark yields only tickets updated since"""
+        first = self.client.get(self.url)
+        self.ticket1.status = Ticket.Status.CLOSED
+        self.ticket1.save()
+
+        records = self._records(self.client.get(self.url, {**self._next_params(first), 'compress': 'none'}))
+        tickets = [r for r in records if r['type'] == 'ticket']
+        self.assertEqual([(r['id'], r['status']) for r in tickets], [(self.ticket1.id, 'closed')])
+
+    def test_watermark_id_breaks_updated_at_ties(self):
+        """Tickets sharing the watermark timestamp are split by id"""
+        stamp = timezone.now() - timedelta(minutes=5)
+        Ticket.objects.update(updated_at=stamp)
+        params = {'since': stamp.isoformat(), 'since_id': self.ticket1.id, 'compress': 'none'}
+
+        records = self._records(self.client.get(self.url, params))
+        self.assertEqual([r['id'] for r in records if r['type'] == 'ticket'], [self.ticket2.id])
+
+    def test_watermark_record_matches_header_precision(self):
+        """The trailing watermark carries the same microsecond-precise since as the header"""
+        upper = timezone.now().replace(microsecond=123456)
+        with patch('KCLTicketingSystems.services.ticket_export.timezone.now', return_value=upper):
+            response = self.client.get(self.url, {'compress': 'none'})
+
+        watermark = self._records(response)[-1]
+        self.assertEqual(watermark['since'], response['X-Next-Since'])
+        self.assertEqual(watermark['since'], (upper - ticket_export.INCREMENTAL_EXPORT_LAG).isoformat())
+
+    def test_include_replies(self):
+        """include_replies adds replies created since the watermark"""
+        first = self.client.get(self.url)
+        reply = Reply.objects.create(ticket=self.ticket2, user=self.admin, body='On it')
+
+        params = {**self._next_params(first), 'include_replies': '1', 'compress': 'none'}
+        records = self._records(self.client.get(self.url, params))
+        replies = [r for r in records if r['type'] == 'reply']
+        self.assertEqual([(r['id'], r['ticket_id'], r['body']) for r in replies], [(reply.id, self.ticket2.id, 'On it')])
+        without = self._records(self.client.get(self.url, {**self._next_params(first), 'compress': 'none'}))
+        self.assertFalse(any(r['type'] == 'reply' for r in without))
+
+    def test_invalid_watermark(self):
+        """A malformed watermark is rejected"""
+        response = self.client.get(self.url, {'since': 'yesterday'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
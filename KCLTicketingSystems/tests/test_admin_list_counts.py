@@ -0,0 +1,82 @@
+"""Tests for Admin List Counts."""
+
+from django.test import TestCase, override_settings
+from django.http import QueryDict
+from rest_framework.test import APIClient
+
+from ..models import Ticket, User
+from ..services import list_counts
+
+
+class AdminListCountStrategyTest(TestCase):
+    URL = '/api/admin/tickets/'
+
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = User.objects.create_user(
+            username='admin', email='admin@test.com', password='pass',
+            role=User.Role.ADMIN, is_superuser=True,
+        )
+        self.student = User.objects.create_user(
+            username='student', email='student@test.com', password='pass',
+            first_name='Ada', role=User.Role.STUDENT,
+        )
+        for i in range(5):
+            Ticket.objects.create(
+                user=self.student, department='Informatics', type_of_issue=f'Issue {i}',
+                additional_details='Details',
+            )
+        self.client.force_authenticate(user=self.admin)
+
+    def test_default_is_exact_and_backwards_compatible(self):
+        response = self.client.get(self.URL, {'page_size': 2})
+        self.assertEqual(response.data['total'], 5)
+        self.assertEqual(response.data['total_pages'], 3)
+        self.assertEqual(response.data['count_type'], 'exact')
+
+    def test_count_none_skips_total(self):
+        response = self.client.get(self.URL, {'count': 'none'})
+        self.assertIsNone(response.data['total'])
+        self.assertIsNone(response.data['total_pages'])
+        self.assertEqual(len(response.data['tickets']), 5)
+
+    def test_exact_count_is_cached_per_filter_set(self):
+        self.client.get(self.URL, {'search': 'ADA'})
+        # Page query only: the count comes from the cache (search is case-normalised).
+        with self.assertNumQueries(1):
+            response = self.client.get(self.URL, {'search': 'ada', 'page': 1})
+        self.assertEqual(response.data['total'], 5)
+
+    def test_cached_count_invalidated_on_ticket_write(self):
+        self.client.get(self.URL)
+        Ticket.objects.create(user=self.student, department='Informatics', type_of_issue='New')
+        self.assertEqual(self.client.get(self.URL).data['total'], 6)
+
+    @override_settings(ADMIN_LIST_EXACT_COUNT_THRESHOLD=10)
+    def test_estimate_below_threshold_is_exact(self):
+        response = self.client.get(self.URL, {'count': 'estimate'})
+        self.assertEqual(response.data['total'], 5)
+        self.assertEqual(response.data['count_type'], 'exact')
+
+    @override_settings(ADMIN_LIST_EXACT_COUNT_THRESHOLD=2)
+    def test_estimate_above_threshold_without_planner_falls_back_to_exact(self):
+        # SQLite has no cheap planner estimate, so the exact count is used.
+        response = self.client.get(self.URL, {'count': 'estimate'})
+        self.assertEqual(response.data['total'], 5)
+
+    def test_users_list_supports_count_none(self):
+        response = self.client.get('/api/admin/users/', {'count': 'none'})
+        self.assertIsNone(response.data['total'])
+        self.assertEqual(len(response.data['users']), 2)
+
+
+class NormalisedFiltersTest(TestCase):
+    def test_paging_params_and_blanks_are_ignored(self):
+        params = QueryDict('page=3&page_size=10&count=exact&status=&search= Foo &department=Informatics')
+        self.assertEqual(
+            list_counts.normalised_filters(params),
+            {'department': 'Informatics', 'search': 'foo'},
+        )
+
+    def test_unknown_count_mode_defaults_to_exact(self):
+        self.assertEqual(list_counts.count_mode(QueryDict('count=bogus')), 'exact')
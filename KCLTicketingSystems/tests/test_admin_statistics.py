@@ -9,6 +9,7 @@ from rest_framework import status
 from ..models.ticket import Ticket
 from ..models.user import User
 from ..models.reply import Reply
+from ..services import statistics_service
 
 
 class AdminTicketStatisticsTest(TestCase):
@@ -100,6 +101,17 @@ class AdminTicketStatisticsTest(TestCase):
         # Should get tickets from last 30 days (not the ones older than 30 days)
         self.assertGreaterEqual(response.data['total_tickets'], 5)
 
+    def test_statistics_all_time_reads_counters(self):
+        """Test that days=all returns all-time breakdowns from the counter table"""
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(self.url, {'days': 'all'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_tickets'], 10)
+        self.assertIsNone(response.data['date_range']['start_date'])
+        informatics = next(d for d in response.data['department_statistics'] if d['department'] == 'Informatics')
+        self.assertEqual(informatics['total_tickets'], 5)
+        self.assertEqual(informatics['status_breakdown']['pending'], 3)
+
     def test_statistics_custom_days_parameter(self):
         """Test statistics with custom days parameter"""
         self.client.force_authenticate(user=self.admin)
@@ -352,6 +364,14 @@ class AdminAvgResponseTimeTest(TestCase):
         # If student replies were counted, the avg would be much lower than 3h
         self.assertAlmostEqual(info['avg_response_time_hours'], 3.0, delta=0.1)
 
+    def test_response_times_are_one_query_regardless_of_replies(self):
+        """First-response averages come from a single grouped query, however many replies exist"""
+        for _ in range(5):
+            Reply.objects.create(user=self.staff, ticket=self.ticket2, body='Follow-up')
+        with self.assertNumQueries(1):
+            result = statistics_service.compute_dept_response_times(Ticket.objects.all())
+        self.assertEqual(result, {'Informatics': 3.0})
+
 
 class AdminUserDetailTest(TestCase):
     """Test cases for admin user detail endpoint"""
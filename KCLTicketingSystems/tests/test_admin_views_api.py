@@ -38,9 +38,9 @@ class AdminViewsAPIEdgeCasesTest(TestCase):
         self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
 
     def test_dashboard_stats_exception(self):
-        # Patch auto_close_stale_awaiting_response to raise
+        # Patch the payload builder to raise
         from unittest.mock import patch
-        with patch("KCLTicketingSystems.views.admin_views.auto_close_stale_awaiting_response", side_effect=Exception("fail")):
+        with patch("KCLTicketingSystems.views.admin_views._dashboard_stats_payload", side_effect=Exception("fail")):
             resp = self.client.get("/api/admin/dashboard/stats/")
             self.assertEqual(resp.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
             self.assertIn("error", resp.data)
@@ -0,0 +1,57 @@
+"""Tests for Backfill Last Reply."""
+
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from ..models import Reply, Ticket, User
+
+
+class BackfillLastReplyTest(TestCase):
+    def setUp(self):
+        self.student = User.objects.create_user(
+            username="student", email="student@test.com", password="pass", role=User.Role.STUDENT
+        )
+        self.staff = User.objects.create_user(
+            username="staff", email="staff@test.com", password="pass", role=User.Role.STAFF
+        )
+        self.ticket = self._ticket()
+        self.no_replies = self._ticket()
+        now = timezone.now()
+        self._reply(self.staff, now - timedelta(days=2))
+        self.latest_at = now - timedelta(days=1)
+        self._reply(self.student, self.latest_at)
+        # Simulate rows written before the columns existed.
+        Ticket.objects.update(last_reply_at=None, last_reply_by_staff=True)
+
+    def _ticket(self):
+        return Ticket.objects.create(
+            user=self.student,
+            department="Informatics",
+            type_of_issue="Issue",
+            additional_details="Details",
+        )
+
+    def _reply(self, author, created_at):
+        reply = Reply.objects.create(user=author, ticket=self.ticket, body="Reply")
+        Reply.objects.filter(id=reply.id).update(created_at=created_at)
+
+    def test_backfill_uses_latest_reply(self):
+        call_command("backfill_last_reply", stdout=StringIO())
+        self.ticket.refresh_from_db()
+        self.assertEqual(self.ticket.last_reply_at, self.latest_at)
+        self.assertFalse(self.ticket.last_reply_by_staff)
+
+    def test_backfill_resets_tickets_without_replies(self):
+        call_command("backfill_last_reply", "--batch-size", "1", stdout=StringIO())
+        self.no_replies.refresh_from_db()
+        self.assertIsNone(self.no_replies.last_reply_at)
+        self.assertFalse(self.no_replies.last_reply_by_staff)
+
+    def test_backfill_reports_row_count(self):
+        out = StringIO()
+        call_command("backfill_last_reply", stdout=out)
+        self.assertIn("Backfilled last-reply metadata for 2 tickets", out.getvalue())
@@ -0,0 +1,162 @@
+"""Tests for ETag / Last-Modified conditional GET on read endpoints."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.utils import timezone
+from django.utils.http import http_date
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from ..models import Notification, OfficeHours, Reply, Ticket, User
+
+
+class ConditionalGetTest(TestCase):
+    def setUp(self):
+        self.student = User.objects.create_user(
+            username="student", email="student@test.com", password="pass", role=User.Role.STUDENT,
+        )
+        self.staff = User.objects.create_user(
+            username="staff", email="staff@test.com", password="pass", role=User.Role.STAFF,
+            first_name="Sam", last_name="Staff", department="Informatics",
+        )
+        self.ticket = Ticket.objects.create(
+            user=self.student, department="Informatics", type_of_issue="Issue", assigned_to=self.staff,
+        )
+        Reply.objects.create(ticket=self.ticket, user=self.staff, body="Hello")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.student)
+
+    def _revalidate(self, url, response, **headers):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"], **headers)
+
+    def test_unchanged_resources_answer_304(self):
+        urls = [
+            (self.student, f"/api/tickets/{self.ticket.id}"),
+            (self.student, f"/api/tickets/{self.ticket.id}/replies/"),
+            (self.student, "/api/notifications/"),
+            (self.student, "/api/staff/"),
+            (self.student, f"/api/staff/{self.staff.id}/"),
+            (self.staff, f"/api/staff/dashboard/{self.ticket.id}/"),
+        ]
+        for user, url in urls:
+            with self.subTest(url=url):
+                self.client.force_authenticate(user=user)
+                first = self.client.get(url)
+                self.assertEqual(first.status_code, 200)
+                self.assertIn("no-cache", first["Cache-Control"])
+
+                second = self._revalidate(url, first)
+                self.assertEqual(second.status_code, 304)
+                self.assertEqual(second["ETag"], first["ETag"])
+                self.assertEqual(second.content, b"")
+
+    def test_new_reply_changes_etag(self):
+        url = f"/api/tickets/{self.ticket.id}/replies/"
+        first = self.client.get(url)
+
+        Reply.objects.create(ticket=self.ticket, user=self.student, body="Thanks")
+
+        response = self._revalidate(url, first)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data), 2)
+        self.assertNotEqual(response["ETag"], first["ETag"])
+
+    def test_ticket_if_modified_since(self):
+        url = f"/api/tickets/{self.ticket.id}"
+        first = self.client.get(url)
+        self.assertIn("Last-Modified", first)
+
+        since = first["Last-Modified"]
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=since).status_code, 304)
+
+        later = timezone.now() + timedelta(minutes=5)
+        Ticket.objects.filter(pk=self.ticket.pk).update(updated_at=later)
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=since).status_code, 200)
+
+    def test_ticket_turning_overdue_changes_validators(self):
+        url = f"/api/staff/dashboard/{self.ticket.id}/"
+        self.client.force_authenticate(user=self.staff)
+        first = self.client.get(url)
+        self.assertFalse(first.data["is_overdue"])
+
+        later = timezone.now() + timedelta(days=4)
+        with patch("django.utils.timezone.now", return_value=later):
+            response = self._revalidate(url, first)
+            since = self.client.get(url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data["is_overdue"])
+        self.assertEqual(since.status_code, 200)
+        self.assertEqual(response["Last-Modified"], http_date((self.ticket.created_at + timedelta(days=3)).timestamp()))
+
+    def test_profile_edit_changes_directory_etag(self):
+        first = self.client.get("/api/staff/")
+
+        self.staff.first_name = "Samira"
+        self.staff.save()
+
+        response = self._revalidate("/api/staff/", first)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data[0]["first_name"], "Samira")
+
+    def test_department_filter_and_office_hours_change_etag(self):
+        everyone = self.client.get("/api/staff/")
+        filtered = self.client.get("/api/staff/", {"department": "Law"})
+        self.assertNotEqual(everyone["ETag"], filtered["ETag"])
+
+        url = f"/api/staff/{self.staff.id}/"
+        first = self.client.get(url)
+        hours = OfficeHours.objects.create(
+            staff=self.staff, day_of_week="Monday", start_time="09:00", end_time="10:00",
+        )
+        self.assertEqual(self._revalidate(url, first).status_code, 200)
+
+        second = self.client.get(url)
+        hours.delete()
+        self.assertEqual(self._revalidate(url, second).status_code, 200)
+
+    def test_mark_read_changes_notifications_etag(self):
+        notification = Notification.objects.create(user=self.student, title="T", message="M")
+        first = self.client.get("/api/notifications/")
+
+        self.client.post(f"/api/notifications/{notification.id}/read/")
+
+        response = self._revalidate("/api/notifications/", first)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data[0]["is_read"])
+
+    def test_etag_is_per_user(self):
+        other = User.objects.create_user(username="other", email="other@test.com", password="pass")
+        first = self.client.get("/api/notifications/")
+
+        self.client.force_authenticate(user=other)
+        self.assertEqual(self._revalidate("/api/notifications/", first).status_code, 200)
+
+    def test_refused_callers_are_not_revalidated(self):
+        self.client.force_authenticate(user=self.staff)
+        url = f"/api/staff/dashboard/{self.ticket.id}/"
+        first = self.client.get(url)
+
+        self.client.force_authenticate(user=self.student)
+        self.assertEqual(self._revalidate(url, first).status_code, 403)
+
+        outsider = User.objects.create_user(username="outsider", email="outsider@test.com", password="pass")
+        self.client.force_authenticate(user=outsider)
+        response = self.client.get(f"/api/tickets/{self.ticket.id}/replies/", HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(response.status_code, 403)
+
+    def test_not_modified_skips_serialisation_queries(self):
+        url = f"/api/tickets/{self.ticket.id}/replies/"
+        for i in range(10):
+            Reply.objects.create(ticket=self.ticket, user=self.staff, body=f"More {i}")
+        first = self.client.get(url)
+
+        with self.assertNumQueries(2):
+            self.assertEqual(self._revalidate(url, first).status_code, 304)
+
+    def test_last_modified_header_matches_newest_change(self):
+        response = self.client.get(f"/api/tickets/{self.ticket.id}/replies/")
+        reply = Reply.objects.get(ticket=self.ticket)
+        newest = max(reply.created_at, self.staff.updated_at)
+        self.assertEqual(response["Last-Modified"], http_date(newest.timestamp()))
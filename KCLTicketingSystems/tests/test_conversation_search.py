@@ -0,0 +1,118 @@
+"""Tests for conversation full-text search over replies and ticket details."""
+
+from importlib import import_module
+from types import SimpleNamespace
+
+from django.apps import apps
+from django.db import connection
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from ..models import Reply, Ticket, User
+
+
+class ConversationSearchTest(TestCase):
+    URL = '/api/conversations/search/'
+
+    def _user(self, username, role, **extra):
+        return User.objects.create_user(
+            username=username, email=f'{username}@test.com', password='pass', role=role, **extra
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = self._user('admin', User.Role.ADMIN)
+        self.staff = self._user('staff', User.Role.STAFF)
+        self.other_staff = self._user('other', User.Role.STAFF)
+        self.student = self._user('student', User.Role.STUDENT)
+        self.outsider = self._user('outsider', User.Role.STUDENT)
+        self.ticket = Ticket.objects.create(
+            user=self.student, department='Informatics', type_of_issue='Access',
+            additional_details='<p>My <strong>eduroam</strong> login fails</p>', assigned_to=self.staff,
+        )
+        self.reply = Reply.objects.create(
+            ticket=self.ticket, user=self.staff, body='Please reset your eduroam password & retry <today>',
+        )
+        self.other_ticket = Ticket.objects.create(
+            user=self.outsider, department='Engineering', type_of_issue='Wifi',
+            additional_details='eduroam drops in the lab', assigned_to=self.other_staff,
+        )
+
+    def _search(self, user, **params):
+        self.client.force_authenticate(user=user)
+        return self.client.get(self.URL, params)
+
+    def _hits(self, user, q):
+        response = self._search(user, q=q)
+        self.assertEqual(response.status_code, 200)
+        return {(row['ticket_id'], row['reply_id']) for row in response.data['results']}
+
+    def test_returns_replies_and_details_with_highlighted_snippets(self):
+        response = self._search(self.staff, q='edur')
+        results = {row['reply_id']: row for row in response.data['results']}
+        self.assertEqual(set(results), {None, self.reply.id})
+        self.assertIn('<mark>eduroam</mark>', results[self.reply.id]['snippet'])
+        self.assertIn('&amp;', results[self.reply.id]['snippet'])
+        self.assertIn('&lt;today&gt;', results[self.reply.id]['snippet'])
+        self.assertNotIn('<strong>', results[None]['snippet'])
+        self.assertIsInstance(results[None]['rank'], float)
+
+    def test_respects_conversation_access_rules(self):
+        own = {(self.ticket.id, None), (self.ticket.id, self.reply.id)}
+        other = {(self.other_ticket.id, None)}
+        self.assertEqual(self._hits(self.student, 'eduroam'), own)
+        self.assertEqual(self._hits(self.staff, 'eduroam'), own)
+        self.assertEqual(self._hits(self.other_staff, 'eduroam'), other)
+        self.assertEqual(self._hits(self.outsider, 'eduroam'), other)
+        self.assertEqual(self._hits(self.admin, 'eduroam'), own | other)
+
+    def test_cursor_pages_through_all_results_without_repeats(self):
+        seen, cursor = [], None
+        while True:
+            params = {'q': 'eduroam', 'page_size': 1}
+            if cursor:
+                params['cursor'] = cursor
+            response = self._search(self.admin, **params)
+            self.assertLessEqual(len(response.data['results']), 1)
+            seen += [(row['ticket_id'], row['reply_id']) for row in response.data['results']]
+            cursor = response.data['next']
+            if not cursor:
+                break
+        self.assertEqual(len(seen), 3)
+        self.assertEqual(len(set(seen)), 3)
+
+    def test_index_follows_reply_edits_and_deletes(self):
+        self.reply.body = 'Try the captive portal'
+        self.reply.save()
+        self.assertEqual(self._hits(self.staff, 'captive'), {(self.ticket.id, self.reply.id)})
+        self.reply.delete()
+        self.assertEqual(self._hits(self.staff, 'captive'), set())
+
+    def test_ticket_delete_removes_details_and_replies(self):
+        self.ticket.delete()
+        self.assertEqual(self._hits(self.admin, 'eduroam'), {(self.other_ticket.id, None)})
+
+    def test_requires_query_and_valid_cursor(self):
+        self.assertEqual(self._search(self.staff).status_code, 400)
+        self.assertEqual(self._search(self.staff, q='eduroam', cursor='bogus').status_code, 400)
+        response = self._search(self.staff, q='eduroam', page_size='abc')
+        self.assertEqual((response.status_code, response.data), (400, {'error': 'page_size must be an integer'}))
+        self.assertEqual(self._search(self.staff, q='eduroam', page_size=0).data['page_size'], 1)
+
+    def test_requires_authentication(self):
+        self.assertEqual(self.client.get(self.URL, {'q': 'eduroam'}).status_code, 401)
+
+    def test_migration_backfill_indexes_existing_conversations(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('SQLite only')
+        migration = import_module('KCLTicketingSystems.migrations.0009_conversation_search_index')
+        with connection.cursor() as cursor:
+            # Emptied rather than dropped: FTS5 DDL does not survive the test's rollback,
+            # and the SQLite schema editor refuses to open inside the test transaction.
+            cursor.execute(f'DELETE FROM "{migration.FTS_TABLE}"')
+            migration.create_index(apps, SimpleNamespace(connection=connection, execute=cursor.execute))
+        self.assertEqual(
+            self._hits(self.admin, 'eduroam'),
+            {(self.ticket.id, None), (self.ticket.id, self.reply.id), (self.other_ticket.id, None)},
+        )
+        self.assertEqual(self._hits(self.admin, 'strong'), set())
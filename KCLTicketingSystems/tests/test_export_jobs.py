@@ -0,0 +1,137 @@
+"""Tests for background export jobs."""
+
+import csv
+import io
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone as dt_timezone
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from ..models import ExportJob, Reply, Ticket, User
+from ..services import export_jobs
+
+
+class ExportJobTest(TestCase):
+    URL = '/api/admin/exports/'
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        override = override_settings(MEDIA_ROOT=self.media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.client = APIClient()
+        self.admin = User.objects.create_user(
+            username='admin', email='admin@test.com', password='pass', role=User.Role.ADMIN,
+        )
+        self.student = User.objects.create_user(
+            username='student', email='student@test.com', password='pass', role=User.Role.STUDENT,
+        )
+        for i in range(3):
+            Ticket.objects.create(
+                user=self.student, department='Informatics', type_of_issue=f'Issue {i}',
+                additional_details='Details',
+            )
+        self.client.force_authenticate(user=self.admin)
+
+    def _submit(self, export_type='tickets_csv', **extra):
+        return self.client.post(self.URL, {'export_type': export_type, 'days': 7, **extra}, format='json')
+
+    def _run_worker(self):
+        call_command('run_export_jobs', stdout=io.StringIO())
+
+    def _download_rows(self, job_id):
+        response = self.client.get(f'{self.URL}{job_id}/download/')
+        self.assertEqual(response.status_code, 200)
+        return list(csv.reader(io.StringIO(b''.join(response.streaming_content).decode('utf-8'))))
+
+    def test_submit_poll_download_tickets_export(self):
+        response = self._submit()
+        self.assertEqual(response.status_code, 202)
+        job_id = response.data['id']
+        self.assertEqual(response.data['status'], 'pending')
+        self.assertIsNone(response.data['download_url'])
+        self.assertEqual(self.client.get(f'{self.URL}{job_id}/download/').status_code, 409)
+
+        self._run_worker()
+
+        poll = self.client.get(f'{self.URL}{job_id}/')
+        self.assertEqual(poll.data['status'], 'done')
+        self.assertEqual(poll.data['download_url'], f'/api/admin/exports/{job_id}/download/')
+        rows = self._download_rows(job_id)
+        self.assertEqual(rows[0][0], 'Ticket ID')
+        self.assertEqual(len(rows), 4)
+
+    def test_statistics_export(self):
+        job_id = self._submit('statistics_csv').data['id']
+        self._run_worker()
+        rows = self._download_rows(job_id)
+        self.assertEqual(rows[0][0], 'Department')
+        self.assertEqual(rows[1][:2], ['Informatics', '3'])
+
+    def test_identical_request_reuses_stored_artifact(self):
+        first = self._submit().data['id']
+        self._run_worker()
+        repeat = self._submit()
+        self.assertEqual(repeat.status_code, 200)
+        self.assertEqual(repeat.data['id'], first)
+        self.assertEqual(repeat.data['status'], 'done')
+        self.assertEqual(ExportJob.objects.count(), 1)
+
+    def test_range_is_normalised_to_whole_hours(self):
+        start, end = export_jobs.normalise_range(
+            datetime(2026, 3, 1, 10, 5, tzinfo=dt_timezone.utc), datetime(2026, 3, 2, 16, 40, tzinfo=dt_timezone.utc),
+        )
+        self.assertEqual(start, datetime(2026, 3, 1, 10, tzinfo=dt_timezone.utc))
+        self.assertEqual(end, datetime(2026, 3, 2, 17, tzinfo=dt_timezone.utc))
+
+    def test_requests_within_the_same_hours_share_a_job(self):
+        first = self._submit(start_date='2026-03-01T10:05:00+00:00', end_date='2026-03-02T16:40:00+00:00')
+        second = self._submit(start_date='2026-03-01T10:45:00+00:00', end_date='2026-03-02T16:10:00+00:00')
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(first.data['id'], second.data['id'])
+
+    def test_data_change_produces_new_job(self):
+        first = self._submit().data['id']
+        self._run_worker()
+        Reply.objects.create(ticket=Ticket.objects.first(), user=self.admin, body='New reply')
+        second = self._submit()
+        self.assertEqual(second.status_code, 202)
+        self.assertNotEqual(second.data['id'], first)
+
+    def test_failed_job_records_error_and_is_not_reused(self):
+        self._submit()
+        with patch('KCLTicketingSystems.services.ticket_export.iter_ticket_csv', side_effect=RuntimeError('boom')), \
+                self.assertLogs('KCLTicketingSystems.services.export_jobs', 'ERROR'):
+            self._run_worker()
+        job = ExportJob.objects.get()
+        self.assertEqual((job.status, job.error), (ExportJob.Status.FAILED, 'boom'))
+        self.assertEqual(self._submit().status_code, 202)
+
+    def test_stale_running_job_is_requeued(self):
+        job_id = self._submit().data['id']
+        ExportJob.objects.filter(pk=job_id).update(
+            status=ExportJob.Status.RUNNING, started_at=timezone.now() - timedelta(hours=2),
+        )
+        self._run_worker()
+        self.assertEqual(ExportJob.objects.get(pk=job_id).status, ExportJob.Status.DONE)
+
+    def test_validation_and_permissions(self):
+        self.assertEqual(self._submit('pdf').status_code, 400)
+        self.assertEqual(self._submit(days='-1').status_code, 400)
+        self.client.force_authenticate(user=self.student)
+        self.assertEqual(self._submit().status_code, 403)
+
+    def test_missing_job_is_404_and_unexpected_errors_are_500(self):
+        self.assertEqual(self.client.get(f'{self.URL}999999/').status_code, 404)
+        self.assertEqual(self.client.get(f'{self.URL}999999/download/').status_code, 404)
+        with patch.object(export_jobs, 'submit_export_job', side_effect=Exception('boom')):
+            response = self._submit()
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.data, {'error': 'An internal server error occurred.'})
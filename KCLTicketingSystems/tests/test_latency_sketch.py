@@ -0,0 +1,33 @@
+"""Tests for the latency_sketch service."""
+
+from django.test import SimpleTestCase
+
+from ..services import latency_sketch
+
+
+class LatencySketchTests(SimpleTestCase):
+
+    def _sketch(self, values):
+        sketch = {}
+        for value in values:
+            latency_sketch.add(sketch, value)
+        return sketch
+
+    def test_quantiles_within_bucket_error(self):
+        values = [float(i * 60) for i in range(1, 1001)]
+        sketch = self._sketch(values)
+        for q, exact in ((0.5, 500 * 60), (0.9, 900 * 60), (0.99, 990 * 60)):
+            self.assertAlmostEqual(latency_sketch.quantile(sketch, q), exact, delta=exact * 0.05)
+
+    def test_merged_sketches_match_single_sketch(self):
+        first, second = [float(i) for i in range(0, 5000, 7)], [float(i) for i in range(3, 90000, 11)]
+        merged = latency_sketch.merge(self._sketch(first), self._sketch(second))
+        self.assertEqual(merged, self._sketch(first + second))
+
+    def test_sketch_keys_survive_json_round_trip(self):
+        sketch = self._sketch([0.0, 30.0, 3600.0])
+        self.assertTrue(all(isinstance(key, str) for key in sketch))
+        self.assertAlmostEqual(latency_sketch.quantile(sketch, 0.99), 3600, delta=3600 * 0.05)
+
+    def test_empty_sketch_has_no_percentiles(self):
+        self.assertEqual(latency_sketch.percentile_hours({}), {"p50": None, "p90": None, "p99": None})
@@ -0,0 +1,150 @@
+"""Tests for the notification outbox and the dispatch_notifications worker."""
+
+import io
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import DatabaseError, transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from ..models import Notification, NotificationOutboxEvent, Ticket, User
+from ..services import notification_outbox
+from ..utils import notify_on_ticket_update, notify_user_on_reply
+
+LOGGER = "KCLTicketingSystems.services.notification_outbox"
+_bulk_create = Notification.objects.bulk_create
+
+
+class NotificationOutboxTest(TestCase):
+    def setUp(self):
+        self.student = User.objects.create_user(
+            username="student", email="student@test.com", password="pass", role=User.Role.STUDENT,
+        )
+        self.staff = User.objects.create_user(
+            username="staff", email="staff@test.com", password="pass", role=User.Role.STAFF,
+        )
+        self.admin = User.objects.create_user(
+            username="admin", email="admin@test.com", password="pass", role=User.Role.ADMIN,
+        )
+        self.ticket = Ticket.objects.create(
+            user=self.student, department="Informatics", type_of_issue="Issue", assigned_to=self.staff,
+        )
+
+    def _dispatch(self):
+        out = io.StringIO()
+        call_command("dispatch_notifications", stdout=out)
+        return out.getvalue()
+
+    def test_reply_endpoint_queues_event_for_the_worker(self):
+        client = APIClient()
+        client.force_authenticate(user=self.staff)
+        response = client.post("/api/replies/create/", {"ticket": self.ticket.id, "body": "Hi"}, format="json")
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Notification.objects.exists())
+        self.assertEqual(NotificationOutboxEvent.objects.get().recipient_ids, [self.student.id])
+
+        output = self._dispatch()
+
+        self.assertIn("Dispatched 1 events (1 notifications)", output)
+        self.assertIn("Outbox: 0 pending", output)
+        self.assertEqual(Notification.objects.get().user, self.student)
+        event = NotificationOutboxEvent.objects.get()
+        self.assertEqual(event.status, NotificationOutboxEvent.Status.DONE)
+        self.assertIsNotNone(event.dispatched_at)
+
+    def test_rolled_back_transaction_queues_nothing(self):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                notify_user_on_reply(self.ticket, self.staff)
+                raise RuntimeError
+
+        self.assertFalse(NotificationOutboxEvent.objects.exists())
+
+    def test_admins_are_expanded_at_dispatch_time(self):
+        self.ticket.status = Ticket.Status.CLOSED
+        notify_on_ticket_update(self.ticket, self.admin)
+        late_admin = User.objects.create_user(
+            username="admin2", email="admin2@test.com", password="pass", role=User.Role.ADMIN,
+        )
+
+        notification_outbox.dispatch_pending()
+
+        self.assertCountEqual(
+            Notification.objects.values_list("user_id", flat=True),
+            [self.student.id, self.staff.id, late_admin.id],
+        )
+
+    def test_deleted_recipient_is_skipped(self):
+        notify_user_on_reply(self.ticket, self.staff)
+        gone = User.objects.create_user(username="gone", email="gone@test.com")
+        notification_outbox.enqueue([notification_outbox.event("Hello", "m", user_ids=[gone.id])])
+        gone.delete()
+
+        [result] = notification_outbox.dispatch_pending()
+
+        self.assertEqual((result.events, result.notifications, result.retried), (2, 1, 0))
+
+    def test_failing_event_is_retried_without_blocking_the_batch(self):
+        notification_outbox.enqueue([
+            notification_outbox.event("Good", "m", user_ids=[self.student.id]),
+            notification_outbox.event("Bad", "m", user_ids=[self.staff.id]),
+        ])
+
+        def reject_bad(rows, *args, **kwargs):
+            if any(row.title == "Bad" for row in rows):
+                raise DatabaseError("boom")
+            return _bulk_create(rows, *args, **kwargs)
+
+        with patch.object(Notification.objects, "bulk_create", side_effect=reject_bad), self.assertLogs(LOGGER, "WARNING"):
+            [result] = notification_outbox.dispatch_pending()
+
+        self.assertEqual((result.events, result.retried, result.failed), (1, 1, 0))
+        self.assertEqual(list(Notification.objects.values_list("title", flat=True)), ["Good"])
+        bad = NotificationOutboxEvent.objects.get(title="Bad")
+        self.assertEqual((bad.status, bad.attempts, bad.last_error), (NotificationOutboxEvent.Status.PENDING, 1, "boom"))
+        self.assertGreater(bad.available_at, timezone.now())
+
+    @override_settings(NOTIFICATION_OUTBOX_MAX_ATTEMPTS=2)
+    def test_event_fails_after_max_attempts(self):
+        notify_user_on_reply(self.ticket, self.staff)
+        event = NotificationOutboxEvent.objects.get()
+
+        with patch.object(Notification.objects, "bulk_create", side_effect=DatabaseError("boom")), \
+                self.assertLogs(LOGGER, "WARNING") as logs:
+            notification_outbox.dispatch_pending()
+            NotificationOutboxEvent.objects.filter(pk=event.pk).update(available_at=timezone.now())
+            [result] = notification_outbox.dispatch_pending()
+
+        self.assertEqual(result.failed, 1)
+        self.assertIn("failed after 2 attempts", logs.output[-1])
+        event.refresh_from_db()
+        self.assertEqual((event.status, event.attempts), (NotificationOutboxEvent.Status.FAILED, 2))
+        self.assertEqual(notification_outbox.outbox_stats().failed, 1)
+
+    def test_batches_respect_batch_size_and_report_lag(self):
+        for _ in range(5):
+            notify_user_on_reply(self.ticket, self.staff)
+        NotificationOutboxEvent.objects.update(created_at=timezone.now() - timedelta(minutes=2))
+
+        stats = notification_outbox.outbox_stats()
+        self.assertEqual(stats.pending, 5)
+        self.assertGreaterEqual(stats.oldest_pending_seconds, 120)
+
+        results = notification_outbox.dispatch_pending(batch_size=2)
+
+        self.assertEqual([result.events for result in results], [2, 2, 1])
+        self.assertGreaterEqual(results[0].lag_seconds, 120)
+        self.assertEqual(Notification.objects.count(), 5)
+
+    def test_old_dispatched_events_are_purged(self):
+        notify_user_on_reply(self.ticket, self.staff)
+        notification_outbox.dispatch_pending()
+        NotificationOutboxEvent.objects.update(dispatched_at=timezone.now() - timedelta(days=8))
+
+        self._dispatch()
+
+        self.assertFalse(NotificationOutboxEvent.objects.exists())
+        self.assertEqual(Notification.objects.count(), 1)
@@ -0,0 +1,82 @@
+"""Tests for cursor-paged, filtered reads of notifications_list."""
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from ..models import Notification, Ticket, User
+
+
+class NotificationPagesTest(TestCase):
+    URL = "/api/notifications/"
+
+    def setUp(self):
+        self.student = User.objects.create_user(
+            username="student", email="student@test.com", password="pass", role=User.Role.STUDENT,
+        )
+        self.ticket = Ticket.objects.create(user=self.student, department="Informatics", type_of_issue="Issue")
+        start = timezone.now() - timedelta(hours=1)
+        Notification.objects.bulk_create(
+            Notification(user=self.student, title=f"N{i}", message="m", is_read=i % 2 == 0, ticket=self.ticket)
+            for i in range(7)
+        )
+        # Distinct timestamps, N6 newest.
+        for i, notification in enumerate(Notification.objects.order_by("id")):
+            Notification.objects.filter(pk=notification.pk).update(created_at=start + timedelta(minutes=i))
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.student)
+
+    def _titles(self, response):
+        return [row["title"] for row in response.data["notifications"]]
+
+    def test_without_parameters_returns_full_list(self):
+        response = self.client.get(self.URL)
+        self.assertEqual(len(response.data), 7)
+        self.assertEqual(response.data[0]["title"], "N6")
+        self.assertEqual(response.data[0]["ticket_id"], self.ticket.id)
+
+    def test_cursor_walks_every_notification_once(self):
+        first = self.client.get(self.URL, {"limit": 3})
+        self.assertEqual(self._titles(first), ["N6", "N5", "N4"])
+        self.assertIsNone(first.data["prev"])
+
+        second = self.client.get(self.URL, {"limit": 3, "cursor": first.data["next"]})
+        third = self.client.get(self.URL, {"limit": 3, "cursor": second.data["next"]})
+        self.assertEqual(self._titles(second) + self._titles(third), ["N3", "N2", "N1", "N0"])
+        self.assertIsNone(third.data["next"])
+
+        back = self.client.get(self.URL, {"limit": 3, "cursor": second.data["prev"]})
+        self.assertEqual(self._titles(back), ["N6", "N5", "N4"])
+
+    def test_unread_only_and_since_filters(self):
+        unread = self.client.get(self.URL, {"unread_only": "1"})
+        self.assertEqual(self._titles(unread), ["N5", "N3", "N1"])
+
+        since = Notification.objects.get(title="N4").created_at
+        newer = self.client.get(self.URL, {"since": since.isoformat()})
+        self.assertEqual(self._titles(newer), ["N6", "N5"])
+
+        both = self.client.get(self.URL, {"since": since.isoformat(), "unread_only": "true"})
+        self.assertEqual(self._titles(both), ["N5"])
+
+    def test_page_reads_are_one_query_of_plain_columns(self):
+        Notification.objects.bulk_create(Notification(user=self.student, title="More", message="m") for _ in range(200))
+        with self.assertNumQueries(1):
+            response = self.client.get(self.URL, {"limit": 100})
+        self.assertEqual(len(response.data["notifications"]), 100)
+        self.assertEqual(
+            set(response.data["notifications"][0]),
+            {"id", "title", "message", "is_read", "ticket_id", "meeting_request_id", "created_at"},
+        )
+
+    def test_limit_is_clamped_and_bad_input_is_400(self):
+        self.assertEqual(self.client.get(self.URL, {"limit": 1000}).data["limit"], 100)
+        self.assertEqual(self.client.get(self.URL, {"cursor": "not-a-cursor"}).status_code, 400)
+        self.assertEqual(self.client.get(self.URL, {"since": "yesterday"}).status_code, 400)
+
+    def test_pages_only_show_own_notifications(self):
+        other = User.objects.create_user(username="other", email="other@test.com", password="pass")
+        self.client.force_authenticate(user=other)
+        self.assertEqual(self.client.get(self.URL, {"limit": 5}).data["notifications"], [])
@@ -0,0 +1,119 @@
+"""Tests for the SSE / long-poll notification stream."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+from asgiref.sync import sync_to_async
+from django.test import AsyncClient, TestCase, TransactionTestCase, override_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from ..models import Notification, User
+
+URL = "/api/notifications/stream/"
+
+
+def _events(body):
+    """Parse ``(id, data)`` pairs from an SSE body, skipping comments and ``retry``."""
+    events = []
+    for frame in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in frame.split("\n") if not line.startswith(":"))
+        if "id" in fields:
+            events.append((int(fields["id"]), json.loads(fields["data"])))
+    return events
+
+
+@override_settings(
+    NOTIFICATION_STREAM_POLL_INTERVAL=0.01,
+    NOTIFICATION_STREAM_HEARTBEAT=0.02,
+    NOTIFICATION_STREAM_MAX_SECONDS=0.05,
+    NOTIFICATION_LONG_POLL_TIMEOUT=0.05,
+)
+class NotificationStreamTest(TestCase):
+    def setUp(self):
+        self._create_fixtures()
+
+    def _create_fixtures(self):
+        self.student = User.objects.create_user(
+            username="student", email="student@test.com", password="pass", role=User.Role.STUDENT,
+        )
+        self.other = User.objects.create_user(username="other", email="other@test.com", password="pass")
+        self.first, self.second, self.third = (
+            Notification.objects.create(user=self.student, title=f"N{i}", message="m") for i in range(3)
+        )
+        Notification.objects.create(user=self.other, title="Not yours", message="m")
+        self.client = AsyncClient()
+        self.auth = {"Authorization": f"Bearer {RefreshToken.for_user(self.student).access_token}"}
+
+    async def _get(self, params=None, **headers):
+        return await self.client.get(URL, params, headers={**self.auth, **headers})
+
+    async def _stream(self, **headers):
+        response = await self._get(**{"Accept": "text/event-stream", **headers})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        body = "".join([chunk.decode() async for chunk in response.streaming_content])
+        return body
+
+    async def test_stream_resumes_after_last_event_id(self):
+        body = await self._stream(**{"Last-Event-ID": str(self.first.id)})
+
+        self.assertTrue(body.startswith("retry: "))
+        events = _events(body)
+        self.assertEqual([event_id for event_id, _ in events], [self.second.id, self.third.id])
+        self.assertEqual(events[0][1]["title"], "N1")
+        self.assertIn("ticket_id", events[0][1])
+
+    async def test_stream_without_cursor_sends_only_new_notifications_and_keepalives(self):
+        body = await self._stream()
+
+        self.assertEqual(_events(body), [])
+        self.assertIn(": keepalive", body)
+
+    async def test_long_poll_returns_waiting_notifications(self):
+        response = await self._get({"last_event_id": self.second.id})
+
+        data = response.json()
+        self.assertEqual([row["id"] for row in data["notifications"]], [self.third.id])
+        self.assertEqual(data["last_event_id"], self.third.id)
+
+    async def test_long_poll_times_out_with_same_cursor(self):
+        response = await self._get({"last_event_id": self.third.id, "timeout": 1})
+        self.assertEqual(response.json(), {"notifications": [], "last_event_id": self.third.id})
+
+    async def test_long_poll_without_cursor_returns_current_cursor(self):
+        response = await self._get()
+        self.assertEqual(response.json(), {"notifications": [], "last_event_id": self.third.id})
+
+    async def test_requires_valid_token_and_cursor(self):
+        self.assertEqual((await self.client.get(URL)).status_code, 401)
+        self.assertEqual((await self.client.get(URL, headers={"Authorization": "Bearer nope"})).status_code, 401)
+        self.assertEqual((await self._get({"last_event_id": "abc"})).status_code, 400)
+        self.assertEqual((await self.client.post(URL, headers=self.auth)).status_code, 405)
+
+
+@override_settings(NOTIFICATION_STREAM_POLL_INTERVAL=0.01, NOTIFICATION_LONG_POLL_TIMEOUT=5)
+class NotificationLongPollWakeUpTest(TransactionTestCase):
+    """Commits for real, so a write from another thread is visible to the waiting request."""
+
+    setUp = NotificationStreamTest._create_fixtures
+    _get = NotificationStreamTest._get
+
+    async def test_long_poll_wakes_for_notification_created_while_waiting(self):
+        async def notify_later():
+            await asyncio.sleep(0.05)
+            # Another thread and connection: the main one is busy serving the waiting request.
+            create = sync_to_async(Notification.objects.create, thread_sensitive=False)
+            return await create(user=self.student, title="Later", message="m")
+
+        response, created = await asyncio.gather(self._get({"last_event_id": self.third.id}), notify_later())
+        self.assertEqual([row["title"] for row in response.json()["notifications"]], ["Later"])
+        self.assertEqual(response.json()["last_event_id"], created.id)
+
+    async def test_connection_is_closed_while_waiting(self):
+        with patch("KCLTicketingSystems.services.notification_stream.connection") as connection:
+            connection.in_atomic_block = False
+            response = await self._get({"last_event_id": self.third.id, "timeout": 0.05})
+
+        self.assertEqual(response.json()["notifications"], [])
+        self.assertGreater(connection.close.call_count, 0)
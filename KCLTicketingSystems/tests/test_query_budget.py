@@ -0,0 +1,224 @@
+"""
+Per-endpoint query budget: every API route must run the same number of
+queries at N and 10N seeded rows (see ``query_budget`` for the harness and
+the ``QUERY_BUDGET_REPORT`` report).
+"""
+
+import shutil
+import tempfile
+from datetime import datetime, time, timedelta
+from itertools import count
+
+from django.test import TestCase, override_settings
+from django.urls import URLPattern, get_resolver
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework.views import APIView
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from ..models import ExportJob, MeetingRequest, Notification, OfficeHours, Reply, Ticket, User
+from ..services import export_jobs
+from .query_budget import QueryBudgetReport, measure, seed
+
+N = 3
+
+# API routes that are not measured, with the reason.
+UNMEASURED_ROUTES = {
+    "api/ai-chatbot/chat/": "calls the external Gemini API",
+}
+
+
+def _api_routes(patterns=None, prefix=""):
+    """Full route strings of every DRF view in the project URLconf."""
+    routes = set()
+    for pattern in get_resolver().url_patterns if patterns is None else patterns:
+        route = prefix + str(pattern.pattern)
+        if isinstance(pattern, URLPattern):
+            view_class = getattr(pattern.callback, "cls", None)
+            if view_class and issubclass(view_class, APIView):
+                routes.add(route)
+        else:
+            routes |= _api_routes(pattern.url_patterns, route)
+    return routes
+
+
+class QueryBudgetTest(TestCase):
+    report = QueryBudgetReport()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.report.write()
+        super().tearDownClass()
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        override = override_settings(MEDIA_ROOT=media_root)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        self.serial = count()
+        self.admin = User.objects.create_user(
+            username="admin", email="admin@test.com", password="pass", role=User.Role.ADMIN,
+        )
+        self.staff = User.objects.create_user(
+            username="staff", email="staff@test.com", password="pass", role=User.Role.STAFF,
+            department="Informatics",
+        )
+        self.student = User.objects.create_user(
+            username="student", email="student@test.com", password="pass", role=User.Role.STUDENT,
+        )
+        self.ticket = self._ticket()
+        self.closed_ticket = self._ticket(status=Ticket.Status.CLOSED, closed_by=self.student)
+        self.day = timezone.localdate() + timedelta(days=7)
+
+    def _ticket(self, **extra):
+        return Ticket.objects.create(
+            user=self.student, department="Informatics", type_of_issue="Issue", assigned_to=self.staff, **extra,
+        )
+
+    def _busy_ticket(self, scale):
+        """A fresh open ticket for write endpoints, with ``scale`` replies."""
+        ticket = self._ticket()
+        Reply.objects.bulk_create(Reply(ticket=ticket, user=self.staff, body=f"Reply {i}") for i in range(scale))
+        return ticket
+
+    def _pending_meeting(self):
+        OfficeHours.objects.get_or_create(
+            staff=self.staff, day_of_week=self.day.strftime("%A"), start_time=time(14), end_time=time(15),
+        )
+        return MeetingRequest.objects.create(
+            student=self.student, staff=self.staff, description="Chat",
+            meeting_datetime=timezone.make_aware(datetime.combine(self.day, time(14))),
+        )
+
+    def _finished_export(self):
+        end = timezone.now()
+        job, _ = export_jobs.submit_export_job(ExportJob.ExportType.TICKETS_CSV, end - timedelta(days=30), end)
+        export_jobs.run_export_job(job)
+        return job
+
+    def _register(self):
+        i = next(self.serial)
+        return {
+            "username": f"new-{i}", "email": f"new-{i}@test.com", "password": "long-password",
+            "k_number": f"{i:08d}", "first_name": "New", "last_name": "User",
+        }
+
+    def _endpoints(self, scale=N):
+        """``{route: (user, method, url, data)}``; built just before each measurement."""
+        s, st, a = self.student, self.staff, self.admin
+        ticket, notification = self.ticket.id, Notification.objects.create(user=s, title="t", message="m").id
+        gone = f"gone-{next(self.serial)}"
+        fresh_user = User.objects.create_user(username=gone, email=f"{gone}@test.com")
+        return {
+            # KCLTicketingSystems/urls.py
+            "api/auth/register/": (None, "POST", "/api/auth/register/", self._register()),
+            "api/auth/token/": (None, "POST", "/api/auth/token/", {"username": "student", "password": "pass"}),
+            "api/auth/token/refresh/": (None, "POST", "/api/auth/token/refresh/", {"refresh": str(RefreshToken.for_user(s))}),
+            "api/users/me/": (s, "GET", "/api/users/me/", None),
+            "api/staff-dashboard/": (st, "GET", "/api/staff-dashboard/", {"filtering": "all"}),
+            "api/replies/create/": (s, "POST", "/api/replies/create/", {"ticket": self._busy_ticket(scale).id, "body": "More"}),
+            "api/tickets/<int:ticket_id>/replies/": (s, "GET", f"/api/tickets/{ticket}/replies/", None),
+            "api/conversations/search/": (st, "GET", "/api/conversations/search/", {"q": "reply"}),
+            "api/tickets/": (s, "POST", "/api/tickets/", {"department": "Informatics", "type_of_issue": "New", "additional_details": "Help"}),
+            "api/tickets/<int:pk>": (s, "GET", f"/api/tickets/{ticket}", None),
+            "api/notifications/": (s, "GET", "/api/notifications/", None),
+            "api/notifications/<int:pk>/read/": (s, "POST", f"/api/notifications/{notification}/read/", None),
+            "api/notifications/unread-count/": (s, "GET", "/api/notifications/unread-count/", None),
+            "api/staff/": (s, "GET", "/api/staff/", None),
+            "api/staff/<int:staff_id>/": (s, "GET", f"/api/staff/{st.id}/", None),
+            "api/tickets/<int:ticket_id>/pdf/": (s, "GET", f"/api/tickets/{self.closed_ticket.id}/pdf/", None),
+            # KCLTicketingSystem/urls.py
+            "api/submit-ticket/": (None, "POST", "/api/submit-ticket/", {
+                "name": "Ann", "surname": "Lee", "k_number": "12345678", "k_email": "K12345678@kcl.ac.uk",
+                "department": "Informatics", "type_of_issue": "Access", "additional_details": "Help",
+            }),
+            "api/admin/dashboard/stats/": (a, "GET", "/api/admin/dashboard/stats/", None),
+            "api/admin/tickets/": (a, "GET", "/api/admin/tickets/", {"page_size": 50}),
+            "api/admin/tickets/<int:ticket_id>/": (a, "GET", f"/api/admin/tickets/{ticket}/", None),
+            "api/admin/tickets/<int:ticket_id>/update/": (
+                a, "PATCH", f"/api/admin/tickets/{self._busy_ticket(scale).id}/update/", {"status": "closed"},
+            ),
+            "api/admin/tickets/<int:ticket_id>/delete/": (
+                a, "DELETE", f"/api/admin/tickets/{self._busy_ticket(scale).id}/delete/", None,
+            ),
+            "api/admin/users/": (a, "GET", "/api/admin/users/", {"page_size": 50}),
+            "api/admin/users/<int:user_id>/": (a, "GET", f"/api/admin/users/{s.id}/", None),
+            "api/admin/users/<int:user_id>/update/": (a, "PATCH", f"/api/admin/users/{s.id}/update/", {"first_name": "Stu"}),
+            "api/admin/users/<int:user_id>/delete/": (a, "DELETE", f"/api/admin/users/{fresh_user.id}/delete/", None),
+            "api/admin/staff/": (a, "GET", "/api/admin/staff/", None),
+            "api/admin/statistics/": (a, "GET", "/api/admin/statistics/", None),
+            "api/admin/statistics/series/": (a, "GET", "/api/admin/statistics/series/", None),
+            "api/admin/export/statistics-csv/": (a, "GET", "/api/admin/export/statistics-csv/", None),
+            "api/admin/export/tickets-csv/": (a, "GET", "/api/admin/export/tickets-csv/", None),
+            "api/admin/export/tickets-ndjson/": (a, "GET", "/api/admin/export/tickets-ndjson/", {"include_replies": "1"}),
+            "api/admin/exports/": (a, "POST", "/api/admin/exports/", {"export_type": "tickets_csv", "days": next(self.serial) + 1}),
+            "api/admin/exports/<int:job_id>/": (a, "GET", f"/api/admin/exports/{self._finished_export().id}/", None),
+            "api/admin/exports/<int:job_id>/download/": (
+                a, "GET", f"/api/admin/exports/{self._finished_export().id}/download/", None,
+            ),
+            "api/staff/dashboard/": (st, "GET", "/api/staff/dashboard/", {"filtering": "all"}),
+            "api/staff/dashboard/<int:ticket_id>/": (st, "GET", f"/api/staff/dashboard/{ticket}/", None),
+            "api/staff/dashboard/<int:ticket_id>/update/": (
+                st, "PATCH", f"/api/staff/dashboard/{self._busy_ticket(scale).id}/update/", {"status": "closed"},
+            ),
+            "api/staff/dashboard/reply/<int:ticket_id>/": (st, "GET", f"/api/staff/dashboard/reply/{ticket}/", None),
+            "api/staff/list/": (st, "GET", "/api/staff/list/", None),
+            "api/staff/dashboard/<int:ticket_id>/reassign/": (
+                st, "PATCH", f"/api/staff/dashboard/{self._busy_ticket(scale).id}/reassign/", {"assigned_to": st.id},
+            ),
+            "api/staff/dashboard/meeting-requests/": (st, "GET", "/api/staff/dashboard/meeting-requests/", None),
+            "api/staff/dashboard/meeting-requests/<int:request_id>/accept/": (
+                st, "POST", f"/api/staff/dashboard/meeting-requests/{self._pending_meeting().id}/accept/", None,
+            ),
+            "api/staff/dashboard/meeting-requests/<int:request_id>/deny/": (
+                st, "POST", f"/api/staff/dashboard/meeting-requests/{self._pending_meeting().id}/deny/", None,
+            ),
+            "api/staff/office-hours/": (st, "GET", "/api/staff/office-hours/", None),
+            "api/staff/office-hours/<int:hours_id>/": (
+                st, "DELETE",
+                f"/api/staff/office-hours/{OfficeHours.objects.create(staff=st, day_of_week='Friday', start_time=time(8), end_time=time(9)).id}/",
+                None,
+            ),
+            "api/meeting-requests/": (s, "GET", "/api/meeting-requests/", None),
+            "api/staff/<int:staff_id>/available-slots/": (
+                s, "GET", f"/api/staff/{st.id}/available-slots/", {"date": self.day.isoformat()},
+            ),
+            "api/dashboard/": (s, "GET", "/api/dashboard/", None),
+            "api/dashboard/tickets/<int:ticket_id>/close/": (
+                s, "POST", f"/api/dashboard/tickets/{self._busy_ticket(scale).id}/close/", None,
+            ),
+            "notifications/": (s, "GET", "/notifications/", None),
+            "notifications/<int:pk>/read/": (s, "POST", f"/notifications/{notification}/read/", None),
+            "notifications/unread-count/": (s, "GET", "/notifications/unread-count/", None),
+        }
+
+    def _measure_all(self, scale, record=True):
+        counts = {}
+        for route, (user, method, url, data) in self._endpoints(scale).items():
+            client = APIClient()
+            if user is not None:
+                client.force_authenticate(user=user)
+            response, measurement = measure(client, method, url, data)
+            self.assertLess(response.status_code, 400, f"{method} {url}: {getattr(response, 'data', response)}")
+            if record:
+                self.report.add(route, scale, measurement)
+            counts[route] = measurement.queries
+        return counts
+
+    def test_every_api_route_is_measured(self):
+        self.assertEqual(set(self._endpoints()), _api_routes() - set(UNMEASURED_ROUTES))
+
+    def test_query_counts_do_not_grow_with_data(self):
+        tickets = [self.ticket, self.closed_ticket]
+        seed(N, self.student, self.staff, tickets, prefix="small")
+        # Warm-up: first writes create counter rows and fill caches once.
+        self._measure_all(N, record=False)
+        small = self._measure_all(N)
+
+        seed(9 * N, self.student, self.staff, tickets, prefix="large")
+        large = self._measure_all(10 * N)
+
+        grew = {route: (small[route], large[route]) for route in small if large[route] != small[route]}
+        self.assertEqual(grew, {}, "query count changed between N and 10N rows (route: (N, 10N))")
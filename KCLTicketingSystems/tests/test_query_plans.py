@@ -0,0 +1,120 @@
+"""
+Query-plan regression tests (SQLite).
+
+Each test calls an endpoint, captures the SELECTs it runs and checks
+``EXPLAIN QUERY PLAN`` for every one that reads a hot table: none may fall
+back to a full scan. ``SCAN <table>`` is a table scan; ``SCAN <table> USING
+INDEX`` walks a whole index and only counts as acceptable for unfiltered lists.
+"""
+
+import re
+from datetime import datetime, time, timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from ..models import MeetingRequest, Notification, OfficeHours, Reply, Ticket, User
+
+HOT_TABLES = {
+    model._meta.db_table
+    for model in (Ticket, Reply, Notification, MeetingRequest, OfficeHours)
+}
+FULL_SCAN = re.compile(r'^SCAN (\w+)( USING (?:COVERING )?INDEX \w+)?$')
+
+
+class QueryPlanRegressionTest(TestCase):
+
+    def setUp(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('EXPLAIN QUERY PLAN checks run on SQLite')
+        self.client = APIClient()
+        self.admin = User.objects.create_user(
+            username='admin', email='admin@test.com', password='pass', role=User.Role.ADMIN,
+        )
+        self.staff = User.objects.create_user(
+            username='staff', email='staff@test.com', password='pass', role=User.Role.STAFF,
+        )
+        self.student = User.objects.create_user(
+            username='student', email='student@test.com', password='pass', role=User.Role.STUDENT,
+        )
+        self.ticket = Ticket.objects.create(
+            user=self.student, department='Informatics', type_of_issue='Access',
+            additional_details='Details', assigned_to=self.staff,
+        )
+        Reply.objects.create(ticket=self.ticket, user=self.staff, body='Hello')
+        Notification.objects.create(user=self.student, title='t', message='m', ticket=self.ticket)
+        OfficeHours.objects.create(
+            staff=self.staff, day_of_week='Monday', start_time=time(9), end_time=time(10),
+        )
+        today = timezone.localdate()
+        self.next_monday = today + timedelta(days=7 - today.weekday())
+        MeetingRequest.objects.create(
+            student=self.student, staff=self.staff, description='Chat',
+            meeting_datetime=timezone.make_aware(datetime.combine(self.next_monday, time(9, 15))),
+        )
+
+    def _plan_details(self, sql):
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            return [row[-1] for row in cursor.fetchall()]
+
+    def _full_scans(self, sql, allow_index_scan=False):
+        scans = (FULL_SCAN.match(detail) for detail in self._plan_details(sql))
+        return [
+            match.group(0) for match in scans
+            if match and match.group(1) in HOT_TABLES and not (allow_index_scan and match.group(2))
+        ]
+
+    def assertNoFullScans(self, user, url, params=None, allow_index_scan=False):
+        self.client.force_authenticate(user=user)
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, 200, url)
+        selects = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('SELECT')]
+        self.assertTrue(selects, url)
+        for sql in selects:
+            self.assertEqual(self._full_scans(sql, allow_index_scan), [], f'{url}: full scan in {sql}')
+
+    def test_admin_ticket_list_status_filter(self):
+        self.assertNoFullScans(self.admin, '/api/admin/tickets/', {'status': 'pending'})
+
+    def test_admin_ticket_list_department_filter(self):
+        self.assertNoFullScans(self.admin, '/api/admin/tickets/', {'department': 'Informatics'})
+
+    def test_admin_ticket_list_assignee_filter(self):
+        self.assertNoFullScans(self.admin, '/api/admin/tickets/', {'assigned_to': self.staff.id, 'status': 'pending'})
+
+    def test_admin_ticket_list_unfiltered_uses_created_at_index(self):
+        self.assertNoFullScans(self.admin, '/api/admin/tickets/', allow_index_scan=True)
+
+    def test_staff_dashboard(self):
+        self.assertNoFullScans(self.staff, '/api/staff/dashboard/', {'filtering': 'open'})
+
+    def test_ticket_replies(self):
+        self.assertNoFullScans(self.student, f'/api/tickets/{self.ticket.id}/replies/')
+
+    def test_notifications_list(self):
+        self.assertNoFullScans(self.student, '/api/notifications/')
+
+    def test_notifications_pages(self):
+        self.assertNoFullScans(self.student, '/api/notifications/', {'limit': 5})
+        self.assertNoFullScans(self.student, '/api/notifications/', {'unread_only': '1', 'since': '2020-01-01T00:00:00'})
+
+    def test_staff_meeting_requests(self):
+        self.assertNoFullScans(self.staff, '/api/staff/dashboard/meeting-requests/')
+
+    def test_staff_available_slots(self):
+        self.assertNoFullScans(
+            self.student, f'/api/staff/{self.staff.id}/available-slots/', {'date': self.next_monday.isoformat()},
+        )
+
+    def test_detects_full_scans(self):
+        table = Ticket._meta.db_table
+        sql = f'SELECT * FROM "{table}" WHERE "type_of_issue" = \'x\''
+        self.assertEqual(self._full_scans(sql), [f'SCAN {table}'])
+        ordered = f'SELECT * FROM "{table}" WHERE "type_of_issue" = \'x\' ORDER BY "created_at", "id"'
+        self.assertEqual(len(self._full_scans(ordered)), 1)
+        self.assertEqual(self._full_scans(ordered, allow_index_scan=True), [])
@@ -82,3 +82,25 @@ class ReplyModelTest(TestCase):
         reply = Reply.objects.create(**self.reply_data)
         self.assertIsNotNone(reply.created_at)
         self.assertIsInstance(reply.created_at, datetime)
+
+    def test_staff_reply_updates_ticket_last_reply_metadata(self):
+        """Creating a staff reply records it as the ticket's latest reply"""
+        reply = Reply.objects.create(**self.reply_data)
+        ticket = Ticket.objects.get(pk=reply.ticket_id)
+        self.assertEqual(ticket.last_reply_at, reply.created_at)
+        self.assertTrue(ticket.last_reply_by_staff)
+
+    def test_student_reply_clears_last_reply_by_staff(self):
+        """A later student reply flips last_reply_by_staff back to False"""
+        Reply.objects.create(**self.reply_data)
+        Reply.objects.create(user=self.student, ticket=self.reply_data["ticket"], body="Still broken")
+        ticket = Ticket.objects.get(pk=self.reply_data["ticket"].pk)
+        self.assertFalse(ticket.last_reply_by_staff)
+
+    def test_editing_reply_does_not_touch_ticket_metadata(self):
+        """Only inserts update the denormalised columns"""
+        reply = Reply.objects.create(**self.reply_data)
+        Ticket.objects.filter(pk=reply.ticket_id).update(last_reply_at=None)
+        reply.body = "Edited"
+        reply.save()
+        self.assertIsNone(Ticket.objects.get(pk=reply.ticket_id).last_reply_at)
@@ -0,0 +1,101 @@
+"""Tests for incremental (after/limit/before) reply reads."""
+
+from datetime import timedelta
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from ..models import Reply, Ticket, User
+
+
+class IncrementalRepliesTest(TestCase):
+    def setUp(self):
+        self.student = User.objects.create_user(
+            username="student", email="student@test.com", password="pass", role=User.Role.STUDENT,
+        )
+        self.staff = User.objects.create_user(
+            username="staff", email="staff@test.com", password="pass", role=User.Role.STAFF,
+        )
+        self.ticket = Ticket.objects.create(
+            user=self.student, department="Informatics", type_of_issue="Issue", assigned_to=self.staff,
+        )
+        self.start = timezone.now() - timedelta(hours=1)
+        self.replies = [self._reply(f"Reply {i}", minutes=i) for i in range(5)]
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.student)
+        self.url = f"/api/tickets/{self.ticket.id}/replies/"
+
+    def _reply(self, body, minutes, parent=None):
+        reply = Reply.objects.create(ticket=self.ticket, user=self.staff, body=body, parent=parent)
+        Reply.objects.filter(pk=reply.pk).update(created_at=self.start + timedelta(minutes=minutes))
+        return reply
+
+    def _bodies(self, response):
+        return [reply["body"] for reply in response.data["replies"]]
+
+    def test_after_reply_id_returns_only_new_replies(self):
+        response = self.client.get(self.url, {"after": self.replies[2].id})
+
+        self.assertEqual(self._bodies(response), ["Reply 3", "Reply 4"])
+        self.assertEqual(response.data["latest"], self.replies[4].id)
+
+    def test_after_latest_is_empty_until_a_new_reply(self):
+        latest = self.replies[4].id
+        self.assertEqual(self._bodies(self.client.get(self.url, {"after": latest})), [])
+
+        nested = self._reply("Nested", minutes=10, parent=self.replies[1])
+        response = self.client.get(self.url, {"after": latest})
+        self.assertEqual(self._bodies(response), ["Nested"])
+        self.assertEqual(response.data["replies"][0]["parent"], self.replies[1].id)
+        self.assertEqual(response.data["latest"], nested.id)
+
+    def test_latest_echoes_parsed_cursor_when_nothing_is_new(self):
+        latest = self.replies[4].id
+        self.assertEqual(self.client.get(self.url, {"after": str(latest)}).json()["latest"], latest)
+
+        moment = timezone.now()
+        response = self.client.get(self.url, {"after": moment.isoformat()})
+        self.assertEqual(response.data["latest"], moment)
+
+    def test_after_timestamp_is_exclusive(self):
+        moment = (self.start + timedelta(minutes=3)).isoformat()
+        self.assertEqual(self._bodies(self.client.get(self.url, {"after": moment})), ["Reply 4"])
+
+    def test_limit_pages_backwards(self):
+        first = self.client.get(self.url, {"limit": 2})
+        self.assertEqual(self._bodies(first), ["Reply 3", "Reply 4"])
+
+        second = self.client.get(self.url, {"limit": 2, "before": first.data["before"]})
+        self.assertEqual(self._bodies(second), ["Reply 1", "Reply 2"])
+
+        last = self.client.get(self.url, {"limit": 2, "before": second.data["before"]})
+        self.assertEqual(self._bodies(last), ["Reply 0"])
+        self.assertIsNone(last.data["before"])
+
+    def test_poll_query_count_independent_of_thread_length(self):
+        with CaptureQueriesContext(connection) as short_thread:
+            self.client.get(self.url, {"after": self.replies[-1].id})
+        for i in range(20):
+            self._reply(f"Old {i}", minutes=-30 + i)
+
+        with self.assertNumQueries(len(short_thread)):
+            self.client.get(self.url, {"after": self.replies[-1].id})
+
+    def test_invalid_after_and_cursor(self):
+        self.assertEqual(self.client.get(self.url, {"after": "yesterday"}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"after": 999999}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"limit": 2, "before": "junk"}).status_code, 400)
+        response = self.client.get(self.url, {"limit": "two"})
+        self.assertEqual((response.status_code, response.data), (400, {"error": "limit must be an integer"}))
+
+    def test_staff_reply_details_supports_after(self):
+        self.client.force_authenticate(user=self.staff)
+        response = self.client.get(f"/api/staff/dashboard/reply/{self.ticket.id}/", {"after": self.replies[3].id})
+        self.assertEqual(self._bodies(response), ["Reply 4"])
+
+    def test_without_parameters_returns_full_tree(self):
+        response = self.client.get(self.url)
+        self.assertEqual(len(response.data), 5)
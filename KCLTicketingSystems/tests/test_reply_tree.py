@@ -0,0 +1,82 @@
+"""Tests for single-query reply tree assembly."""
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from ..models import Reply, Ticket, User
+from ..services.reply_tree import load_replies, reply_tree
+
+
+class ReplyTreeTest(TestCase):
+    def setUp(self):
+        self.student = User.objects.create_user(
+            username="student", email="student@test.com", password="pass", role=User.Role.STUDENT,
+        )
+        self.staff = User.objects.create_user(
+            username="staff", email="staff@test.com", password="pass", role=User.Role.STAFF,
+        )
+        self.ticket = Ticket.objects.create(
+            user=self.student, department="Informatics", type_of_issue="Issue", assigned_to=self.staff,
+        )
+        self.client = APIClient()
+
+    def _thread(self, depth, ticket=None):
+        parent = None
+        for level in range(depth):
+            author = self.staff if level % 2 else self.student
+            parent = Reply.objects.create(ticket=ticket or self.ticket, user=author, body=f"Level {level}", parent=parent)
+        return parent
+
+    def _query_count(self, user, url):
+        self.client.force_authenticate(user=user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def _depth(self, node):
+        return 1 + max((self._depth(child) for child in node["children"]), default=0)
+
+    def test_tree_is_nested_in_chronological_order(self):
+        self._thread(4)
+        Reply.objects.create(ticket=self.ticket, user=self.staff, body="Second root")
+
+        roots = reply_tree(self.ticket.id)
+
+        self.assertEqual([root.body for root in roots], ["Level 0", "Second root"])
+        self.assertEqual(roots[0].prefetched_children[0].prefetched_children[0].body, "Level 2")
+
+    def test_load_replies_groups_by_ticket_in_one_query(self):
+        other = Ticket.objects.create(user=self.student, department="Law", type_of_issue="Other")
+        self._thread(3)
+        self._thread(2, ticket=other)
+
+        with self.assertNumQueries(1):
+            replies = load_replies([self.ticket.id, other.id])
+            self.assertEqual([r.user.username for r in replies[other.id]], ["student", "staff"])
+        self.assertEqual(len(replies[self.ticket.id]), 3)
+
+    def test_views_query_count_independent_of_thread_depth(self):
+        urls = [
+            (self.staff, f"/api/staff/dashboard/reply/{self.ticket.id}/"),
+            (self.staff, f"/api/staff/dashboard/{self.ticket.id}/"),
+            (self.student, f"/api/tickets/{self.ticket.id}/replies/"),
+            (self.student, "/api/dashboard/"),
+        ]
+        self._thread(2)
+        shallow = [self._query_count(user, url) for user, url in urls]
+        self._thread(8)
+        deep = [self._query_count(user, url) for user, url in urls]
+
+        self.assertEqual(deep, shallow)
+
+    def test_ticket_replies_returns_full_depth(self):
+        self._thread(6)
+        self.client.force_authenticate(user=self.student)
+
+        response = self.client.get(f"/api/tickets/{self.ticket.id}/replies/")
+
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(self._depth(response.data[0]), 6)
@@ -0,0 +1,165 @@
+"""Tests for the daily department statistics rollup."""
+
+from datetime import timedelta
+from importlib import import_module
+from io import StringIO
+from unittest.mock import patch
+
+from django.apps import apps
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from ..models import DailyDepartmentStats, Reply, Ticket, User
+from ..services import statistics_rollup, statistics_service
+
+
+class DailyStatsRollupTest(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            username="admin", email="admin@test.com", password="pass", role=User.Role.ADMIN
+        )
+        self.staff = User.objects.create_user(
+            username="staff", email="staff@test.com", password="pass", role=User.Role.STAFF
+        )
+        self.student = User.objects.create_user(
+            username="student", email="student@test.com", password="pass", role=User.Role.STUDENT
+        )
+        self.now = timezone.now()
+        self.old = self._ticket("Informatics", days_ago=5, status=Ticket.Status.CLOSED, resolved_hours=6)
+        self._staff_reply(self.old, hours=2)
+        self._ticket("Informatics", days_ago=5)
+        self._ticket("Law", days_ago=3, priority=Ticket.Priority.URGENT)
+        self._ticket("Law", days_ago=0, resolved_hours=0)
+
+    def _ticket(self, department, days_ago, resolved_hours=1, **extra):
+        ticket = Ticket.objects.create(user=self.student, department=department, type_of_issue="Issue", **extra)
+        day = timezone.localdate(self.now) - timedelta(days=days_ago)
+        created = statistics_service.day_start(day) + timedelta(minutes=1)
+        Ticket.objects.filter(pk=ticket.pk).update(
+            created_at=created, updated_at=created + timedelta(hours=resolved_hours)
+        )
+        ticket.refresh_from_db()
+        return ticket
+
+    def _staff_reply(self, ticket, hours):
+        reply = Reply.objects.create(user=self.staff, ticket=ticket, body="On it")
+        Reply.objects.filter(pk=reply.pk).update(created_at=ticket.created_at + timedelta(hours=hours))
+
+    def test_first_run_rolls_up_every_day(self):
+        """The first run writes one row per (created day, department)"""
+        run = statistics_rollup.run_rollup()
+
+        self.assertEqual(run.days_rolled, 3)
+        row = DailyDepartmentStats.objects.get(day=timezone.localdate(self.old.created_at), department="Informatics")
+        self.assertEqual((row.total_tickets, row.closed, row.pending), (2, 1, 1))
+        self.assertEqual(row.resolution_seconds, 6 * 3600)
+        self.assertEqual((row.first_response_seconds, row.first_response_count), (2 * 3600, 1))
+
+    def test_incremental_run_only_recomputes_changed_days(self):
+        """Only days with tickets updated since the previous run are rolled up again"""
+        statistics_rollup.run_rollup()
+        law = DailyDepartmentStats.objects.get(department="Law", urgent=1)
+        law_rolled_at = law.rolled_up_at
+        self.old.status = Ticket.Status.PENDING
+        self.old.save()
+
+        run = statistics_rollup.run_rollup()
+
+        self.assertEqual(run.days_rolled, 1)
+        self.assertEqual(DailyDepartmentStats.objects.get(pk=law.pk).rolled_up_at, law_rolled_at)
+        row = DailyDepartmentStats.objects.get(department="Informatics")
+        self.assertEqual((row.closed, row.pending), (0, 2))
+
+    def test_staff_reply_marks_ticket_day_changed(self):
+        """A new staff reply re-rolls the day its ticket was created"""
+        statistics_rollup.run_rollup()
+        Reply.objects.create(user=self.staff, ticket=Ticket.objects.get(priority=Ticket.Priority.URGENT), body="Hi")
+
+        self.assertEqual(statistics_rollup.run_rollup().days_rolled, 1)
+
+    def test_range_sums_match_raw_aggregation(self):
+        """Rollup-backed range statistics equal a raw aggregation of the same tickets"""
+        start, end = self.now - timedelta(days=10), self.now
+        raw = statistics_service.range_department_sums(start, end)
+        statistics_rollup.run_rollup()
+
+        self.assertEqual(statistics_service.range_department_sums(start, end), raw)
+
+    def test_range_reads_rollup_rows_and_raw_today(self):
+        """Covered whole days come from rollup rows; today is aggregated from tickets"""
+        statistics_rollup.run_rollup()
+        DailyDepartmentStats.objects.filter(department="Law").update(total_tickets=40)
+
+        totals = statistics_service.range_department_sums(self.now - timedelta(days=10), self.now)
+
+        self.assertEqual(totals["Law"]["total_tickets"], 41)
+        self.assertEqual(totals["Informatics"]["total_tickets"], 2)
+
+    def test_statistics_endpoint_uses_rollup(self):
+        """The statistics API reports rollup-backed counts and timings"""
+        statistics_rollup.run_rollup()
+        client = APIClient()
+        client.force_authenticate(user=self.admin)
+
+        response = client.get("/api/admin/statistics/", {"days": 10})
+
+        self.assertEqual(response.data["total_tickets"], 4)
+        informatics = next(s for s in response.data["department_statistics"] if s["department"] == "Informatics")
+        self.assertEqual(informatics["avg_resolution_time_hours"], 6.0)
+        self.assertEqual(informatics["avg_response_time_hours"], 2.0)
+
+    def test_percentiles_merge_rollup_and_raw_sketches(self):
+        """Percentiles over a range merge rolled-up day sketches with today's raw tickets"""
+        self._staff_reply(self._ticket("Informatics", days_ago=0, resolved_hours=0), hours=8)
+        statistics_rollup.run_rollup()
+
+        totals = statistics_service.range_department_sums(self.now - timedelta(days=10), self.now)
+        stats, _ = statistics_service.department_stats_from_sums(totals)
+        informatics = next(stat for stat in stats if stat["department"] == "Informatics")
+
+        self.assertAlmostEqual(informatics["first_response_percentiles"]["p50"], 2.0, delta=0.1)
+        self.assertAlmostEqual(informatics["first_response_percentiles"]["p99"], 8.0, delta=0.4)
+        self.assertAlmostEqual(informatics["resolution_percentiles"]["p90"], 6.0, delta=0.3)
+
+    def test_statistics_endpoint_reports_percentiles(self):
+        """The statistics API exposes p50/p90/p99 resolution and response times"""
+        client = APIClient()
+        client.force_authenticate(user=self.admin)
+
+        response = client.get("/api/admin/statistics/", {"days": 10})
+
+        law = next(s for s in response.data["department_statistics"] if s["department"] == "Law")
+        self.assertEqual(law["response_time_percentiles_hours"], {"p50": None, "p90": None, "p99": None})
+        informatics = next(s for s in response.data["department_statistics"] if s["department"] == "Informatics")
+        self.assertEqual(set(informatics["resolution_time_percentiles_hours"]), {"p50", "p90", "p99"})
+
+    def test_migration_backfills_sketches_of_existing_rows(self):
+        """Migration 0014 rebuilds the sketches a full rollup would have written"""
+        self._staff_reply(self._ticket("Law", days_ago=3, status=Ticket.Status.CLOSED, resolved_hours=30), hours=5)
+        statistics_rollup.run_rollup()
+        expected = self._sketches()
+        DailyDepartmentStats.objects.update(resolution_sketch={}, first_response_sketch={})
+
+        import_module("KCLTicketingSystems.migrations.0014_daily_stats_latency_sketches").backfill_sketches(apps, None)
+
+        self.assertEqual(self._sketches(), expected)
+        self.assertTrue(any(row[2] for row in expected))
+
+    def _sketches(self):
+        rows = DailyDepartmentStats.objects.order_by("day", "department")
+        return list(rows.values_list("day", "department", "resolution_sketch", "first_response_sketch"))
+
+    def test_command_reports_days(self):
+        out = StringIO()
+        call_command("rollup_daily_stats", "--full", stdout=out)
+        self.assertIn("Rolled up 3 day(s)", out.getvalue())
+
+    def test_command_loop_runs_full_then_incremental(self):
+        """--loop starts with a full run and then only recomputes changed days"""
+        out = StringIO()
+        with patch("time.sleep", side_effect=[None, KeyboardInterrupt]), self.assertRaises(KeyboardInterrupt):
+            call_command("rollup_daily_stats", "--loop", "--interval", "0", stdout=out)
+        self.assertIn("Rolled up 3 day(s) of department statistics (full)", out.getvalue())
+        self.assertIn("department statistics (incremental)", out.getvalue())
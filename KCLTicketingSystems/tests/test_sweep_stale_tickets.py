@@ -0,0 +1,77 @@
+"""Tests for the stale awaiting_response ticket sweeper."""
+
+from datetime import timedelta
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from ..models import Reply, Ticket, User
+from ..services import stale_ticket_sweeper
+
+
+class SweepStaleTicketsTest(TestCase):
+    def setUp(self):
+        cache.delete(stale_ticket_sweeper.SWEEP_LOCK_KEY)
+        self.student = User.objects.create_user(
+            username="student", email="student@test.com", password="pass", role=User.Role.STUDENT
+        )
+        self.staff = User.objects.create_user(
+            username="staff", email="staff@test.com", password="pass", role=User.Role.STAFF
+        )
+        self.stale = self._awaiting_ticket_with_reply(self.staff, days_ago=4)
+        self.fresh = self._awaiting_ticket_with_reply(self.staff, days_ago=1)
+        self.student_last = self._awaiting_ticket_with_reply(self.student, days_ago=5)
+
+    def _awaiting_ticket_with_reply(self, author, days_ago):
+        ticket = Ticket.objects.create(
+            user=self.student,
+            department="Informatics",
+            type_of_issue="Issue",
+            additional_details="Details",
+            status=Ticket.Status.AWAITING_RESPONSE,
+        )
+        reply = Reply.objects.create(user=author, ticket=ticket, body="Reply")
+        replied_at = timezone.now() - timedelta(days=days_ago)
+        Reply.objects.filter(id=reply.id).update(created_at=replied_at)
+        Ticket.objects.filter(id=ticket.id).update(last_reply_at=replied_at)
+        return ticket
+
+    def _status(self, ticket):
+        ticket.refresh_from_db()
+        return ticket.status
+
+    def test_run_sweep_closes_only_stale_staff_replied_tickets(self):
+        result = stale_ticket_sweeper.run_sweep()
+        self.assertEqual(result["closed"], 1)
+        self.assertGreaterEqual(result["duration_ms"], 0)
+        self.assertEqual(self._status(self.stale), Ticket.Status.CLOSED)
+        self.assertEqual(self._status(self.fresh), Ticket.Status.AWAITING_RESPONSE)
+        self.assertEqual(self._status(self.student_last), Ticket.Status.AWAITING_RESPONSE)
+
+    def test_run_sweep_skips_when_lock_is_held(self):
+        cache.add(stale_ticket_sweeper.SWEEP_LOCK_KEY, "1")
+        self.assertIsNone(stale_ticket_sweeper.run_sweep())
+        self.assertEqual(self._status(self.stale), Ticket.Status.AWAITING_RESPONSE)
+
+    def test_run_sweep_releases_lock(self):
+        stale_ticket_sweeper.run_sweep()
+        self.assertIsNone(cache.get(stale_ticket_sweeper.SWEEP_LOCK_KEY))
+
+    def test_command_reports_closed_count(self):
+        out = StringIO()
+        call_command("sweep_stale_tickets", stdout=out)
+        self.assertIn("Closed 1 stale tickets", out.getvalue())
+        self.assertEqual(self._status(self.stale), Ticket.Status.CLOSED)
+
+    def test_command_respects_days_option(self):
+        call_command("sweep_stale_tickets", "--days", "0", stdout=StringIO())
+        self.assertEqual(self._status(self.fresh), Ticket.Status.CLOSED)
+
+    def test_command_reports_skip_when_locked(self):
+        cache.add(stale_ticket_sweeper.SWEEP_LOCK_KEY, "1")
+        out = StringIO()
+        call_command("sweep_stale_tickets", stdout=out)
+        self.assertIn("skipped", out.getvalue())
@@ -163,7 +163,7 @@ class TicketConversationApiTests(APITestCase):
         self.ticket.refresh_from_db()
         self.assertEqual(self.ticket.status, Ticket.Status.IN_PROGRESS)
 
-    def test_dashboard_fetch_auto_closes_stale_awaiting_response_ticket(self):
+    def test_dashboard_fetch_does_not_sweep_stale_tickets_inline(self):
         self.ticket.status = Ticket.Status.AWAITING_RESPONSE
         self.ticket.save(update_fields=["status"])
 
@@ -175,7 +175,7 @@ class TicketConversationApiTests(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.ticket.refresh_from_db()
-        self.assertEqual(self.ticket.status, Ticket.Status.CLOSED)
+        self.assertEqual(self.ticket.status, Ticket.Status.AWAITING_RESPONSE)
 
     def test_admin_can_access_ticket_conversation(self):
         self._auth(self.admin)
@@ -0,0 +1,125 @@
+"""Tests for Ticket Counters."""
+
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db.models import QuerySet
+from django.test import TestCase
+from django.utils import timezone
+
+from ..models import Reply, Ticket, TicketCounter, User
+from ..services import ticket_counters
+from ..utils import auto_close_stale_awaiting_response
+
+
+class TicketCounterMaintenanceTest(TestCase):
+    def setUp(self):
+        self.student = User.objects.create_user(
+            username="student", email="student@test.com", password="pass", role=User.Role.STUDENT
+        )
+        self.staff = User.objects.create_user(
+            username="staff", email="staff@test.com", password="pass", role=User.Role.STAFF
+        )
+        self.ticket = self._ticket("Informatics")
+
+    def _ticket(self, department, **extra):
+        return Ticket.objects.create(
+            user=self.student,
+            department=department,
+            type_of_issue="Issue",
+            additional_details="Details",
+            **extra,
+        )
+
+    def _count(self, department, status, priority=Ticket.Priority.MEDIUM):
+        counter = TicketCounter.objects.filter(department=department, status=status, priority=priority).first()
+        return counter.count if counter else 0
+
+    def test_create_increments_counter(self):
+        self._ticket("Informatics")
+        self.assertEqual(self._count("Informatics", Ticket.Status.PENDING), 2)
+
+    def test_status_change_moves_count(self):
+        self.ticket.status = Ticket.Status.IN_PROGRESS
+        self.ticket.save()
+        self.assertEqual(self._count("Informatics", Ticket.Status.PENDING), 0)
+        self.assertEqual(self._count("Informatics", Ticket.Status.IN_PROGRESS), 1)
+
+    def test_update_fields_save_moves_count(self):
+        self.ticket.status = Ticket.Status.CLOSED
+        self.ticket.save(update_fields=["status"])
+        self.assertEqual(self._count("Informatics", Ticket.Status.CLOSED), 1)
+
+    def test_department_change_moves_count(self):
+        self.ticket.department = "Engineering"
+        self.ticket.save()
+        self.assertEqual(self._count("Informatics", Ticket.Status.PENDING), 0)
+        self.assertEqual(self._count("Engineering", Ticket.Status.PENDING), 1)
+
+    def test_reassignment_without_key_change_is_noop(self):
+        self.ticket.assigned_to = self.staff
+        self.ticket.save()
+        self.assertEqual(self._count("Informatics", Ticket.Status.PENDING), 1)
+
+    def test_update_locks_the_stored_row_before_reading_its_key(self):
+        locked = []
+        original = QuerySet.select_for_update
+
+        def record(queryset, *args, **kwargs):
+            locked.append(queryset.model)
+            return original(queryset, *args, **kwargs)
+
+        with patch.object(QuerySet, "select_for_update", autospec=True, side_effect=record):
+            self.ticket.status = Ticket.Status.CLOSED
+            self.ticket.save()
+
+        self.assertEqual(locked, [Ticket])
+        self.assertEqual(self._count("Informatics", Ticket.Status.CLOSED), 1)
+
+    def test_delete_decrements_counter(self):
+        self.ticket.delete()
+        self.assertEqual(self._count("Informatics", Ticket.Status.PENDING), 0)
+
+    def test_cascade_delete_decrements_counter(self):
+        self.student.delete()
+        self.assertEqual(self._count("Informatics", Ticket.Status.PENDING), 0)
+
+    def test_auto_close_moves_counts(self):
+        self.ticket.status = Ticket.Status.AWAITING_RESPONSE
+        self.ticket.save()
+        Reply.objects.create(user=self.staff, ticket=self.ticket, body="Done?")
+        Ticket.objects.filter(pk=self.ticket.pk).update(last_reply_at=timezone.now() - timedelta(days=5))
+        auto_close_stale_awaiting_response()
+        self.assertEqual(self._count("Informatics", Ticket.Status.AWAITING_RESPONSE), 0)
+        self.assertEqual(self._count("Informatics", Ticket.Status.CLOSED), 1)
+
+    def test_status_totals_and_breakdown(self):
+        self._ticket("Engineering", priority=Ticket.Priority.HIGH)
+        totals = ticket_counters.status_totals()
+        self.assertEqual(totals["total"], 2)
+        self.assertEqual(totals[Ticket.Status.PENDING], 2)
+        breakdown = {row["department"]: row for row in ticket_counters.department_breakdown()}
+        self.assertEqual(breakdown["Engineering"]["high"], 1)
+        self.assertEqual(breakdown["Informatics"]["medium"], 1)
+
+
+class ReconcileTicketCountersTest(TestCase):
+    def setUp(self):
+        self.student = User.objects.create_user(
+            username="student", email="student@test.com", password="pass", role=User.Role.STUDENT
+        )
+        Ticket.objects.create(user=self.student, department="Informatics", type_of_issue="Issue")
+        # Bulk updates bypass counter maintenance and introduce drift.
+        Ticket.objects.update(status=Ticket.Status.RESOLVED)
+
+    def test_reconcile_reports_and_fixes_drift(self):
+        out = StringIO()
+        call_command("reconcile_ticket_counters", stdout=out)
+        self.assertIn("2 keys drifted", out.getvalue())
+        self.assertEqual(ticket_counters.status_totals(), {Ticket.Status.RESOLVED: 1, "total": 1})
+
+    def test_reconcile_without_drift(self):
+        call_command("reconcile_ticket_counters", stdout=StringIO())
+        self.assertEqual(ticket_counters.rebuild_ticket_counters(), {})
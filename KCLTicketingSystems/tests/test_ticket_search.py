@@ -0,0 +1,104 @@
+"""Tests for the admin ticket full-text search index."""
+
+from importlib import import_module
+from io import StringIO
+from types import SimpleNamespace
+
+from django.apps import apps
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from ..models import Ticket, User
+from ..services import ticket_search
+
+
+class TicketSearchIndexTest(TestCase):
+    URL = '/api/admin/tickets/'
+
+    def setUp(self):
+        self.client = APIClient()
+        self.admin = User.objects.create_user(
+            username='admin', email='admin@test.com', password='pass',
+            role=User.Role.ADMIN, is_superuser=True,
+        )
+        self.student = User.objects.create_user(
+            username='student', email='grace.hopper@kcl.ac.uk', password='pass',
+            first_name='Grace', last_name='Hopper', k_number='K7654321', role=User.Role.STUDENT,
+        )
+        self.vpn = Ticket.objects.create(
+            user=self.student, department='Informatics', type_of_issue='Network Issue',
+            additional_details='<p>Cannot connect to <strong>VPN</strong></p><p>from halls</p>',
+        )
+        self.printer = Ticket.objects.create(
+            user=self.student, department='Engineering', type_of_issue='Printer jam',
+            additional_details='The network printer mentions nothing else',
+        )
+        self.client.force_authenticate(user=self.admin)
+
+    def _ids(self, search):
+        response = self.client.get(self.URL, {'search': search})
+        self.assertEqual(response.status_code, 200)
+        return [row['id'] for row in response.data['tickets']]
+
+    def test_matches_word_prefixes_across_submitter_fields(self):
+        self.assertCountEqual(self._ids('hopp'), [self.vpn.id, self.printer.id])
+        self.assertCountEqual(self._ids('k765'), [self.vpn.id, self.printer.id])
+        self.assertCountEqual(self._ids('grace.hopper@kcl.ac.uk'), [self.vpn.id, self.printer.id])
+
+    def test_indexes_plain_text_of_additional_details(self):
+        self.assertEqual(self._ids('vpn halls'), [self.vpn.id])
+        self.assertEqual(self._ids('strong'), [])
+
+    def test_ranks_issue_type_above_details(self):
+        self.assertEqual(self._ids('network'), [self.vpn.id, self.printer.id])
+
+    def test_lone_number_matches_ticket_id(self):
+        self.assertIn(self.printer.id, self._ids(str(self.printer.id)))
+
+    def test_punctuation_only_search_returns_nothing(self):
+        self.assertEqual(self._ids('@#$%'), [])
+
+    def test_ticket_update_and_delete_keep_index_in_sync(self):
+        self.printer.type_of_issue = 'Scanner fault'
+        self.printer.save()
+        self.assertEqual(self._ids('scanner'), [self.printer.id])
+        self.printer.delete()
+        self.assertEqual(self._ids('scanner'), [])
+
+    def test_submitter_rename_reindexes_their_tickets(self):
+        self.student.last_name = 'Lovelace'
+        self.student.k_number = 'K1111111'
+        self.student.save()
+        self.assertCountEqual(self._ids('lovelace'), [self.vpn.id, self.printer.id])
+        self.assertEqual(self._ids('k765'), [])
+
+    def test_rebuild_command_restores_index(self):
+        Ticket.objects.filter(pk=self.vpn.pk).update(type_of_issue='Password reset')
+        self.assertEqual(self._ids('password'), [])
+        out = StringIO()
+        call_command('rebuild_ticket_search_index', '--batch-size', '1', stdout=out)
+        self.assertIn('Indexed 2 ticket(s)', out.getvalue())
+        self.assertEqual(self._ids('password'), [self.vpn.id])
+
+    def test_sqlite_uses_fts5_table(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('SQLite only')
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT count(*) FROM "{ticket_search.FTS_TABLE}"')
+            self.assertEqual(cursor.fetchone()[0], 2)
+
+    def test_migration_backfill_matches_live_documents(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('SQLite only')
+        migration = import_module('KCLTicketingSystems.migrations.0008_ticket_search_index')
+        with connection.cursor() as cursor:
+            # Emptied rather than dropped: FTS5 DDL does not survive the test's rollback,
+            # and the SQLite schema editor refuses to open inside the test transaction.
+            cursor.execute(f'DELETE FROM "{migration.FTS_TABLE}"')
+            migration.create_index(apps, SimpleNamespace(connection=connection, execute=cursor.execute))
+            cursor.execute(f'SELECT * FROM "{ticket_search.FTS_TABLE}" ORDER BY rowid')
+            backfilled = cursor.fetchall()
+        tickets = Ticket.objects.select_related('user').order_by('id')
+        self.assertEqual(backfilled, [ticket_search.build_document(ticket) for ticket in tickets])
@@ -0,0 +1,86 @@
+"""Tests for the admin ticket inflow series endpoint."""
+
+from datetime import datetime, timedelta
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from ..models import Ticket, User
+
+
+class TicketInflowSeriesTest(TestCase):
+    URL = '/api/admin/statistics/series/'
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.admin = User.objects.create_user(
+            username='admin', email='admin@test.com', password='pass', role=User.Role.ADMIN, is_superuser=True,
+        )
+        self.student = User.objects.create_user(
+            username='student', email='student@test.com', password='pass', role=User.Role.STUDENT,
+        )
+        self.client.force_authenticate(user=self.admin)
+        self.base = timezone.make_aware(datetime(2026, 3, 2, 9, 30))  # a Monday
+        self._ticket('Informatics', self.base)
+        self._ticket('Informatics', self.base + timedelta(hours=2))
+        self._ticket('Informatics', self.base + timedelta(days=1), status=Ticket.Status.CLOSED)
+        self._ticket('Law', self.base + timedelta(days=8))
+
+    def _ticket(self, department, created_at, **extra):
+        ticket = Ticket.objects.create(user=self.student, department=department, type_of_issue='Issue', **extra)
+        Ticket.objects.filter(pk=ticket.pk).update(created_at=created_at)
+
+    def _get(self, **params):
+        params.setdefault('start_date', self.base.isoformat())
+        params.setdefault('end_date', (self.base + timedelta(days=9)).isoformat())
+        return self.client.get(self.URL, params)
+
+    def _series(self, data):
+        return {(s['department'], s['status']): s['counts'] for s in data['series']}
+
+    def test_daily_buckets_split_by_department_and_status(self):
+        response = self._get(bucket='day')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['buckets']), 10)
+        self.assertEqual(response.data['buckets'][0], timezone.localtime(self.base).replace(hour=0, minute=0).isoformat())
+        series = self._series(response.data)
+        self.assertEqual(series[('Informatics', 'pending')][:2], [2, 0])
+        self.assertEqual(series[('Informatics', 'closed')][:2], [0, 1])
+        self.assertEqual(series[('Law', 'pending')][8], 1)
+
+    def test_hourly_and_weekly_buckets(self):
+        hourly = self._get(bucket='hour', end_date=(self.base + timedelta(hours=3)).isoformat())
+        self.assertEqual(self._series(hourly.data)[('Informatics', 'pending')], [1, 0, 1, 0])
+
+        weekly = self._series(self._get(bucket='week').data)
+        self.assertEqual(weekly[('Informatics', 'pending')], [2, 0])
+        self.assertEqual(weekly[('Law', 'pending')], [0, 1])
+
+    def test_filters_restrict_series(self):
+        response = self._get(bucket='day', department='Law')
+        self.assertEqual(list(self._series(response.data)), [('Law', 'pending')])
+
+    @override_settings(ADMIN_SERIES_MAX_BUCKETS=24)
+    def test_bucket_cap(self):
+        response = self._get(bucket='hour')
+        self.assertEqual(response.status_code, 400)
+
+    def test_invalid_bucket(self):
+        self.assertEqual(self._get(bucket='minute').status_code, 400)
+
+    def test_cached_until_tickets_change(self):
+        self._get(bucket='day')
+        with self.assertNumQueries(0):
+            self._get(bucket='day')
+
+        self._ticket('Law', self.base)
+        response = self._get(bucket='day')
+        self.assertEqual(self._series(response.data)[('Law', 'pending')][0], 1)
+
+    def test_non_admin_forbidden(self):
+        self.client.force_authenticate(user=self.student)
+        self.assertEqual(self._get().status_code, 403)
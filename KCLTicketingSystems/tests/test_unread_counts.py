@@ -0,0 +1,105 @@
+"""Tests for the unread notification counter and its endpoint."""
+
+from datetime import datetime, time, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from ..models import MeetingRequest, Notification, OfficeHours, Ticket, UnreadNotificationCount, User
+from ..services import unread_counts
+from ..services.notification_outbox import dispatch_pending
+from ..utils import notify_admin_on_ticket
+
+
+class UnreadCountTest(TestCase):
+    URL = "/api/notifications/unread-count/"
+
+    def setUp(self):
+        self.student = User.objects.create_user(
+            username="student", email="student@test.com", password="pass", role=User.Role.STUDENT,
+        )
+        self.staff = User.objects.create_user(
+            username="staff", email="staff@test.com", password="pass", role=User.Role.STAFF,
+        )
+        self.ticket = Ticket.objects.create(user=self.student, department="Informatics", type_of_issue="Issue")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.student)
+
+    def _notify(self, user=None, **extra):
+        return Notification.objects.create(user=user or self.student, title="T", message="M", **extra)
+
+    def _unread(self, user=None):
+        return self.client.get(self.URL).data["unread"] if user is None else unread_counts.unread_count(user.id)
+
+    def test_count_follows_insert_and_mark_read(self):
+        first = self._notify()
+        self._notify()
+        self._notify(user=self.staff)
+        self.assertEqual(self._unread(), 2)
+
+        self.client.post(f"/api/notifications/{first.id}/read/")
+        self.client.post(f"/api/notifications/{first.id}/read/")
+
+        self.assertEqual(self._unread(), 1)
+        self.assertEqual(self._unread(self.staff), 1)
+
+    def test_mark_read_of_someone_elses_notification_is_404(self):
+        theirs = self._notify(user=self.staff)
+        response = self.client.post(f"/api/notifications/{theirs.id}/read/")
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(self._unread(self.staff), 1)
+
+    def test_endpoint_is_one_query_regardless_of_volume(self):
+        Notification.objects.bulk_create(Notification(user=self.student, title="T", message="M") for _ in range(50))
+        unread_counts.rebuild_unread_counts()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.client.get(self.URL).data, {"unread": 50})
+
+    def test_user_without_notifications_has_zero(self):
+        self.assertEqual(self._unread(), 0)
+        self.assertFalse(UnreadNotificationCount.objects.exists())
+
+    def test_outbox_dispatch_counts_fan_out(self):
+        admins = [
+            User.objects.create_user(username=f"admin{i}", email=f"admin{i}@test.com", role=User.Role.ADMIN)
+            for i in range(3)
+        ]
+        notify_admin_on_ticket(self.ticket)
+        notify_admin_on_ticket(self.ticket)
+        dispatch_pending()
+
+        self.assertEqual([self._unread(admin) for admin in admins], [2, 2, 2])
+
+    def test_deleting_ticket_or_meeting_releases_its_unread_notifications(self):
+        day = timezone.localdate() + timedelta(days=7)
+        OfficeHours.objects.create(staff=self.staff, day_of_week=day.strftime("%A"), start_time=time(9), end_time=time(12))
+        meeting = MeetingRequest.objects.create(
+            student=self.student, staff=self.staff, description="Chat",
+            meeting_datetime=timezone.make_aware(datetime.combine(day, time(10))),
+        )
+        self._notify(ticket=self.ticket)
+        self._notify(ticket=self.ticket, is_read=True)
+        self._notify(meeting_request=meeting)
+        self._notify()
+
+        self.ticket.delete()
+        self.assertEqual(self._unread(), 2)
+        meeting.delete()
+        self.assertEqual(self._unread(), 1)
+
+    def test_reconcile_command_repairs_drift(self):
+        self._notify()
+        self._notify(user=self.staff)
+        UnreadNotificationCount.objects.filter(user=self.student).update(unread=7)
+        UnreadNotificationCount.objects.filter(user=self.staff).delete()
+
+        out = StringIO()
+        call_command("reconcile_unread_counts", stdout=out)
+
+        self.assertIn(f"Drift user {self.student.id}: stored 7, actual 1", out.getvalue())
+        self.assertIn("2 users drifted", out.getvalue())
+        self.assertEqual((self._unread(), self._unread(self.staff)), (1, 1))
@@ -3,7 +3,9 @@
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.utils import timezone
-from ..models import Ticket, Notification, MeetingRequest, OfficeHours
+from ..models import Ticket, Notification, NotificationOutboxEvent, MeetingRequest, OfficeHours
+from ..services.admin_recipients import admin_ids
+from ..services.notification_outbox import dispatch_batch, dispatch_pending
 from ..utils import (
     notify_admin_on_ticket,
     notify_staff_on_assignment,
@@ -66,18 +68,21 @@ class NotificationUtilsTests(TestCase):
 
     def test_notify_admin_on_ticket_creates_notifications(self):
         notify_admin_on_ticket(self.ticket)
+        dispatch_pending()
         notif = self._first_notification_for(self.admin)
         self.assertIsNotNone(notif)
         self.assertIn("submitted a new ticket", notif.message)
 
     def test_notify_staff_on_assignment_creates_notification(self):
         notify_staff_on_assignment(self.ticket, self.staff)
+        dispatch_pending()
         notif = self._first_notification_for(self.staff)
         self.assertIsNotNone(notif)
         self.assertIn("assigned ticket", notif.message)
 
     def test_notify_user_on_reply_creates_notification(self):
         notify_user_on_reply(self.ticket, self.staff)
+        dispatch_pending()
         notif = self._first_notification_for(self.student)
         self.assertIsNotNone(notif)
         self.assertIn("replied to your ticket", notif.message)
@@ -85,6 +90,7 @@ class NotificationUtilsTests(TestCase):
     def test_notify_on_ticket_update_closed(self):
         self.ticket.status = Ticket.Status.CLOSED
         notify_on_ticket_update(self.ticket, self.staff)
+        dispatch_pending()
         notif_student = self._first_notification_for(self.student)
         self.assertIn("has been closed", notif_student.message)
         notif_staff = self._first_notification_for(self.staff)
@@ -95,6 +101,7 @@ class NotificationUtilsTests(TestCase):
     def test_notify_on_ticket_update_closed_notifies_assigned_staff_when_admin_closes(self):
         self.ticket.status = Ticket.Status.CLOSED
         notify_on_ticket_update(self.ticket, self.admin)
+        dispatch_pending()
 
         notif_staff = self._first_notification_for(self.staff)
         self.assertIsNotNone(notif_staff)
@@ -102,6 +109,7 @@ class NotificationUtilsTests(TestCase):
 
     def test_notify_staff_on_meeting_request_creates_notification(self):
         notify_staff_on_meeting_request(self.meeting_request)
+        dispatch_pending()
         notif = self._first_notification_for(self.staff)
         self.assertIsNotNone(notif)
         self.assertIn("submitted a meeting request", notif.message)
@@ -109,6 +117,7 @@ class NotificationUtilsTests(TestCase):
     def test_notify_student_on_meeting_response_accepted(self):
         self.meeting_request.status = "accepted"
         notify_student_on_meeting_response(self.meeting_request, self.staff)
+        dispatch_pending()
         notif = self._first_notification_for(self.student)
         self.assertIsNotNone(notif)
         self.assertIn("has been accepted", notif.message)
@@ -116,12 +125,14 @@ class NotificationUtilsTests(TestCase):
     def test_notify_student_on_meeting_response_denied(self):
         self.meeting_request.status = "denied"
         notify_student_on_meeting_response(self.meeting_request, self.staff)
+        dispatch_pending()
         notif = self._first_notification_for(self.student)
         self.assertIsNotNone(notif)
         self.assertIn("has been denied", notif.message)
 
     def test_notify_staff_on_student_reply_creates_notification(self):
         notify_staff_on_student_reply(self.ticket, self.student)
+        dispatch_pending()
         notif = self._first_notification_for(self.staff)
         self.assertIsNotNone(notif)
         self.assertIn("replied to ticket", notif.message)
@@ -129,5 +140,49 @@ class NotificationUtilsTests(TestCase):
     def test_notify_staff_on_student_reply_no_staff_assigned(self):
         self.ticket.assigned_to = None
         notify_staff_on_student_reply(self.ticket, self.student)
+        dispatch_pending()
         notif_count = Notification.objects.count()
-        self.assertEqual(notif_count, 0)
\ No newline at end of file
+        self.assertEqual(notif_count, 0)
+
+    def test_admin_fan_out_is_one_outbox_row_and_one_insert(self):
+        for i in range(5):
+            self._create_user(f"admin{i + 2}", f"admin{i + 2}@example.com", "admin")
+        admin_ids()
+
+        with self.assertNumQueries(1):
+            notify_admin_on_ticket(self.ticket)
+        self.assertEqual(Notification.objects.count(), 0)
+        self.assertEqual(NotificationOutboxEvent.objects.count(), 1)
+
+        # Claim, live-user check, one INSERT, mark-done, unread counter upsert and
+        # UPDATE, plus savepoint statements.
+        with self.assertNumQueries(12):
+            result = dispatch_batch()
+        self.assertEqual((result.events, result.notifications), (1, 6))
+        self.assertEqual(Notification.objects.filter(title="New Ticket Submitted").count(), 6)
+
+    def test_ticket_close_notifications_share_one_outbox_insert(self):
+        self.ticket.status = Ticket.Status.CLOSED
+        with self.assertNumQueries(1):
+            notify_on_ticket_update(self.ticket, self.staff)
+
+        dispatch_pending()
+        self.assertEqual(
+            set(Notification.objects.values_list("user__username", flat=True)), {"student1", "admin1"},
+        )
+
+    def test_admin_ids_follow_role_changes(self):
+        self.assertEqual(admin_ids(), [self.admin.id])
+
+        self.staff.role = "admin"
+        self.staff.save()
+        self.assertCountEqual(admin_ids(), [self.admin.id, self.staff.id])
+
+        self.admin.delete()
+        self.assertEqual(admin_ids(), [self.staff.id])
+
+    def test_last_login_save_keeps_admin_ids_cached(self):
+        admin_ids()
+        self.admin.save(update_fields=["last_login"])
+        with self.assertNumQueries(0):
+            admin_ids()
\ No newline at end of file
@@ -2,22 +2,22 @@
 Cross-cutting helpers: ticket status transitions, in-app notifications.
 
 Used by views and signals when tickets, replies, or meeting requests change.
+Notifications are queued on the outbox in the caller's transaction and
+written by ``manage.py dispatch_notifications``.
 """
-from .models import MeetingRequest, Notification, Ticket
+from .models import MeetingRequest, Ticket
+from .models.user import _is_staff_or_admin
+from .services.notification_outbox import enqueue, event
+from .services.ticket_counters import apply_grouped_status_change
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count
 from django.utils import timezone
 from datetime import timedelta
 
 User = get_user_model()
 
 
-def _is_staff_or_admin(user):
-    """Return True if ``user`` is staff, admin, or superuser (for reply routing)."""
-    if not user:
-        return False
-    return getattr(user, "is_superuser", False) or (getattr(user, "role", "") or "").lower() in ("staff", "admin")
-
-
 def update_ticket_status_after_reply(ticket, reply_user):
     """Move ticket state based on who replied.
 
@@ -41,58 +41,44 @@ def auto_close_stale_awaiting_response(days=3):
 
     A ticket is auto-closed when it is currently awaiting_response and its
     latest reply is from staff/admin and older than the configured cutoff.
+    Uses the denormalised ``last_reply_*`` columns, so this is one indexed
+    UPDATE regardless of how many replies exist.
     """
     cutoff = timezone.now() - timedelta(days=days)
-    stale_ticket_ids = []
-
-    # Prefetch replies and users in bulk to avoid N+1
-    awaiting_tickets = Ticket.objects.filter(status=Ticket.Status.AWAITING_RESPONSE).prefetch_related("replies__user")
-    for ticket in awaiting_tickets:
-        replies = list(ticket.replies.all())
-        if not replies:
-            continue
-        # Find latest reply by created_at without extra queries
-        latest_reply = max(replies, key=lambda r: r.created_at)
-        if _is_staff_or_admin(latest_reply.user) and latest_reply.created_at <= cutoff:
-            stale_ticket_ids.append(ticket.id)
-
-    if not stale_ticket_ids:
-        return 0
-
-    return Ticket.objects.filter(
-        id__in=stale_ticket_ids,
+    stale = Ticket.objects.filter(
         status=Ticket.Status.AWAITING_RESPONSE,
-    ).update(status=Ticket.Status.CLOSED, closed_by=None, updated_at=timezone.now())
+        last_reply_by_staff=True,
+        last_reply_at__lte=cutoff,
+    )
+    with transaction.atomic():
+        groups = list(stale.values("department", "status", "priority").annotate(n=Count("id")).order_by())
+        closed = stale.update(status=Ticket.Status.CLOSED, closed_by=None, updated_at=timezone.now())
+        apply_grouped_status_change(groups, Ticket.Status.CLOSED)
+    return closed
 
 def notify_admin_on_ticket(ticket):
     """Notify all users with role='admin' that a new ticket was created."""
-    admins = User.objects.filter(role='admin')
-    for admin in admins:
-        Notification.objects.create(
-            user=admin,
-            title="New Ticket Submitted",
-            message=f"{ticket.user.get_full_name()} submitted a new ticket: {ticket.type_of_issue}",
-            ticket=ticket
-        )
+    message = f"{ticket.user.get_full_name()} submitted a new ticket: {ticket.type_of_issue}"
+    enqueue([event("New Ticket Submitted", message, include_admins=True, ticket=ticket)])
 
 def notify_staff_on_assignment(ticket, staff_user):
     """Notify staff when a ticket is assigned to them."""
-    Notification.objects.create(
-        user=staff_user,
-        title="Ticket Assigned",
-        message=f"You have been assigned ticket #{ticket.id}: {ticket.type_of_issue}",
-        ticket=ticket
-    )
+    enqueue([event(
+        "Ticket Assigned",
+        f"You have been assigned ticket #{ticket.id}: {ticket.type_of_issue}",
+        user_ids=[staff_user.id],
+        ticket=ticket,
+    )])
 
 def notify_user_on_reply(ticket, reply_user):
     """Notify ticket owner when staff replies."""
     if ticket.user != reply_user:
-        Notification.objects.create(
-            user=ticket.user,
-            title="New Reply on Your Ticket",
-            message=f"{reply_user.get_full_name()} replied to your ticket: {ticket.type_of_issue}",
-            ticket=ticket
-        )
+        enqueue([event(
+            "New Reply on Your Ticket",
+            f"{reply_user.get_full_name()} replied to your ticket: {ticket.type_of_issue}",
+            user_ids=[ticket.user_id],
+            ticket=ticket,
+        )])
 
 
 def notify_on_ticket_update(ticket, updated_by):
@@ -101,36 +87,24 @@ def notify_on_ticket_update(ticket, updated_by):
     Admins are only notified if ticket is closed.
     
     """
-
+    events = []
     if ticket.user and ticket.user != updated_by:
         student_message = _student_ticket_update_message(ticket, updated_by)
         if student_message:
-            _create_ticket_update_notification(
-                user=ticket.user,
-                ticket=ticket,
-                message=student_message,
-            )
+            events.append(_ticket_update_event(ticket, student_message, user_ids=[ticket.user_id]))
 
     staff_message = _staff_ticket_update_message(ticket, updated_by)
     if staff_message:
-        _create_ticket_update_notification(
-            user=ticket.assigned_to,
-            ticket=ticket,
-            message=staff_message,
-        )
+        events.append(_ticket_update_event(ticket, staff_message, user_ids=[ticket.assigned_to_id]))
 
     if ticket.status == Ticket.Status.CLOSED:
-        _notify_admins_ticket_closed(ticket, updated_by)
+        events.append(_admin_ticket_closed_event(ticket, updated_by))
+    enqueue(events)
 
 
-def _create_ticket_update_notification(user, ticket, message):
-    """Create a Notification record linking the given user, ticket, and message."""
-    Notification.objects.create(
-        user=user,
-        title="Ticket Update",
-        message=message,
-        ticket=ticket,
-    )
+def _ticket_update_event(ticket, message, **recipients):
+    """Build a "Ticket Update" outbox event for the given ticket, message, and recipients."""
+    return event("Ticket Update", message, ticket=ticket, **recipients)
 
 
 def _student_ticket_update_message(ticket, updated_by):
@@ -162,15 +136,12 @@ def _staff_ticket_update_message(ticket, updated_by):
     return f"You have been assigned to ticket '{ticket.type_of_issue}'."
 
 
-def _notify_admins_ticket_closed(ticket, updated_by):
-    """Send a closure notification to every admin except the one who performed the close."""
-    admins = User.objects.filter(role="admin").exclude(id=updated_by.id)
-    for admin in admins:
-        _create_ticket_update_notification(
-            user=admin,
-            ticket=ticket,
-            message=f"Ticket '{ticket.type_of_issue}' has been closed by admin.",
-        )
+def _admin_ticket_closed_event(ticket, updated_by):
+    """Closure event for every admin except the one who performed the close."""
+    return _ticket_update_event(
+        ticket, f"Ticket '{ticket.type_of_issue}' has been closed by admin.",
+        include_admins=True, except_user_id=updated_by.id,
+    )
 
 
 
@@ -189,13 +160,12 @@ def notify_staff_on_meeting_request(meeting_request):
     # a real model instance.
     meeting_request_fk = meeting_request if isinstance(meeting_request, MeetingRequest) else None
 
-    Notification.objects.create(
-        user=staff_user,
-        title="New Meeting Request",
-        message=f"{student.get_full_name()} submitted a meeting request.",
+    enqueue([event(
+        "New Meeting Request",
+        f"{student.get_full_name()} submitted a meeting request.",
+        user_ids=[staff_user.id],
         meeting_request=meeting_request_fk,
-        ticket=None,
-    )
+    )])
 
 
 def notify_student_on_meeting_response(meeting_request, staff_user):
@@ -214,12 +184,7 @@ def notify_student_on_meeting_response(meeting_request, staff_user):
     else:
         return  
 
-    Notification.objects.create(
-        user=student,
-        title="Meeting Request Update",
-        message=message,
-        ticket=None  
-    )
+    enqueue([event("Meeting Request Update", message, user_ids=[student.id])])
 
 
 def notify_staff_on_student_reply(ticket, student_user):
@@ -228,9 +193,9 @@ def notify_staff_on_student_reply(ticket, student_user):
     """
     staff_user = ticket.assigned_to
     if staff_user and staff_user != student_user:
-        Notification.objects.create(
-            user=staff_user,
-            title="New Student Reply",
-            message=f"{student_user.get_full_name()} replied to ticket #{ticket.id}: {ticket.type_of_issue}",
-            ticket=ticket
-        )
\ No newline at end of file
+        enqueue([event(
+            "New Student Reply",
+            f"{student_user.get_full_name()} replied to ticket #{ticket.id}: {ticket.type_of_issue}",
+            user_ids=[staff_user.id],
+            ticket=ticket,
+        )])
\ No newline at end of file
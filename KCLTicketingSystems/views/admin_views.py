@@ -4,14 +4,15 @@ import logging
 from datetime import timedelta, datetime
 import csv
 
-from django.db.models import Q
+from django.db.models import Count, Q
 from django.utils import timezone
-from django.http import HttpResponse
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 
+from ..models.export_job import ExportJob
 from ..models.ticket import Ticket
 from ..models.user import User
 from ..serializers import (
@@ -19,12 +20,17 @@ from ..serializers import (
     TicketListSerializer, 
     TicketUpdateSerializer,
     UserSerializer,
-    DashboardStatsSerializer
+    DashboardStatsSerializer,
+    ExportJobSerializer,
 )
 from ..permissions import IsAdmin
-from ..services import statistics_service
+from ..pagination import InvalidCursor, InvalidPageParam, keyset_page, parse_page_number, parse_page_size
+from ..services import (
+    export_jobs, list_counts, statistics_service, ticket_counters, ticket_export, ticket_search, ticket_series,
+)
+from ..services.dashboard_snapshot import get_dashboard_snapshot
 
-from ..utils import notify_on_ticket_update, auto_close_stale_awaiting_response
+from ..utils import notify_on_ticket_update
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +61,7 @@ def _get_user_stats():
 def _get_recent_tickets():
     """Get recent tickets from last 7 days."""
     week_ago = timezone.now() - timedelta(days=7)
-    return Ticket.objects.select_related('user', 'closed_by').filter(created_at__gte=week_ago).order_by('-created_at')[:10]
+    return Ticket.objects.select_related('user', 'assigned_to', 'closed_by').filter(created_at__gte=week_ago).order_by('-created_at')[:10]
 
 
 def _compute_dept_response_times(tickets):
@@ -63,21 +69,6 @@ def _compute_dept_response_times(tickets):
     return statistics_service.compute_dept_response_times(tickets)
 
 
-def _first_staff_reply_map(tickets):
-    """Compatibility wrapper for tests; delegates to the statistics service."""
-    return statistics_service._first_staff_reply_map(tickets)
-
-
-def _ticket_meta_map(tickets):
-    """Compatibility wrapper for tests; delegates to the statistics service."""
-    return statistics_service._ticket_meta_map(tickets)
-
-
-def _dept_response_time_hours(first_reply, ticket_meta):
-    """Compatibility wrapper for tests; delegates to the statistics service."""
-    return statistics_service._dept_response_time_hours(first_reply, ticket_meta)
-
-
 def _internal_error_response(exc):
     """Log internal exception details and return a generic API error payload."""
     logger.exception("Admin API internal error: %s", exc)
@@ -93,15 +84,17 @@ def _internal_error_http_response(exc):
 @api_view(['GET'])
 @permission_classes([IsAuthenticated, IsAdmin])
 def dashboard_stats(request):
-    """Get dashboard statistics"""
+    """Get dashboard statistics (served from a short-lived cached snapshot)."""
     try:
-        auto_close_stale_awaiting_response()
-        payload = _dashboard_stats_payload()
-        return Response(DashboardStatsSerializer(payload).data)
+        return Response(get_dashboard_snapshot(_serialized_dashboard_stats))
     except Exception as exc:
         return _internal_error_response(exc)
 
 
+def _serialized_dashboard_stats():
+    return DashboardStatsSerializer(_dashboard_stats_payload()).data
+
+
 def _dashboard_stats_payload():
     payload = {}
     payload.update(_dashboard_ticket_counts())
@@ -111,43 +104,43 @@ def _dashboard_stats_payload():
 
 
 def _dashboard_ticket_counts():
+    """Ticket counters read from the maintained TicketCounter table."""
+    totals = ticket_counters.status_totals()
     return {
-        "total_tickets": Ticket.objects.count(),
-        "pending_tickets": Ticket.objects.filter(status=Ticket.Status.PENDING).count(),
-        "in_progress_tickets": Ticket.objects.filter(status=Ticket.Status.IN_PROGRESS).count(),
-        "resolved_tickets": Ticket.objects.filter(status=Ticket.Status.RESOLVED).count(),
-        "closed_tickets": Ticket.objects.filter(status=Ticket.Status.CLOSED).count(),
+        "total_tickets": totals["total"],
+        "pending_tickets": totals.get(Ticket.Status.PENDING, 0),
+        "in_progress_tickets": totals.get(Ticket.Status.IN_PROGRESS, 0),
+        "resolved_tickets": totals.get(Ticket.Status.RESOLVED, 0),
+        "closed_tickets": totals.get(Ticket.Status.CLOSED, 0),
     }
 
 
 def _dashboard_user_counts():
-    return {
-        "total_users": User.objects.count(),
-        "total_students": User.objects.filter(role=User.Role.STUDENT, is_superuser=False).count(),
-        "total_staff": User.objects.filter(role=User.Role.STAFF, is_superuser=False).count(),
-        "total_admins": User.objects.filter(Q(role=User.Role.ADMIN) | Q(is_superuser=True)).count(),
-    }
+    """All user counters in one conditional-aggregation query."""
+    return User.objects.aggregate(
+        total_users=Count("id"),
+        total_students=Count("id", filter=Q(role=User.Role.STUDENT, is_superuser=False)),
+        total_staff=Count("id", filter=Q(role=User.Role.STAFF, is_superuser=False)),
+        total_admins=Count("id", filter=Q(role=User.Role.ADMIN) | Q(is_superuser=True)),
+    )
 
 
 def _recent_dashboard_tickets():
     week_ago = timezone.now() - timedelta(days=7)
-    return Ticket.objects.filter(created_at__gte=week_ago).order_by("-created_at")[:10]
+    return (
+        Ticket.objects.select_related("user", "assigned_to", "closed_by")
+        .filter(created_at__gte=week_ago)
+        .order_by("-created_at")[:10]
+    )
 
 
 # ================= TICKET MANAGEMENT =================
 
 def _apply_ticket_search(tickets, search):
-    """Apply search filter to tickets (user fields via user relation)."""
+    """Apply ranked full-text search (submitter, department, issue type, details, ticket id)."""
     if not search:
         return tickets
-    return tickets.filter(
-        Q(user__first_name__icontains=search) |
-        Q(user__last_name__icontains=search) |
-        Q(user__k_number__icontains=search) |
-        Q(user__email__icontains=search) |
-        Q(department__icontains=search) |
-        Q(type_of_issue__icontains=search)
-    )
+    return ticket_search.search_tickets(tickets, search)
 
 
 def _apply_status_priority_filters(tickets, request):
@@ -181,32 +174,71 @@ def _apply_ticket_filters(tickets, request):
     return _apply_department_assignment_filters(tickets, request)
 
 
-def _paginate_tickets(tickets, request):
-    """Apply pagination and return paginated response data."""
-    page = int(request.GET.get('page', 1))
-    page_size = int(request.GET.get('page_size', 20))
+def _wants_cursor_pagination(request):
+    """
+    Cursor mode is opt-in via ``?pagination=cursor`` or by passing a ``cursor`` token.
+
+    Cursor pages are always newest-first: combined with ``search`` they keep
+    the search filter but not its relevance ordering.
+    """
+    return request.GET.get('pagination') == 'cursor' or bool(request.GET.get('cursor'))
+
+
+def _cursor_paginate(queryset, request, field, key, serializer_class):
+    """Keyset-paginate ``queryset`` newest-first by ``(field, id)``; no total count is run."""
+    page_size = parse_page_size(request.GET.get('page_size'))
+    rows, next_token, prev_token = keyset_page(queryset, field, request.GET.get('cursor'), page_size)
+    return {
+        key: serializer_class(rows, many=True).data,
+        'page_size': page_size,
+        'next': next_token,
+        'prev': prev_token,
+    }
+
+
+def _invalid_cursor_response():
+    return Response({'error': 'Invalid cursor'}, status=status.HTTP_400_BAD_REQUEST)
+
+
+def _invalid_page_response(exc):
+    return Response({'error': str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+
+def _offset_paginate(queryset, request, key, serializer_class, scope):
+    """OFFSET paging; the total comes from the ``count`` strategy (exact, estimate, or none)."""
+    page = parse_page_number(request.GET.get('page'))
+    page_size = parse_page_size(request.GET.get('page_size'))
     start = (page - 1) * page_size
-    end = start + page_size
-    total_count = tickets.count()
-    tickets_page = tickets[start:end]
-    serializer = TicketListSerializer(tickets_page, many=True)
+    total_count, count_type = list_counts.resolve_total(queryset, request.GET, scope)
+    serializer = serializer_class(queryset[start:start + page_size], many=True)
     return {
-        'tickets': serializer.data,
+        key: serializer.data,
         'total': total_count,
+        'count_type': count_type,
         'page': page,
         'page_size': page_size,
-        'total_pages': (total_count + page_size - 1) // page_size
+        'total_pages': None if total_count is None else (total_count + page_size - 1) // page_size,
     }
 
 
+def _paginate_tickets(tickets, request):
+    """Apply pagination and return paginated response data."""
+    if _wants_cursor_pagination(request):
+        return _cursor_paginate(tickets, request, 'created_at', 'tickets', TicketListSerializer)
+    return _offset_paginate(tickets, request, 'tickets', TicketListSerializer, 'tickets')
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated, IsAdmin])
 def admin_tickets_list(request):
     """Get all tickets with filtering, searching, and pagination"""
     try:
-        auto_close_stale_awaiting_response()
         tickets = _admin_tickets_queryset(request)
         return Response(_paginate_tickets(tickets, request))
+    except InvalidCursor:
+        return _invalid_cursor_response()
+    except InvalidPageParam as exc:
+        return _invalid_page_response(exc)
     except Exception as exc:
         return _internal_error_response(exc)
 
@@ -214,7 +246,7 @@ def admin_tickets_list(request):
 def _admin_tickets_queryset(request):
     """Build and return the filtered ticket queryset for the admin tickets list view."""
     tickets = (
-        Ticket.objects.select_related("user", "closed_by")
+        Ticket.objects.select_related("user", "assigned_to", "closed_by")
         .all()
         .order_by("-created_at")
     )
@@ -301,20 +333,9 @@ def _apply_user_search(users, search):
 
 def _paginate_users(users, request):
     """Apply pagination and return paginated response data."""
-    page = int(request.GET.get('page', 1))
-    page_size = int(request.GET.get('page_size', 20))
-    start = (page - 1) * page_size
-    end = start + page_size
-    total_count = users.count()
-    users_page = users[start:end]
-    serializer = UserSerializer(users_page, many=True)
-    return {
-        'users': serializer.data,
-        'total': total_count,
-        'page': page,
-        'page_size': page_size,
-        'total_pages': (total_count + page_size - 1) // page_size
-    }
+    if _wants_cursor_pagination(request):
+        return _cursor_paginate(users, request, 'date_joined', 'users', UserSerializer)
+    return _offset_paginate(users, request, 'users', UserSerializer, 'users')
 
 
 @api_view(['GET'])
@@ -326,6 +347,10 @@ def admin_users_list(request):
         users = _apply_user_search(users, request.GET.get("search", ""))
         users = _apply_users_role_filter(users, request.GET.get("role"))
         return Response(_paginate_users(users, request))
+    except InvalidCursor:
+        return _invalid_cursor_response()
+    except InvalidPageParam as exc:
+        return _invalid_page_response(exc)
     except Exception as exc:
         return _internal_error_response(exc)
 
@@ -427,21 +452,22 @@ def admin_staff_list(request):
 @api_view(['GET'])
 @permission_classes([IsAuthenticated, IsAdmin])
 def get_ticket_statistics(request):
-    """Get detailed ticket statistics by department with date filtering."""
+    """Get detailed ticket statistics by department with date filtering (``days=all`` reads counters)."""
     try:
+        if request.GET.get("days") == "all":
+            return _all_time_statistics_response()
         parsed = _parse_get_ticket_statistics_date_range(request)
         if isinstance(parsed, Response):
             return parsed
 
         start_date, end_date = parsed
-        tickets = _tickets_for_date_range(start_date, end_date)
-        department_stats = _ticket_department_stats_queryset(tickets)
-        dept_response_times = _compute_dept_response_times(tickets)
+        totals = statistics_service.range_department_sums(start_date, end_date)
+        department_stats, dept_response_times = statistics_service.department_stats_from_sums(totals)
         formatted_stats = _format_department_statistics(department_stats, dept_response_times)
         return Response(
             {
                 "date_range": {"start_date": start_date.isoformat(), "end_date": end_date.isoformat()},
-                "total_tickets": tickets.count(),
+                "total_tickets": sum(stat["total_tickets"] for stat in department_stats),
                 "department_statistics": formatted_stats,
             }
         )
@@ -449,6 +475,38 @@ def get_ticket_statistics(request):
         return _internal_error_response(exc)
 
 
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, IsAdmin])
+def ticket_inflow_series(request):
+    """Ticket counts per hour/day/week bucket, split by department and status, for charts."""
+    try:
+        bucket = request.GET.get("bucket", "day")
+        if bucket not in ticket_series.BUCKETS:
+            return Response(
+                {"error": f"bucket must be one of {', '.join(ticket_series.BUCKETS)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        parsed = _parse_get_ticket_statistics_date_range(request)
+        if isinstance(parsed, Response):
+            return parsed
+        filters = {field: request.GET.get(field) for field in ticket_series.FILTER_FIELDS}
+        return Response(ticket_series.ticket_inflow_series(*parsed, bucket, filters))
+    except ticket_series.SeriesTooLarge as exc:
+        return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as exc:
+        return _internal_error_response(exc)
+
+
+def _all_time_statistics_response():
+    return Response(
+        {
+            "date_range": {"start_date": None, "end_date": timezone.now().isoformat()},
+            "total_tickets": ticket_counters.status_totals()["total"],
+            "department_statistics": statistics_service.all_time_department_statistics(),
+        }
+    )
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated, IsAdmin])
 def export_statistics_csv(request):
@@ -458,9 +516,7 @@ def export_statistics_csv(request):
         if isinstance(parsed, HttpResponse):
             return parsed
 
-        start_date, end_date = parsed
-        tickets = _tickets_for_date_range(start_date, end_date)
-        return _export_statistics_csv_response(tickets, start_date, end_date)
+        return _export_statistics_csv_response(*parsed)
     except Exception as exc:
         return _internal_error_http_response(exc)
 
@@ -475,17 +531,14 @@ def export_tickets_csv(request):
             return parsed
 
         start_date, end_date = parsed
-        tickets = _tickets_for_date_range(start_date, end_date, select_related=True)
-        return _export_tickets_csv_response(tickets, start_date, end_date)
+        tickets = _tickets_for_date_range(start_date, end_date).order_by("-created_at")
+        return _export_tickets_csv_response(tickets, start_date, end_date, compress=_wants_gzip_export(request))
     except Exception as exc:
         return _internal_error_http_response(exc)
 
 
-def _tickets_for_date_range(start_date, end_date, select_related=False):
-    qs = Ticket.objects.filter(created_at__gte=start_date, created_at__lte=end_date)
-    if select_related:
-        qs = qs.select_related("user", "assigned_to").order_by("-created_at")
-    return qs
+def _tickets_for_date_range(start_date, end_date):
+    return Ticket.objects.filter(created_at__gte=start_date, created_at__lte=end_date)
 
 
 def _parse_get_ticket_statistics_date_range(request):
@@ -559,64 +612,20 @@ def _parse_export_statistics_csv_date_range(request):
     return end_date - timedelta(days=days), end_date
 
 
-def _export_statistics_csv_response(tickets, start_date, end_date):
+def _export_statistics_csv_response(start_date, end_date):
     response = HttpResponse(content_type="text/csv")
     response[
         "Content-Disposition"
     ] = f'attachment; filename="ticket_statistics_{start_date.date()}_to_{end_date.date()}.csv"'
     writer = csv.writer(response)
-    writer.writerow(_statistics_csv_header())
+    writer.writerow(ticket_export.STATISTICS_CSV_HEADER)
 
-    department_stats = _ticket_department_stats_queryset(tickets)
-    dept_response_times = _compute_dept_response_times(tickets)
-    _write_export_statistics_rows(writer, department_stats, dept_response_times)
+    totals = statistics_service.range_department_sums(start_date, end_date)
+    department_stats, dept_response_times = statistics_service.department_stats_from_sums(totals)
+    writer.writerows(ticket_export.statistics_csv_rows(department_stats, dept_response_times))
     return response
 
 
-def _statistics_csv_header():
-    return [
-        "Department",
-        "Total Tickets",
-        "Pending",
-        "In Progress",
-        "Resolved",
-        "Closed",
-        "Low Priority",
-        "Medium Priority",
-        "High Priority",
-        "Urgent Priority",
-        "Avg Resolution Time (hours)",
-        "Avg Response Time (hours)",
-    ]
-
-
-def _write_export_statistics_rows(writer, department_stats, dept_response_times):
-    for stat in department_stats:
-        dept = stat["department"]
-        avg_resolution_hours = (
-            round(stat["avg_resolution_seconds"].total_seconds() / 3600, 2)
-            if stat["avg_resolution_seconds"]
-            else ""
-        )
-        avg_response_hours = dept_response_times.get(dept, "")
-        writer.writerow(
-            [
-                dept,
-                stat["total_tickets"],
-                stat["pending"],
-                stat["in_progress"],
-                stat["resolved"],
-                stat["closed"],
-                stat["low"],
-                stat["medium"],
-                stat["high"],
-                stat["urgent"],
-                avg_resolution_hours,
-                avg_response_hours,
-            ]
-        )
-
-
 def _parse_export_tickets_csv_date_range(request):
     start_date_str = request.GET.get("start_date")
     end_date_str = request.GET.get("end_date")
@@ -639,55 +648,132 @@ def _parse_export_tickets_csv_date_range(request):
     return end_date - timedelta(days=days), end_date
 
 
-def _export_tickets_csv_response(tickets, start_date, end_date):
-    response = HttpResponse(content_type="text/csv")
-    response[
-        "Content-Disposition"
-    ] = f'attachment; filename="all_tickets_{start_date.date()}_to_{end_date.date()}.csv"'
-    writer = csv.writer(response)
-    writer.writerow(
-        [
-            "Ticket ID",
-            "Department",
-            "Issue Type",
-            "Status",
-            "Priority",
-            "Created Date",
-            "Updated Date",
-            "User K-Number",
-            "User Name",
-            "User Email",
-            "Assigned To",
-            "Additional Details",
-            "Admin Notes",
-        ]
-    )
-    _write_export_tickets_rows(writer, tickets)
+def _wants_gzip_export(request):
+    return request.GET.get("compress") == "gzip"
+
+
+def _export_tickets_csv_response(tickets, start_date, end_date, compress=False):
+    """Stream the tickets CSV (optionally gzipped) in chunks instead of building it in memory."""
+    filename = f"all_tickets_{start_date.date()}_to_{end_date.date()}.csv"
+    chunks = ticket_export.iter_ticket_csv(tickets)
+    if compress:
+        response = StreamingHttpResponse(ticket_export.gzip_stream(chunks), content_type="application/gzip")
+        filename += ".gz"
+    else:
+        response = StreamingHttpResponse(chunks, content_type="text/csv")
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
     return response
 
 
-def _write_export_tickets_rows(writer, tickets):
-    for ticket in tickets:
-        assigned_name = (
-            f"{ticket.assigned_to.first_name} {ticket.assigned_to.last_name}"
-            if ticket.assigned_to
-            else ""
-        )
-        user_name = f"{ticket.user.first_name} {ticket.user.last_name}" if ticket.user else ""
-        writer.writerow(
-            [
-                ticket.id,
-                ticket.department,
-                ticket.type_of_issue,
-                ticket.status,
-                ticket.priority,
-                ticket.created_at.strftime("%Y-%m-%d %H:%M:%S"),
-                ticket.updated_at.strftime("%Y-%m-%d %H:%M:%S") if ticket.updated_at else "",
-                ticket.user.k_number if ticket.user else ticket.k_number,
-                user_name,
-                ticket.user.email if ticket.user else ticket.email,
-                assigned_name,
-                ticket.additional_details,
-                ticket.admin_notes or "",
-            ]
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, IsAdmin])
+def export_tickets_ndjson(request):
+    """
+    Incremental NDJSON feed of tickets (and optionally replies) changed since a watermark.
+
+    Pass the previous response's ``X-Next-Since``/``X-Next-Since-Id`` headers (also
+    repeated as the final ``watermark`` record) as ``since``/``since_id``; omit
+    them for a full export. Gzipped unless ``compress=none``.
+    """
+    try:
+        parsed = _parse_ndjson_watermark(request)
+        if isinstance(parsed, HttpResponse):
+            return parsed
+        tickets, replies, next_watermark = ticket_export.incremental_window(*parsed)
+        include_replies = request.GET.get("include_replies") in ("1", "true")
+        chunks = ticket_export.iter_incremental_ndjson(tickets, replies if include_replies else None, next_watermark)
+        return _ndjson_export_response(chunks, next_watermark, compress=request.GET.get("compress") != "none")
+    except Exception as exc:
+        return _internal_error_http_response(exc)
+
+
+def _parse_ndjson_watermark(request):
+    since_str = request.GET.get("since")
+    if not since_str:
+        return None, 0
+    try:
+        since = datetime.fromisoformat(since_str.replace("Z", "+00:00"))
+        since_id = int(request.GET.get("since_id", "0"))
+    except (ValueError, TypeError):
+        return HttpResponse("Invalid watermark. Expected ISO 8601 since and integer since_id.", status=400)
+    return (timezone.make_aware(since) if timezone.is_naive(since) else since), since_id
+
+
+def _ndjson_export_response(chunks, next_watermark, compress=True):
+    filename = "tickets_changes.ndjson"
+    if compress:
+        response = StreamingHttpResponse(ticket_export.gzip_stream(chunks), content_type="application/gzip")
+        filename += ".gz"
+    else:
+        response = StreamingHttpResponse(chunks, content_type="application/x-ndjson")
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    response["X-Next-Since"] = next_watermark[0].isoformat()
+    response["X-Next-Since-Id"] = str(next_watermark[1])
+    return response
+
+
+# ================= BACKGROUND EXPORT JOBS =================
+
+def _parse_export_job_date_range(data):
+    """Same range rules as the statistics API (ISO start/end or ``days``), read from the request body."""
+    start_date_str = data.get("start_date")
+    end_date_str = data.get("end_date")
+    if start_date_str and end_date_str:
+        return _parse_iso_date_range_for_api(start_date_str, end_date_str)
+    return _parse_days_date_range_for_api(data.get("days", "30"))
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated, IsAdmin])
+def export_job_submit(request):
+    """Queue a tickets/statistics CSV export, or return the stored job for an identical request."""
+    try:
+        export_type = request.data.get("export_type")
+        if export_type not in ExportJob.ExportType.values:
+            return Response(
+                {"error": f"export_type must be one of {', '.join(ExportJob.ExportType.values)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        parsed = _parse_export_job_date_range(request.data)
+        if isinstance(parsed, Response):
+            return parsed
+        job, created = export_jobs.submit_export_job(export_type, *parsed, requested_by=request.user)
+        return Response(
+            ExportJobSerializer(job).data,
+            status=status.HTTP_202_ACCEPTED if created else status.HTTP_200_OK,
         )
+    except Exception as exc:
+        return _internal_error_response(exc)
+
+
+def _export_job_not_found_response():
+    return Response({'error': 'Export job not found'}, status=status.HTTP_404_NOT_FOUND)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, IsAdmin])
+def export_job_detail(request, job_id):
+    """Poll an export job's status."""
+    try:
+        job = ExportJob.objects.get(pk=job_id)
+        return Response(ExportJobSerializer(job).data)
+    except ExportJob.DoesNotExist:
+        return _export_job_not_found_response()
+    except Exception as exc:
+        return _internal_error_response(exc)
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated, IsAdmin])
+def export_job_download(request, job_id):
+    """Stream a finished export's artifact from storage."""
+    try:
+        job = ExportJob.objects.get(pk=job_id)
+        if job.status != ExportJob.Status.DONE or not job.file:
+            return Response({"error": "Export is not ready."}, status=status.HTTP_409_CONFLICT)
+        filename = f"{job.export_type}_{job.start_date.date()}_to_{job.end_date.date()}.csv"
+        return FileResponse(job.file.open("rb"), as_attachment=True, filename=filename, content_type="text/csv")
+    except ExportJob.DoesNotExist:
+        return _export_job_not_found_response()
+    except Exception as exc:
+        return _internal_error_response(exc)
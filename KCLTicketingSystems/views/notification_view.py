@@ -1,43 +1,169 @@
-"""List and mark-read API for navbar notifications."""
+"""List, unread-count, mark-read and live stream API for navbar notifications."""
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
 from rest_framework.decorators import api_view
+from rest_framework.exceptions import AuthenticationFailed
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import permission_classes
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+from ..conditional import conditional_get
+from ..pagination import InvalidCursor
+from ..services import notification_feed
+from ..services import notification_stream as notification_stream_service
+from ..services.unread_counts import mark_read, unread_count
+from ..services.watermarks import notifications_watermark
+
+_PAGE_PARAMS = ("cursor", "limit", "unread_only", "since")
+
+
+def _wants_page(params):
+    """Paged mode is opt-in via ``cursor``, ``limit``, ``unread_only`` or ``since``."""
+    return any(params.get(key) for key in _PAGE_PARAMS)
+
+
+def _notifications_watermark(request):
+    # A page is a bounded keyset read; revalidating it would cost more than it saves.
+    if _wants_page(request.GET):
+        return None
+    return notifications_watermark(request.user)
 
-from ..models import Notification
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
+@conditional_get(_notifications_watermark)
 def notifications_list(request):
-    """Return the current user's notifications, newest first (JSON for React bell)."""
-    notifications = Notification.objects.filter(user=request.user).order_by("-created_at")
+    """
+    Return the current user's notifications, newest first (JSON for React bell).
+
+    Without paging parameters this is every notification as a list. With
+    ``cursor``/``limit``/``unread_only``/``since`` it is one page (see
+    ``_notifications_page``).
+    """
+    if _wants_page(request.GET):
+        return _notifications_page(request.user.id, request.GET)
+    return Response(list(notification_feed.notification_rows(request.user.id)))
 
-    data = [
-        {
-            "id": n.id,
-            "title": n.title,
-            "message": n.message,
-            "is_read": n.is_read, 
-            "ticket_id": n.ticket_id if n.ticket else None, 
-            "meeting_request_id": n.meeting_request_id if n.meeting_request else None,
-            "created_at": n.created_at
-        }
-        for n in notifications 
-    ]
 
-    return Response(data)
+def _page_limit(raw):
+    """Parse ``limit``, clamped to 1..``notification_feed.MAX_LIMIT``."""
+    try:
+        return max(1, min(int(raw), notification_feed.MAX_LIMIT))
+    except (TypeError, ValueError):
+        return notification_feed.DEFAULT_LIMIT
+
+
+def _notifications_page(user_id, params):
+    """
+    One keyset page of notifications.
+
+    ``unread_only=1`` keeps unread ones and ``since=<ISO timestamp>`` those
+    created after it. The response carries ``next`` (older) and ``prev``
+    (newer) cursor tokens; pass one back as ``cursor`` with the same filters.
+    """
+    limit = _page_limit(params.get("limit"))
+    try:
+        since = notification_feed.parse_since(params["since"]) if params.get("since") else None
+        rows, next_token, prev_token = notification_feed.notifications_page(
+            user_id, params.get("cursor"), limit,
+            unread_only=params.get("unread_only") in ("1", "true", "yes"), since=since,
+        )
+    except InvalidCursor as exc:
+        return Response({"error": str(exc)}, status=400)
+    return Response({"notifications": rows, "limit": limit, "next": next_token, "prev": prev_token})
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def unread_notification_count(request):
+    """Return only the current user's unread count, for the bell badge (one counter lookup)."""
+    return Response({"unread": unread_count(request.user.id)})
 
 
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def mark_notification_read(request, pk):
     """Set ``is_read`` on a notification owned by the request user."""
-    try:
-        notification = Notification.objects.get(id=pk, user=request.user)
-    except Notification.DoesNotExist:
+    if not mark_read(request.user.id, pk):
         return Response({"error": "Notification not found."}, status=404)
-   
-    notification.is_read = True
-    notification.save()
 
     return Response({"success": True})
+
+
+def _stream_user(request):
+    """Authenticate a plain Django request with the API's JWT scheme; None if it fails."""
+    try:
+        result = JWTAuthentication().authenticate(request)
+    except (AuthenticationFailed, InvalidToken):
+        return None
+    return result[0] if result else None
+
+
+def _last_event_id(request):
+    """The resume cursor from ``Last-Event-ID`` or ``?last_event_id=``; None if absent."""
+    raw = request.headers.get("Last-Event-ID") or request.GET.get("last_event_id")
+    if raw in (None, ""):
+        return None
+    value = int(raw)
+    if value < 0:
+        raise ValueError(raw)
+    return value
+
+
+def _long_poll_timeout(raw):
+    """Parse ``timeout``, clamped to 0..``NOTIFICATION_LONG_POLL_TIMEOUT`` seconds."""
+    limit = getattr(settings, "NOTIFICATION_LONG_POLL_TIMEOUT", 25)
+    try:
+        return max(0.0, min(float(raw), limit))
+    except (TypeError, ValueError):
+        return limit
+
+
+def _wants_event_stream(request):
+    return "text/event-stream" in request.headers.get("Accept", "")
+
+
+async def _sse_response(user_id, last_id):
+    """Server-Sent Events of the user's notifications after ``last_id`` (from now on if None)."""
+    if last_id is None:
+        last_id = await notification_stream_service.latest_id(user_id)
+    response = StreamingHttpResponse(
+        notification_stream_service.event_stream(user_id, last_id), content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # let nginx pass events through unbuffered
+    return response
+
+
+@require_GET
+async def notification_stream(request):
+    """
+    Stream the current user's new notifications (async; serve under ASGI).
+
+    ``Accept: text/event-stream`` gets Server-Sent Events, one ``notification``
+    event per row with the notification id as the event id. Anything else is a
+    long-poll: the response waits up to ``timeout`` seconds for notifications
+    after ``last_event_id`` and returns ``{notifications, last_event_id}``;
+    without a cursor it returns the current one at once. Both resume from
+    ``Last-Event-ID`` / ``?last_event_id=``. Authenticate with the usual
+    ``Authorization: Bearer`` header.
+    """
+    user = await sync_to_async(_stream_user)(request)
+    if user is None:
+        return JsonResponse({"detail": "Authentication credentials were not provided."}, status=401)
+    try:
+        last_id = _last_event_id(request)
+    except ValueError:
+        return JsonResponse({"error": "Invalid Last-Event-ID"}, status=400)
+    if _wants_event_stream(request):
+        return await _sse_response(user.id, last_id)
+    if last_id is None:
+        last_id = await notification_stream_service.latest_id(user.id)
+        return JsonResponse({"notifications": [], "last_event_id": last_id})
+    timeout = _long_poll_timeout(request.GET.get("timeout"))
+    rows = await notification_stream_service.wait_for_notifications(user.id, last_id, timeout)
+    return JsonResponse({"notifications": rows, "last_event_id": rows[-1]["id"] if rows else last_id})
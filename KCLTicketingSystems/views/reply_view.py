@@ -1,5 +1,4 @@
 """REST endpoints for listing and creating ticket replies (staff and student flows)."""
-from django.db.models import Prefetch
 from rest_framework import generics
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
@@ -7,22 +6,23 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
 from django.shortcuts import get_object_or_404
 
-from ..models import Ticket, Reply
+from ..conditional import conditional_get
+from ..models import Ticket
+from ..pagination import InvalidCursor, InvalidPageParam, parse_page_size
 from ..serializers import ReplyCreateSerializer, ReplySerializer
+from ..services.conversation_search import search_conversations
+from ..services import reply_feed
+from ..services.reply_tree import reply_tree
+from ..services.watermarks import replies_watermark
 
 from ..utils import (
+    _is_staff_or_admin,
     notify_user_on_reply,
     notify_staff_on_student_reply,
     update_ticket_status_after_reply,
-    auto_close_stale_awaiting_response,
 )
 
 
-def _reply_children_prefetch():
-    child_qs = Reply.objects.select_related("user").all()
-    return Prefetch("children", queryset=child_qs, to_attr="prefetched_children")
-
-
 def _staff_can_access_ticket(user, ticket):
     """Staff can access tickets assigned to them; admins can access any."""
     if getattr(user, "is_superuser", False) or (user.role or "").lower() == "admin":
@@ -30,11 +30,6 @@ def _staff_can_access_ticket(user, ticket):
     return ticket.assigned_to_id == user.id
 
 
-def _is_staff_or_admin(user):
-    """True if user is staff, admin, or superuser."""
-    return getattr(user, "is_superuser", False) or (user.role or "").lower() in ("staff", "admin")
-
-
 def _can_access_ticket_conversation(user, ticket):
     """Student may read own ticket; staff/admin may read if assigned (or admin)."""
     if _is_staff_or_admin(user):
@@ -42,10 +37,46 @@ def _can_access_ticket_conversation(user, ticket):
     return ticket.user_id == user.id
 
 
+def _accessible_conversation_tickets(user):
+    """Queryset form of ``_can_access_ticket_conversation``: tickets whose conversation ``user`` may read."""
+    if not _is_staff_or_admin(user):
+        return Ticket.objects.filter(user=user)
+    if getattr(user, "is_superuser", False) or (user.role or "").lower() == "admin":
+        return Ticket.objects.all()
+    return Ticket.objects.filter(assigned_to=user)
+
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+def conversation_search(request):
+    """
+    Full-text search over reply bodies and ticket details the caller can read.
+
+    Query params: ``q`` (required), ``page_size``, ``cursor`` (from ``next``).
+    """
+    search = request.GET.get("q", "").strip()
+    if not search:
+        return Response({"error": "q is required"}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        page_size = parse_page_size(request.GET.get("page_size"))
+        results, next_token = search_conversations(
+            search,
+            _accessible_conversation_tickets(request.user),
+            cursor=request.GET.get("cursor") or None,
+            page_size=page_size,
+        )
+    except InvalidCursor:
+        return Response({"error": "Invalid cursor"}, status=status.HTTP_400_BAD_REQUEST)
+    except InvalidPageParam as exc:
+        return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    return Response({"results": results, "page_size": page_size, "next": next_token})
+
+
 @api_view(["GET", "POST"])
 def reply_details(request, ticket_id):
     """
-    GET: List replies for a ticket (staff dashboard).
+    GET: List replies for a ticket (staff dashboard); ``after``/``limit``/``before``
+    return only new or older replies (see ``_incremental_replies``).
     POST: Create a reply for the ticket (staff only, must have access to ticket).
     """
 
@@ -54,13 +85,13 @@ def reply_details(request, ticket_id):
     if not _staff_can_reply(request.user):
         return Response(status=status.HTTP_403_FORBIDDEN)
 
-    auto_close_stale_awaiting_response()
-
     ticket = get_object_or_404(Ticket, pk=ticket_id)
     if not _staff_can_access_ticket(request.user, ticket):
         return Response({"error": "Access denied"}, status=status.HTTP_403_FORBIDDEN)
 
     if request.method == "GET":
+        if _wants_incremental_replies(request.GET):
+            return _incremental_replies(ticket_id, request.GET)
         return _reply_details_get(ticket_id=ticket_id)
     return _reply_details_post(request=request, ticket=ticket)
 
@@ -72,8 +103,6 @@ class ReplyCreateView(generics.CreateAPIView):
     permission_classes = [IsAuthenticated]
 
     def create(self, request):
-        auto_close_stale_awaiting_response()
-
         serializer = self.serializer_class(data=request.data)
         if serializer.is_valid():
             reply = serializer.save(user=self.request.user)
@@ -90,23 +119,33 @@ class ReplyCreateView(generics.CreateAPIView):
             return Response(serializer.errors, status=400)
 
 
+def _ticket_replies_watermark(request, ticket_id):
+    """Watermark for a conversation the caller may read; None otherwise (the view answers 403/404)."""
+    ticket = Ticket.objects.filter(pk=ticket_id).only("user_id", "assigned_to_id").first()
+    if ticket is None or not _can_access_ticket_conversation(request.user, ticket):
+        return None
+    return replies_watermark(ticket_id)
+
+
 @api_view(["GET", "POST"])
 @permission_classes([IsAuthenticated])
+@conditional_get(_ticket_replies_watermark)
 def ticket_replies(request, ticket_id):
     """
     Ticket conversation endpoint.
 
-    GET: list replies in chronological order.
+    GET: list replies in chronological order; ``after``/``limit``/``before``
+    return only new or older replies (see ``_incremental_replies``).
     POST: create reply if caller can access the ticket and ticket is not closed.
     """
-    auto_close_stale_awaiting_response()
-
     ticket = get_object_or_404(Ticket, pk=ticket_id)
 
     if not _can_access_ticket_conversation(request.user, ticket):
         return Response({"error": "Access denied"}, status=status.HTTP_403_FORBIDDEN)
 
     if request.method == "GET":
+        if _wants_incremental_replies(request.GET):
+            return _incremental_replies(ticket.id, request.GET)
         return _ticket_replies_get(ticket=ticket)
     return _ticket_replies_post(request=request, ticket=ticket)
 
@@ -116,14 +155,46 @@ def _staff_can_reply(user):
     return user.role in ("staff", "Staff", "admin") or getattr(user, "is_superuser", False)
 
 
+def _wants_incremental_replies(params):
+    return any(params.get(key) for key in ("after", "limit", "before"))
+
+
+def _boundary_cursor(boundary):
+    """The parsed ``after`` value to echo as ``latest``: the reply id, or the timestamp when none was given."""
+    if boundary is None:
+        return None
+    created_at, pk = boundary
+    return pk if pk is not None else created_at
+
+
+def _incremental_replies(ticket_id, params):
+    """
+    Flat replies for polling and back-paging instead of the whole thread tree.
+
+    ``after=<reply id|ISO timestamp>`` returns replies newer than it; otherwise
+    the newest ``limit`` replies, or those before the ``before`` cursor. The
+    response carries ``latest`` (pass as the next ``after``) and ``before``
+    (the cursor for older replies, null at the start of the conversation).
+    """
+    boundary = None
+    try:
+        limit = parse_page_size(params.get("limit"), reply_feed.MAX_LIMIT, reply_feed.MAX_LIMIT, name="limit")
+        if params.get("after"):
+            boundary = reply_feed.parse_after(params["after"], ticket_id)
+            replies, before = reply_feed.replies_after(ticket_id, boundary, limit), None
+        else:
+            replies, before = reply_feed.latest_replies(ticket_id, limit, params.get("before"))
+    except InvalidCursor:
+        return Response({"error": "Invalid cursor"}, status=status.HTTP_400_BAD_REQUEST)
+    except InvalidPageParam as exc:
+        return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    latest = replies[-1].id if replies else _boundary_cursor(boundary)
+    return Response({"replies": ReplySerializer(replies, many=True).data, "latest": latest, "before": before})
+
+
 def _reply_details_get(ticket_id):
     """Return a Response containing top-level replies (with children) for the given ticket."""
-    replies = (
-        Reply.objects.filter(ticket=ticket_id, parent=None)
-        .select_related("user")
-        .prefetch_related(_reply_children_prefetch())
-    )
-    serializer = ReplySerializer(replies, many=True)
+    serializer = ReplySerializer(reply_tree(ticket_id), many=True)
     return Response(serializer.data)
 
 
@@ -147,13 +218,7 @@ def _reply_details_post(request, ticket):
 
 def _ticket_replies_get(ticket):
     """Return a Response with top-level replies for the ticket in chronological order."""
-    replies = (
-        Reply.objects.filter(ticket=ticket, parent=None)
-        .select_related("user")
-        .prefetch_related(_reply_children_prefetch())
-        .order_by("created_at")
-    )
-    serializer = ReplySerializer(replies, many=True)
+    serializer = ReplySerializer(reply_tree(ticket.id), many=True)
     return Response(serializer.data)
 
 
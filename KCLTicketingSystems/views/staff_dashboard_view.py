@@ -10,7 +10,6 @@ from django.db.models import Q
 
 from ..models import Ticket
 from ..serializers import UserSerializer
-from ..utils import auto_close_stale_awaiting_response
 
 
 def _check_staff_access(user):
@@ -67,8 +66,6 @@ def _apply_ticket_filter(tickets, filter_options):
 @permission_classes([IsAuthenticated])
 def staff_dashboard(request):
     """List tickets assigned to the current staff user. Supports filtering by status."""
-    auto_close_stale_awaiting_response()
-
     access_error = _check_staff_access(request.user)
     if access_error:
         return access_error
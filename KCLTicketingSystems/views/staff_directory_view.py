@@ -4,18 +4,26 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from ..conditional import conditional_get
 from ..models.user import User
 from ..serializers import StaffListSerializer
+from ..services.watermarks import users_watermark
 
-@api_view(["GET"])
-@permission_classes([IsAuthenticated])
-def staff_directory(request):
-    """Return staff profiles for the public directory; filter by ?department=."""
+
+def _directory_staff(request):
+    """Staff users, narrowed by ``?department=`` when given."""
     qs = User.objects.filter(role=User.Role.STAFF)
 
     department = request.query_params.get("department")
     if department:
         qs = qs.filter(department__iexact=department)
+    return qs
 
-    qs = qs.order_by("last_name", "first_name")
-    return Response(StaffListSerializer(qs, many=True).data)
\ No newline at end of file
+
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@conditional_get(lambda request: users_watermark(_directory_staff(request)))
+def staff_directory(request):
+    """Return staff profiles for the public directory; filter by ?department=."""
+    qs = _directory_staff(request).order_by("last_name", "first_name")
+    return Response(StaffListSerializer(qs, many=True).data)
@@ -31,7 +31,7 @@ def meeting_request_list(request):
             status=status.HTTP_403_FORBIDDEN
         )
     
-    meeting_requests = MeetingRequest.objects.filter(staff=request.user)
+    meeting_requests = MeetingRequest.objects.filter(staff=request.user).select_related('student', 'staff')
     serializer = MeetingRequestSerializer(meeting_requests, many=True)
     return Response(serializer.data)
 
@@ -208,7 +208,7 @@ def meeting_request_create(request):
     POST: Create a new meeting request (for students).
     """
     if request.method == 'GET':
-        meeting_requests = MeetingRequest.objects.filter(student=request.user)
+        meeting_requests = MeetingRequest.objects.filter(student=request.user).select_related('student', 'staff')
         serializer = MeetingRequestSerializer(meeting_requests, many=True)
         return Response(serializer.data)
 
@@ -5,12 +5,24 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 
+from ..conditional import conditional_get
 from ..models.user import User
 from ..serializers import StaffWithOfficeHoursSerializer
+from ..services.watermarks import office_hours_watermark, users_watermark
+
+
+def _staff_meeting_watermark(request, staff_id):
+    staff_parts, _ = users_watermark(User.objects.filter(id=staff_id, role=User.Role.STAFF))
+    if not staff_parts[0]:
+        return None
+    hours_parts, _ = office_hours_watermark(staff_id)
+    return [*staff_parts, *hours_parts], None
+
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
+@conditional_get(_staff_meeting_watermark)
 def staff_meeting(request, staff_id: int):
     """Return one staff member with office hours for the meeting-booking UI."""
     staff = get_object_or_404(User, id=staff_id, role=User.Role.STAFF)
-    return Response(StaffWithOfficeHoursSerializer(staff).data)
\ No newline at end of file
+    return Response(StaffWithOfficeHoursSerializer(staff).data)
@@ -7,13 +7,16 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework import serializers
 from rest_framework import status
 from django.shortcuts import get_object_or_404
+from django.utils.decorators import method_decorator
 from django.utils import timezone
 from django.db.models import Count, Q
-from django.db.models import Prefetch
 from datetime import timedelta
 
-from ..models import Ticket, User, Reply, Attachment
+from ..conditional import conditional_get
+from ..models import Ticket, User, Attachment
 from ..serializers import ReplySerializer, TicketUpdateSerializer, StaffReassignTicket
+from ..services.reply_tree import reply_tree
+from ..services.watermarks import ticket_watermark
 
 class UserSerializer(serializers.ModelSerializer):
     """Minimal user fields embedded in ticket detail responses."""
@@ -69,19 +72,20 @@ class TicketSerializer(serializers.ModelSerializer):
         return obj.status in (Ticket.Status.PENDING, Ticket.Status.IN_PROGRESS) and obj.created_at < cutoff
 
     def get_replies(self, obj):
-        replies = (
-            obj.replies.filter(parent=None)
-            .select_related("user")
-            .prefetch_related(
-                Prefetch(
-                    "children",
-                    queryset=Reply.objects.select_related("user"),
-                    to_attr="prefetched_children",
-                )
-            )
-        )
-        return ReplySerializer(replies, many=True).data
+        return ReplySerializer(reply_tree(obj.id), many=True).data
     
+def _is_staff_reader(user):
+    """True for the staff/admin callers ``ticket_info`` serves."""
+    if not user.is_authenticated:
+        return False
+    return user.role in ("staff", "Staff", "admin") or getattr(user, "is_superuser", False)
+
+
+def _ticket_info_watermark(request, ticket_id):
+    return ticket_watermark(ticket_id) if _is_staff_reader(request.user) else None
+
+
+@method_decorator(conditional_get(lambda request, pk: ticket_watermark(pk)), name="get")
 class TicketDetailView(RetrieveAPIView):
     """Retrieve a single ticket by primary key (DRF generic view)."""
 
@@ -89,6 +93,7 @@ class TicketDetailView(RetrieveAPIView):
     serializer_class = TicketSerializer
 
 @api_view(['GET'])
+@conditional_get(_ticket_info_watermark)
 def ticket_info(request, ticket_id):
     """Staff/admin-only ticket detail for the legacy ticket info endpoint."""
     if not request.user.is_authenticated:
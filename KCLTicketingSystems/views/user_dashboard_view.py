@@ -4,39 +4,30 @@ from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth import get_user_model
 from django.http import JsonResponse
-from django.db.models import Prefetch
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework import status
 
-from ..models import Ticket, Reply
+from ..models import Ticket
 from ..serializers import ReplySerializer
-from ..utils import notify_on_ticket_update, auto_close_stale_awaiting_response
+from ..services.reply_tree import load_replies
+from ..utils import notify_on_ticket_update
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def user_dashboard(request):
     """Return the current user's profile snippet and their tickets with replies."""
-    auto_close_stale_awaiting_response()
-
     user = request.user
-    tickets = _get_user_tickets(user)
+    tickets = list(_get_user_tickets(user))
     tickets_data = _build_tickets_data(tickets)
     return JsonResponse({"user": _build_user_data(user), "tickets": tickets_data})
 
 
 def _get_user_tickets(user):
-    """Return all tickets for the given user, with replies pre-fetched, newest first."""
-    return (
-        Ticket.objects.filter(user=user)
-        .select_related("user", "closed_by")
-        .prefetch_related(
-            Prefetch("replies", queryset=Reply.objects.select_related("user").order_by("created_at"))
-        )
-        .order_by("-created_at")
-    )
+    """Return all tickets for the given user, newest first."""
+    return Ticket.objects.filter(user=user).select_related("user", "closed_by").order_by("-created_at")
 
 
 def _build_user_data(user):
@@ -52,9 +43,9 @@ def _closed_by_role_for_ticket(ticket):
     return (role or "student").lower()
 
 
-def _ticket_to_dashboard_dict(ticket):
-    """Serialize a single ticket (with replies) into a dict for the dashboard response."""
-    replies_data = ReplySerializer(ticket.replies.all(), many=True).data
+def _ticket_to_dashboard_dict(ticket, replies=()):
+    """Serialize a single ticket (with its replies, oldest first) into a dict for the dashboard response."""
+    replies_data = ReplySerializer(replies, many=True).data
     return {
         "id": ticket.id,
         "type_of_issue": ticket.type_of_issue,
@@ -69,8 +60,9 @@ def _ticket_to_dashboard_dict(ticket):
 
 
 def _build_tickets_data(tickets):
-    """Return a list of dashboard dicts for each ticket in the queryset."""
-    return [_ticket_to_dashboard_dict(t) for t in tickets]
+    """Return a list of dashboard dicts for each ticket, loading every reply thread in one query."""
+    replies = load_replies(ticket.id for ticket in tickets)
+    return [_ticket_to_dashboard_dict(t, replies.get(t.id, [])) for t in tickets]
 
 
 @api_view(['POST'])